@@ -19,6 +19,7 @@ API_VERSION = 0
 RPC_CONTRACT_NOT_FOUND_ERROR = 20
 RPC_INVALID_MESSAGE_SELECTOR_ERROR = 21
 RPC_CLASS_HASH_NOT_FOUND_ERROR = 28
+RPC_PAGE_SIZE_TOO_BIG_ERROR = 31
 RPC_CONTRACT_ERROR = 40
 
 DEFAULT_ENTRY_POINT_NAME = "__default__"
@@ -38,6 +38,7 @@ from starknet_py.net.client_models import (
 from starknet_py.net.models import AddressRepresentation, parse_address
 from starknet_py.net.models.transaction import DeclareV3, InvokeV3
 from starknet_py.net.udc_deployer.deployer import Deployer
+from starknet_py.proxy.abi_cache import AbiCache
 from starknet_py.proxy.contract_abi_resolver import (
     ContractAbiResolver,
     ProxyConfig,
@@ -670,6 +671,7 @@ class Contract:
         address: AddressRepresentation,
         provider: Union[BaseAccount, Client] = None,  # pyright: ignore
         proxy_config: Union[bool, ProxyConfig] = False,
+        abi_cache: Optional[AbiCache] = None,
     ) -> Contract:
         """
         Fetches ABI for given contract and creates a new Contract instance with it. If you know ABI statically you
@@ -688,6 +690,8 @@ class Contract:
             If set to ``False``, :meth:`Contract.from_address` will not resolve proxies.
 
             If a valid :class:`starknet_py.contract_abi_resolver.ProxyConfig` is provided, will use its values instead.
+        :param abi_cache: Cache of ABIs of contract classes, which can be persisted on disk.
+            If provided, classes are fetched only when their ABIs are not cached.
 
         :return: an initialized Contract instance.
         """
@@ -697,7 +701,10 @@ class Contract:
         proxy_config = Contract._create_proxy_config(proxy_config)
 
         abi, cairo_version = await ContractAbiResolver(
-            address=address, client=client, proxy_config=proxy_config
+            address=address,
+            client=client,
+            proxy_config=proxy_config,
+            abi_cache=abi_cache,
         ).resolve()
 
         return Contract(
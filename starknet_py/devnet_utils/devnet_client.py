@@ -28,6 +28,8 @@ from starknet_py.net.full_node_client import (
     _to_rpc_felt,
 )
 from starknet_py.net.http_client import RpcHttpClient
+from starknet_py.net.managed_session import ConnectionPoolConfig
+from starknet_py.net.retry_policy import RetryPolicy
 from starknet_py.utils.sync import add_sync_methods
 
 
@@ -37,6 +39,8 @@ class DevnetClient(FullNodeClient):
         self,
         node_url: str = "http://127.0.0.1:5050",
         session: Optional[ClientSession] = None,
+        connection_pool: Optional[ConnectionPoolConfig] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ):
         """
         Client for interacting with Starknet devnet json-rpc interface.
@@ -44,13 +48,28 @@ class DevnetClient(FullNodeClient):
         Based on https://0xspaceshard.github.io/starknet-devnet-rs/docs/intro
 
         :param node_url: Url of the node providing rpc interface
-        :param session: Aiohttp session to be used for request. If not provided, client will create a session for
-                        every request. When using a custom session, user is responsible for closing it manually.
-        """
-
-        super().__init__(node_url=node_url, session=session)
+        :param session: Aiohttp session to be used for request. If not provided, client will create a session
+                        with pooled connections on first request and reuse it. It is closed by :meth:`close`
+                        or when leaving the ``async with`` block. When using a custom session, user is responsible
+                        for closing it manually.
+        :param connection_pool: Configuration of the connection pool of the session created by the client.
+                        Mutually exclusive with ``session`` parameter.
+        :param retry_policy: Policy of retrying requests which failed with a transient error, also setting
+                        the request timeout. If not provided, failed requests are not retried.
+        """
+
+        super().__init__(
+            node_url=node_url,
+            session=session,
+            connection_pool=connection_pool,
+            retry_policy=retry_policy,
+        )
         self._devnet_client = RpcHttpClient(
-            url=node_url, session=session, method_prefix="devnet"
+            url=node_url,
+            session=session,
+            method_prefix="devnet",
+            managed_session=self._managed_session,
+            retry_policy=retry_policy,
         )
 
     async def impersonate_account(self, address: Hash):
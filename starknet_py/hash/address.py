@@ -1,4 +1,8 @@
-from typing import Sequence
+import os
+from collections import deque
+from concurrent.futures import Executor, Future
+from functools import lru_cache
+from typing import Callable, Deque, Iterator, List, Optional, Sequence, Tuple
 
 from starknet_py.constants import CONTRACT_ADDRESS_PREFIX, L2_ADDRESS_UPPER_BOUND
 from starknet_py.hash.utils import (
@@ -7,8 +11,15 @@ from starknet_py.hash.utils import (
     compute_hash_on_elements,
     encode_uint,
     get_bytes_length,
+    pedersen_hash,
+    pedersen_hash_many,
 )
 
+DEFAULT_SALT_SEARCH_CHUNK_SIZE = 1000
+
+# Number of elements of the address hash chain: prefix, deployer, salt, class hash and calldata hash
+_ADDRESS_CHAIN_LENGTH = 5
+
 
 def compute_address(
     *,
@@ -28,16 +39,175 @@ def compute_address(
     """
 
     constructor_calldata_hash = compute_hash_on_elements(data=constructor_calldata)
-    raw_address = compute_hash_on_elements(
-        data=[
-            CONTRACT_ADDRESS_PREFIX,
-            deployer_address,
-            salt,
-            class_hash,
-            constructor_calldata_hash,
-        ],
+    return _compute_address_from_prefix(
+        _get_address_prefix_hash(deployer_address),
+        salt,
+        class_hash,
+        constructor_calldata_hash,
+    )
+
+
+def compute_addresses(
+    *,
+    class_hash: int,
+    constructor_calldata: Sequence[int],
+    salts: Sequence[int],
+    deployer_address: int = 0,
+    max_workers: Optional[int] = None,
+) -> List[int]:
+    """
+    Computes addresses of the contract deployed with each of the salts.
+
+    The constructor calldata and the part of the address hash common to all salts are hashed once.
+    Remaining hashes are computed in bulk by :func:`~starknet_py.hash.utils.pedersen_hash_many`.
+
+    :param class_hash: class hash of the contract
+    :param constructor_calldata: calldata for the contract constructor
+    :param salts: salts used to calculate contract addresses
+    :param deployer_address: address of the deployer (if not provided default 0 is used)
+    :param max_workers: maximal number of threads computing the hashes, defaults to the number of CPUs
+    :return: Contract's addresses, one for every salt
+    """
+    constructor_calldata_hash = compute_hash_on_elements(data=constructor_calldata)
+    prefix_hash = _get_address_prefix_hash(deployer_address)
+
+    hashes = pedersen_hash_many(
+        [(prefix_hash, salt) for salt in salts], max_workers=max_workers
+    )
+    for element in (class_hash, constructor_calldata_hash, _ADDRESS_CHAIN_LENGTH):
+        hashes = pedersen_hash_many(
+            [(hash_, element) for hash_ in hashes], max_workers=max_workers
+        )
+
+    return [raw_address % L2_ADDRESS_UPPER_BOUND for raw_address in hashes]
+
+
+def find_salt(
+    *,
+    class_hash: int,
+    constructor_calldata: Sequence[int],
+    predicate: Callable[[int], bool],
+    deployer_address: int = 0,
+    start_salt: int = 0,
+    max_attempts: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    chunk_size: int = DEFAULT_SALT_SEARCH_CHUNK_SIZE,
+) -> Optional[Tuple[int, int]]:
+    """
+    Searches for the lowest salt, starting at ``start_salt``, for which the contract address satisfies
+    the predicate, e.g. a vanity address starting with a given prefix.
+
+    When ``executor`` is provided, consecutive chunks of salts are searched concurrently by its workers
+    and the search stops as soon as the match is found. The predicate must be picklable (e.g. a module-level
+    function) to be used with :class:`~concurrent.futures.ProcessPoolExecutor`.
+
+    :param class_hash: class hash of the contract
+    :param constructor_calldata: calldata for the contract constructor
+    :param predicate: function returning ``True`` for the address of the contract that is searched for
+    :param deployer_address: address of the deployer (if not provided default 0 is used)
+    :param start_salt: first salt to check
+    :param max_attempts: maximal number of salts to check. If not provided, the search is not limited.
+    :param executor: executor searching chunks of salts. If not provided, salts are searched in the calling thread.
+    :param chunk_size: number of salts searched by a single task of the executor
+    :return: Tuple of the salt and the contract's address or ``None`` if no salt was found within ``max_attempts``.
+    """
+    # pylint: disable=too-many-arguments
+    if chunk_size <= 0:
+        raise ValueError("Argument chunk_size must be greater than 0.")
+
+    chunks = _iter_salt_chunks(
+        start_salt,
+        start_salt + max_attempts if max_attempts is not None else None,
+        chunk_size,
+    )
+    search_args = (
+        _get_address_prefix_hash(deployer_address),
+        class_hash,
+        compute_hash_on_elements(data=constructor_calldata),
+        predicate,
     )
 
+    if executor is None:
+        for chunk_start, chunk_end in chunks:
+            result = _search_salts(chunk_start, chunk_end, *search_args)
+            if result is not None:
+                return result
+        return None
+
+    return _search_salt_chunks_in_executor(executor, chunks, search_args)
+
+
+def _search_salt_chunks_in_executor(
+    executor: Executor, chunks: Iterator[Tuple[int, int]], search_args: tuple
+) -> Optional[Tuple[int, int]]:
+    # Results are checked in the order of salts, keeping a bounded number of chunks in progress
+    max_pending = 2 * (os.cpu_count() or 1)
+    pending: Deque[Future] = deque()
+    try:
+        for chunk_start, chunk_end in chunks:
+            pending.append(
+                executor.submit(_search_salts, chunk_start, chunk_end, *search_args)
+            )
+            if len(pending) < max_pending:
+                continue
+            result = pending.popleft().result()
+            if result is not None:
+                return result
+
+        while pending:
+            result = pending.popleft().result()
+            if result is not None:
+                return result
+        return None
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _iter_salt_chunks(
+    start_salt: int, end_salt: Optional[int], chunk_size: int
+) -> Iterator[Tuple[int, int]]:
+    chunk_start = start_salt
+    while end_salt is None or chunk_start < end_salt:
+        chunk_end = chunk_start + chunk_size
+        if end_salt is not None:
+            chunk_end = min(chunk_end, end_salt)
+        yield chunk_start, chunk_end
+        chunk_start = chunk_end
+
+
+def _search_salts(
+    start: int,
+    end: int,
+    prefix_hash: int,
+    class_hash: int,
+    constructor_calldata_hash: int,
+    predicate: Callable[[int], bool],
+) -> Optional[Tuple[int, int]]:
+    # Defined on the module level, so it can be sent to workers of a process pool
+    for salt in range(start, end):
+        address = _compute_address_from_prefix(
+            prefix_hash, salt, class_hash, constructor_calldata_hash
+        )
+        if predicate(address):
+            return salt, address
+    return None
+
+
+@lru_cache(maxsize=16)
+def _get_address_prefix_hash(deployer_address: int) -> int:
+    """
+    Returns the hash chain of the address elements preceding the salt.
+    """
+    return pedersen_hash(pedersen_hash(0, CONTRACT_ADDRESS_PREFIX), deployer_address)
+
+
+def _compute_address_from_prefix(
+    prefix_hash: int, salt: int, class_hash: int, constructor_calldata_hash: int
+) -> int:
+    raw_address = prefix_hash
+    for element in (salt, class_hash, constructor_calldata_hash, _ADDRESS_CHAIN_LENGTH):
+        raw_address = pedersen_hash(raw_address, element)
     return raw_address % L2_ADDRESS_UPPER_BOUND
 
 
@@ -5,12 +5,17 @@ https://github.com/starkware-libs/sequencer/blob/b29c0e8c61f7b2340209e256cf87dfe
 """
 
 import hashlib
+import sys
+from array import array
 from typing import List
 
 from starknet_py.constants import FIELD_PRIME
 
 SMALL_THRESHOLD = 2**63
 BIG_MARKER = 1 << 31  # MSB mask for the first u32 in the 8-limb case
+BIG_FELT_MARKER = BIG_MARKER << 224  # The same mask applied to the whole 256-bit value
+
+_U32_TYPECODE = next(code for code in "IL" if array(code).itemsize == 4)
 
 
 def encode_felts_to_u32s(felts: List[int]) -> List[int]:
@@ -24,27 +29,39 @@ def encode_felts_to_u32s(felts: List[int]) -> List[int]:
     :param felts: List of Felt values to encode
     :return: Flat list of u32 values
     """
-    unpacked_u32s = []
-    for felt in felts:
-        # Convert felt to 32-byte big-endian representation
-        felt_as_be_bytes = felt.to_bytes(32, byteorder="big")
-
-        if felt < SMALL_THRESHOLD:
-            # Small: 2 limbs only, high-32 then low-32 of the last 8 bytes
-            high = int.from_bytes(felt_as_be_bytes[24:28], byteorder="big")
-            low = int.from_bytes(felt_as_be_bytes[28:32], byteorder="big")
-            unpacked_u32s.append(high)
-            unpacked_u32s.append(low)
-        else:
-            # Big: 8 limbs, big-endian order
-            start = len(unpacked_u32s)
-            for i in range(0, 32, 4):
-                limb = int.from_bytes(felt_as_be_bytes[i : i + 4], byteorder="big")
-                unpacked_u32s.append(limb)
-            # Set the MSB of the very first limb as the Cairo hint does with "+ 2**255"
-            unpacked_u32s[start] |= BIG_MARKER
-
-    return unpacked_u32s
+    u32_words = array(_U32_TYPECODE, _encode_felts_to_be_bytes(felts))
+    if sys.byteorder == "little":
+        u32_words.byteswap()
+    return u32_words.tolist()
+
+
+def encode_felts_to_bytes(felts: List[int]) -> bytes:
+    """
+    Encode Felt values into the little-endian byte stream of 32-bit words hashed by Blake2s.
+
+    Equivalent to serializing every word returned by :func:`encode_felts_to_u32s` as 4 little-endian bytes,
+    without creating the intermediate integers.
+
+    :param felts: List of Felt values to encode
+    :return: Little-endian byte stream of u32 values
+    """
+    u32_words = array(_U32_TYPECODE, _encode_felts_to_be_bytes(felts))
+    # Reverses bytes within every word, turning the big-endian words into little-endian ones
+    u32_words.byteswap()
+    return u32_words.tobytes()
+
+
+def _encode_felts_to_be_bytes(felts: List[int]) -> bytes:
+    # Small felts take the last 8 bytes of their big-endian representation,
+    # large felts take all 32 bytes with the marker set, which gives the words in big-endian order
+    return b"".join(
+        (
+            felt.to_bytes(8, byteorder="big")
+            if felt < SMALL_THRESHOLD
+            else (felt | BIG_FELT_MARKER).to_bytes(32, byteorder="big")
+        )
+        for felt in felts
+    )
 
 
 def pack_256_le_to_felt(hash_bytes: bytes) -> int:
@@ -82,11 +99,8 @@ def encode_felt252_data_and_calc_blake_hash(felts: List[int]) -> int:
     :param felts: List of Felt values to encode and hash
     :return: Blake2s-256 hash as a 252-bit field element
     """
-    # Unpack each Felt into 2 or 8 u32 limbs
-    u32_words = encode_felts_to_u32s(felts)
-
-    # Serialize the u32 limbs into a little-endian byte stream
-    byte_stream = b"".join(word.to_bytes(4, byteorder="little") for word in u32_words)
+    # Unpack each Felt into 2 or 8 u32 limbs serialized as a little-endian byte stream
+    byte_stream = encode_felts_to_bytes(felts)
 
     # Compute Blake2s-256 over the bytes and pack the result into a Felt
     return blake2s_to_felt(byte_stream)
@@ -1,4 +1,7 @@
-from typing import List, Optional, Sequence, Tuple
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 from semver import Version
 
@@ -11,6 +14,7 @@ from starknet_py.hash.compiled_class_hash_objects import (
     NestedIntList,
 )
 from starknet_py.hash.hash_method import HashMethod
+from starknet_py.hash.utils import encode_uint_list
 from starknet_py.net.client_models import CasmClassEntryPoint
 from starknet_py.net.executable_models import CasmClass
 
@@ -25,11 +29,69 @@ def get_casm_hash_method_for_starknet_version(starknet_version: Version) -> Hash
     return HashMethod.POSEIDON
 
 
+class BytecodeSegmentHashCache:
+    """
+    Cache of hashes of bytecode segments, keyed by the digest of their content.
+
+    Sharing the cache between computations of class hashes of similar classes, e.g. subsequent builds
+    of the same contract, makes only the modified segments of the bytecode rehashed.
+    """
+
+    def __init__(self, max_entries: int = 100_000):
+        """
+        :param max_entries: Maximal number of cached hashes. The least recently used ones are evicted first.
+        """
+        if max_entries <= 0:
+            raise ValueError("Argument max_entries must be greater than 0.")
+
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._hashes: OrderedDict[Tuple[str, bytes], int] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    @staticmethod
+    def get_key(data: List[int], hash_method: HashMethod) -> Tuple[str, bytes]:
+        return hash_method.value, hashlib.blake2b(encode_uint_list(data)).digest()
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[int]:
+        hash_ = self._hashes.get(key)
+        if hash_ is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._hashes.move_to_end(key)
+        return hash_
+
+    def put(self, key: Tuple[str, bytes], hash_: int):
+        self._hashes[key] = hash_
+        self._hashes.move_to_end(key)
+        while len(self._hashes) > self.max_entries:
+            self._hashes.popitem(last=False)
+
+    def clear(self):
+        self._hashes.clear()
+
+
 def compute_casm_class_hash(
-    casm_contract_class: CasmClass, hash_method: HashMethod = HashMethod.BLAKE2S
+    casm_contract_class: CasmClass,
+    hash_method: HashMethod = HashMethod.BLAKE2S,
+    *,
+    executor: Optional[Executor] = None,
+    segment_hash_cache: Optional[BytecodeSegmentHashCache] = None,
 ) -> int:
     """
     Calculate class hash of a CasmClass.
+
+    :param casm_contract_class: CasmClass to calculate the hash of.
+    :param hash_method: Hash method to use.
+    :param executor: Executor hashing the segments of the bytecode concurrently.
+        Hash functions hold the GIL, so ``concurrent.futures.ProcessPoolExecutor`` should be used.
+        If not provided, segments are hashed in the calling thread.
+    :param segment_hash_cache: Cache of hashes of bytecode segments, which can be shared between
+        calculations, so only the segments not hashed before are hashed.
     """
     casm_class_version = encode_shortstring(CASM_CLASS_VERSION)
 
@@ -46,13 +108,23 @@ def compute_casm_class_hash(
     )
 
     if casm_contract_class.bytecode_segment_lengths is not None:
-        bytecode_hash = create_bytecode_segment_structure(
+        bytecode_structure = create_bytecode_segment_structure(
             bytecode=casm_contract_class.bytecode,
             bytecode_segment_lengths=casm_contract_class.bytecode_segment_lengths,
             visited_pcs=None,
-        ).hash(hash_method)
+        )
+    else:
+        bytecode_structure = BytecodeLeaf(data=casm_contract_class.bytecode)
+
+    if executor is None and segment_hash_cache is None:
+        bytecode_hash = bytecode_structure.hash(hash_method)
     else:
-        bytecode_hash = hash_method.hash_many(casm_contract_class.bytecode)
+        bytecode_hash = compute_bytecode_segment_structure_hash(
+            bytecode_structure,
+            hash_method,
+            executor=executor,
+            segment_hash_cache=segment_hash_cache,
+        )
 
     return hash_method.hash_many(
         [
@@ -81,6 +153,88 @@ def _entry_points_array(
     return entry_points_array
 
 
+def compute_bytecode_segment_structure_hash(
+    bytecode_structure: BytecodeSegmentStructure,
+    hash_method: HashMethod,
+    *,
+    executor: Optional[Executor] = None,
+    segment_hash_cache: Optional[BytecodeSegmentHashCache] = None,
+) -> int:
+    """
+    Calculate the hash of the bytecode segment structure, equal to ``bytecode_structure.hash(hash_method)``.
+
+    The leaves of the structure are independent, so they are hashed first, concurrently when ``executor``
+    is provided. Leaves found in ``segment_hash_cache`` are not hashed again.
+    """
+    leaves: List[BytecodeLeaf] = []
+    _collect_leaves(bytecode_structure, leaves)
+
+    leaf_hashes: Dict[int, int] = {}
+    # Leaves with the same content are hashed once, when their content digest is computed for the cache
+    leaves_to_hash: Dict[Union[int, Tuple[str, bytes]], List[BytecodeLeaf]] = {}
+    for leaf in leaves:
+        if segment_hash_cache is None:
+            leaves_to_hash[id(leaf)] = [leaf]
+            continue
+
+        key = segment_hash_cache.get_key(leaf.data, hash_method)
+        cached = segment_hash_cache.get(key)
+        if cached is not None:
+            leaf_hashes[id(leaf)] = cached
+        else:
+            leaves_to_hash.setdefault(key, []).append(leaf)
+
+    data = [same_leaves[0].data for same_leaves in leaves_to_hash.values()]
+    if executor is not None:
+        hashes = list(executor.map(hash_method.hash_many, data))
+    else:
+        hashes = [hash_method.hash_many(leaf_data) for leaf_data in data]
+
+    for (key, same_leaves), hash_ in zip(leaves_to_hash.items(), hashes):
+        for leaf in same_leaves:
+            leaf_hashes[id(leaf)] = hash_
+        if segment_hash_cache is not None:
+            assert isinstance(key, tuple)
+            segment_hash_cache.put(key, hash_)
+
+    return _hash_bytecode_segment_structure(
+        bytecode_structure, hash_method, leaf_hashes
+    )
+
+
+def _collect_leaves(
+    bytecode_structure: BytecodeSegmentStructure, leaves: List[BytecodeLeaf]
+):
+    if isinstance(bytecode_structure, BytecodeLeaf):
+        leaves.append(bytecode_structure)
+        return
+
+    assert isinstance(bytecode_structure, BytecodeSegmentedNode)
+    for segment in bytecode_structure.segments:
+        _collect_leaves(segment.inner_structure, leaves)
+
+
+def _hash_bytecode_segment_structure(
+    bytecode_structure: BytecodeSegmentStructure,
+    hash_method: HashMethod,
+    leaf_hashes: Dict[int, int],
+) -> int:
+    # Mirrors BytecodeSegmentedNode.hash, using the precomputed hashes of the leaves
+    if isinstance(bytecode_structure, BytecodeLeaf):
+        return leaf_hashes[id(bytecode_structure)]
+
+    assert isinstance(bytecode_structure, BytecodeSegmentedNode)
+    node_data = []
+    for segment in bytecode_structure.segments:
+        node_data.append(segment.segment_length)
+        node_data.append(
+            _hash_bytecode_segment_structure(
+                segment.inner_structure, hash_method, leaf_hashes
+            )
+        )
+    return hash_method.hash_many(node_data) + 1
+
+
 # create_bytecode_segment_structure and _create_bytecode_segment_structure_inner are copied from
 # https://github.com/starkware-libs/cairo-lang/blob/v0.13.1/src/starkware/starknet/core/os/contract_class/compiled_class_hash.py
 
@@ -1,18 +1,59 @@
-import copy
 import json
 import re
-from typing import List
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Iterator, List, Tuple
+
+from Crypto.Hash import keccak
 
 from starknet_py.cairo.felt import encode_shortstring
 from starknet_py.constants import API_VERSION
-from starknet_py.hash.utils import _starknet_keccak, compute_hash_on_elements
+from starknet_py.hash.utils import MASK_250, compute_hash_on_elements
 from starknet_py.net.client_models import DeprecatedContractClass, EntryPoint
 
+# Number of nested levels of the class serialized piece by piece, values nested deeper are serialized at once
+_SERIALIZATION_DEPTH = 3
+_SERIALIZATION_LIST_CHUNK_SIZE = 10_000
+_HASHER_BUFFER_SIZE = 1 << 20
+_CLASS_HASH_CACHE_SIZE = 256
+
+# Class hashes by the id of the class, the weak reference tells whether the id was reused by another object
+_class_hash_cache: OrderedDict[
+    int, Tuple[weakref.ReferenceType[DeprecatedContractClass], int]
+] = OrderedDict()
+_class_hash_cache_lock = threading.Lock()
+
 
 def compute_class_hash(contract_class: DeprecatedContractClass) -> int:
     """
     Calculate class hash of a ContractClass.
+
+    Results are cached for recently hashed class objects, so the class must not be modified
+    after its hash is computed.
     """
+    key = id(contract_class)
+    with _class_hash_cache_lock:
+        cached = _class_hash_cache.get(key)
+        if cached is not None and cached[0]() is contract_class:
+            _class_hash_cache.move_to_end(key)
+            return cached[1]
+
+    hinted_class_hash = _compute_hinted_class_hash(contract_class)
+    class_hash = _compute_class_hash(contract_class, hinted_class_hash)
+
+    with _class_hash_cache_lock:
+        _class_hash_cache[key] = (weakref.ref(contract_class), class_hash)
+        _class_hash_cache.move_to_end(key)
+        if len(_class_hash_cache) > _CLASS_HASH_CACHE_SIZE:
+            _class_hash_cache.popitem(last=False)
+
+    return class_hash
+
+
+def _compute_class_hash(
+    contract_class: DeprecatedContractClass, hinted_class_hash: int
+) -> int:
     api_version = API_VERSION
 
     _entry_points = contract_class.entry_points_by_type
@@ -32,8 +73,6 @@ def compute_class_hash(contract_class: DeprecatedContractClass) -> int:
     ]
     builtins_hash = compute_hash_on_elements(_encoded_builtins)
 
-    hinted_class_hash = _compute_hinted_class_hash(copy.deepcopy(contract_class))
-
     program_data_hash = compute_hash_on_elements(
         [int(data_, 0) for data_ in contract_class.program["data"]]
     )
@@ -60,20 +99,72 @@ def _entry_points_array(entry_points: List[EntryPoint]) -> List[int]:
 
 
 def _compute_hinted_class_hash(contract_class: DeprecatedContractClass) -> int:
+    """
+    Computes hinted class hash for contract_class.
+
+    The class is serialized piece by piece into the hasher, without copying the program.
+    """
     program = contract_class.program
-    program["debug_info"] = None
+    hinted_program = {**program, "debug_info": None}
 
     if "attributes" in program:
-        program = _delete_backward_compatibility_fields(program)
+        _delete_backward_compatibility_fields(hinted_program)
 
     # If compiler_version is not present, this was compiled with a compiler before version 0.10.0.
     # Use "(a : felt)" syntax instead of "(a: felt)" so that the class hash will be the same.
     if "compiler_version" not in program:
-        program["identifiers"] = _fix_cairo_types(program["identifiers"])
+        hinted_program["identifiers"] = _fix_cairo_types(program["identifiers"])
+
+    class_ = {"abi": contract_class.abi, "program": hinted_program}
+
+    keccak_hasher = keccak.new(digest_bits=256)
+    buffer: List[str] = []
+    buffer_size = 0
+    for chunk in _iter_json_chunks(class_, _SERIALIZATION_DEPTH):
+        buffer.append(chunk)
+        buffer_size += len(chunk)
+        if buffer_size >= _HASHER_BUFFER_SIZE:
+            keccak_hasher.update("".join(buffer).encode())
+            buffer, buffer_size = [], 0
+    keccak_hasher.update("".join(buffer).encode())
 
-    class_ = {"abi": contract_class.abi, "program": program}
-    serialized_contract_class = json.dumps(obj=class_)
-    return _starknet_keccak(data=serialized_contract_class.encode())
+    return int.from_bytes(keccak_hasher.digest(), "big") & MASK_250
+
+
+def _iter_json_chunks(obj: Any, depth: int) -> Iterator[str]:
+    """
+    Yields the parts of ``json.dumps(obj)`` output, serializing values nested deeper than ``depth`` at once.
+    """
+    if (
+        depth > 0
+        and isinstance(obj, dict)
+        and obj
+        and all(isinstance(key, str) for key in obj)
+    ):
+        separator = "{"
+        for key, value in obj.items():
+            yield f"{separator}{json.dumps(key)}: "
+            yield from _iter_json_chunks(value, depth - 1)
+            separator = ", "
+        yield "}"
+    elif depth > 0 and isinstance(obj, list) and obj:
+        separator = "["
+        for start in range(0, len(obj), _SERIALIZATION_LIST_CHUNK_SIZE):
+            chunk = obj[start : start + _SERIALIZATION_LIST_CHUNK_SIZE]
+            yield separator
+            if depth > 1 and any(isinstance(item, (dict, list)) for item in chunk):
+                item_separator = ""
+                for item in chunk:
+                    yield item_separator
+                    yield from _iter_json_chunks(item, depth - 1)
+                    item_separator = ", "
+            else:
+                # Strips the brackets of the serialized chunk
+                yield json.dumps(chunk)[1:-1]
+            separator = ", "
+        yield "]"
+    else:
+        yield json.dumps(obj)
 
 
 def _fix_cairo_types(identifiers: dict) -> dict:
@@ -82,35 +173,48 @@ def _fix_cairo_types(identifiers: dict) -> dict:
     Pads values with a space before the colon between variable and type.
     Example:
         (retdata_size: felt, retdata: felt*) => (retdata_size : felt, retdata : felt*)
+
+    Returns fixed copies of the dictionaries, leaving the identifiers unchanged.
     """
+    fixed_identifiers = {}
     for name, value in identifiers.items():
         if not isinstance(value, dict):
+            fixed_identifiers[name] = value
             continue
 
         if "cairo_type" in value:
-            value["cairo_type"] = _add_backward_compatibility_space(value["cairo_type"])
+            value = {
+                **value,
+                "cairo_type": _add_backward_compatibility_space(value["cairo_type"]),
+            }
 
-        identifiers[name] = _fix_cairo_types(value)
+        fixed_identifiers[name] = _fix_cairo_types(value)
 
-    return identifiers
+    return fixed_identifiers
 
 
 def _add_backward_compatibility_space(cairo_type: str) -> str:
     return re.sub(r"(?<! ):", " :", cairo_type)
 
 
-def _delete_backward_compatibility_fields(program) -> dict:
+def _delete_backward_compatibility_fields(program: dict):
+    """
+    Replaces the attributes of the shallow copy of the program with their backward compatible copies.
+    """
     if len(program["attributes"]) == 0:
         # Remove attributes field from raw dictionary, for hash backward compatibility of
         # contracts deployed prior to adding this feature.
         del program["attributes"]
-        return program
+        return
 
     # Remove accessible_scopes and flow_tracking_data fields from raw dictionary, for hash
     # backward compatibility of contracts deployed prior to adding this feature.
-    for attr in program["attributes"]:
-        if "accessible_scopes" in attr and len(attr["accessible_scopes"]) == 0:
-            del attr["accessible_scopes"]
-        if "flow_tracking_data" in attr and attr["flow_tracking_data"] is None:
-            del attr["flow_tracking_data"]
-    return program
+    program["attributes"] = [
+        {
+            key: value
+            for key, value in attr.items()
+            if not (key == "accessible_scopes" and len(value) == 0)
+            and not (key == "flow_tracking_data" and value is None)
+        }
+        for attr in program["attributes"]
+    ]
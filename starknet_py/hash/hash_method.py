@@ -1,10 +1,14 @@
 from enum import Enum
-from typing import List
+from typing import List, Sequence, Tuple
 
 from poseidon_py.poseidon_hash import poseidon_hash, poseidon_hash_many
 
 from starknet_py.hash.blake2s import blake2s_hash_many
-from starknet_py.hash.utils import compute_hash_on_elements, pedersen_hash
+from starknet_py.hash.utils import (
+    compute_hash_on_elements,
+    pedersen_hash,
+    pedersen_hash_many,
+)
 
 
 class HashMethod(Enum):
@@ -33,3 +37,11 @@ class HashMethod(Enum):
         if self == HashMethod.BLAKE2S:
             return blake2s_hash_many(values)
         raise ValueError(f"Unsupported hash method: {self}.")
+
+    def hash_pairs(self, pairs: Sequence[Tuple[int, int]]) -> List[int]:
+        """
+        Hashes independent pairs of values. Pedersen hashes of large inputs are computed by several threads.
+        """
+        if self == HashMethod.PEDERSEN:
+            return pedersen_hash_many(pairs)
+        return [self.hash(left, right) for left, right in pairs]
@@ -1,7 +1,9 @@
-from functools import reduce
-
 from starknet_py.constants import ADDR_BOUND
-from starknet_py.hash.utils import _starknet_keccak, pedersen_hash
+from starknet_py.hash.utils import (
+    _starknet_keccak,
+    encode_uint_list,
+    pedersen_hash_chain,
+)
 
 
 def get_storage_var_address(var_name: str, *args: int) -> int:
@@ -9,4 +11,4 @@ def get_storage_var_address(var_name: str, *args: int) -> int:
     Returns the storage address of a Starknet storage variable given its name and arguments.
     """
     res = _starknet_keccak(var_name.encode("ascii"))
-    return reduce(pedersen_hash, args, res) % ADDR_BOUND
+    return pedersen_hash_chain(encode_uint_list(list(args)), initial=res) % ADDR_BOUND
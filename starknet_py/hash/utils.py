@@ -1,13 +1,19 @@
-import functools
-from typing import List, Optional, Sequence
+import ctypes
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple
 
 from Crypto.Hash import keccak
+from crypto_cpp_py import cpp_bindings
 from crypto_cpp_py.cpp_bindings import (
+    OUT_BUFFER_SIZE,
     ECSignature,
+    cpp_binding_loaded,
     cpp_get_public_key,
     cpp_hash,
     cpp_sign,
     cpp_verify,
+    load_cpp_lib,
 )
 
 from starknet_py.common import int_from_bytes
@@ -15,6 +21,11 @@ from starknet_py.constants import EC_ORDER
 
 MASK_250 = 2**250 - 1
 HEX_PREFIX = "0x"
+FELT_BYTES_LENGTH = 32
+
+# Smaller inputs are hashed in the calling thread, as the gain would not cover starting the workers
+_MIN_PAIRS_PER_WORKER = 64
+_MIN_SIGNATURES_PER_WORKER = 8
 
 
 def _starknet_keccak(data: bytes) -> int:
@@ -48,7 +59,82 @@ def compute_hash_on_elements(data: Sequence) -> int:
     The length is appended in order to avoid collisions of the following kind:
     H([x,y,z]) = h(h(x,y),z) = H([w, z]) where w = h(x,y).
     """
-    return functools.reduce(pedersen_hash, [*data, len(data)], 0)
+    return pedersen_hash_chain(encode_uint_list([*data, len(data)]))
+
+
+def pedersen_hash_chain(packed: bytes, initial: int = 0) -> int:
+    """
+    Computes a Pedersen hash chain over field elements packed as consecutive 32-byte big-endian values
+    (see :func:`encode_uint_list`), in the following order:
+        h(h(h(initial, data[0]), data[1]), ...), data[n-1]).
+
+    Intermediate results are passed to the native library directly, without converting them to integers.
+    """
+    if len(packed) % FELT_BYTES_LENGTH != 0:
+        raise ValueError(
+            f"Length of packed data must be a multiple of {FELT_BYTES_LENGTH}."
+        )
+
+    hash_function = _get_cpp_hash_function()
+    left = ctypes.create_string_buffer(
+        initial.to_bytes(FELT_BYTES_LENGTH, "little"), OUT_BUFFER_SIZE
+    )
+    result = ctypes.create_string_buffer(OUT_BUFFER_SIZE)
+    for offset in range(0, len(packed), FELT_BYTES_LENGTH):
+        right = packed[offset : offset + FELT_BYTES_LENGTH][::-1]
+        if hash_function(left, right, result) != 0:
+            raise ValueError(result.raw.rstrip(b"\00"))
+        left, result = result, left
+
+    return int.from_bytes(left.raw[:FELT_BYTES_LENGTH], "little")
+
+
+def pedersen_hash_many(
+    pairs: Sequence[Tuple[int, int]], max_workers: Optional[int] = None
+) -> List[int]:
+    """
+    Computes Pedersen hashes of independent pairs of field elements.
+
+    The native library releases the GIL while hashing, so large inputs are split between
+    ``max_workers`` threads, which defaults to the number of CPUs.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(pairs) < 2 * _MIN_PAIRS_PER_WORKER:
+        return _pedersen_hash_pairs(pairs)
+
+    part_size = max(-(-len(pairs) // max_workers), _MIN_PAIRS_PER_WORKER)
+    parts = [pairs[i : i + part_size] for i in range(0, len(pairs), part_size)]
+    with ThreadPoolExecutor(max_workers=len(parts)) as executor:
+        return [
+            hash_
+            for part_hashes in executor.map(_pedersen_hash_pairs, parts)
+            for hash_ in part_hashes
+        ]
+
+
+def _pedersen_hash_pairs(pairs: Sequence[Tuple[int, int]]) -> List[int]:
+    hash_function = _get_cpp_hash_function()
+    result = ctypes.create_string_buffer(OUT_BUFFER_SIZE)
+    hashes = []
+    for left, right in pairs:
+        if (
+            hash_function(
+                left.to_bytes(FELT_BYTES_LENGTH, "little"),
+                right.to_bytes(FELT_BYTES_LENGTH, "little"),
+                result,
+            )
+            != 0
+        ):
+            raise ValueError(result.raw.rstrip(b"\00"))
+        hashes.append(int.from_bytes(result.raw[:FELT_BYTES_LENGTH], "little"))
+    return hashes
+
+
+def _get_cpp_hash_function():
+    # The library is loaded when crypto_cpp_py is imported, unless it was unloaded since then
+    if not cpp_binding_loaded():
+        load_cpp_lib(cpp_hash)
+    return cpp_bindings.CPP_LIB_BINDING.Hash
 
 
 def message_signature(
@@ -72,6 +158,103 @@ def verify_message_signature(
     return cpp_verify(msg_hash=msg_hash, r=sig_r, w=sig_w, stark_key=public_key)
 
 
+def verify_signatures_batch(
+    hashes: Sequence[int],
+    signatures: Sequence[Sequence[int]],
+    public_keys: Sequence[int],
+    max_workers: Optional[int] = None,
+) -> List[bool]:
+    """
+    Verifies ECDSA signatures of message hashes with the corresponding public keys.
+
+    Inverses of ``s`` components of all signatures are computed with a single modular inversion.
+    The native library releases the GIL while verifying, so large inputs are split between
+    ``max_workers`` threads, which defaults to the number of CPUs.
+
+    :param hashes: Message hashes.
+    :param signatures: Signatures ``[r, s]`` of the message hashes.
+    :param public_keys: Public keys of the signers of the message hashes.
+    :param max_workers: Maximal number of threads verifying the signatures.
+    :return: List of flags telling whether the corresponding signature is valid.
+    """
+    if not len(hashes) == len(signatures) == len(public_keys):
+        raise ValueError(
+            "Arguments hashes, signatures and public_keys must have the same length."
+        )
+
+    inverses = _batch_inverse([s % EC_ORDER for _, s in signatures])
+    entries = [
+        (msg_hash, signature[0], sig_w, public_key)
+        for msg_hash, signature, sig_w, public_key in zip(
+            hashes, signatures, inverses, public_keys
+        )
+    ]
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(entries) < 2 * _MIN_SIGNATURES_PER_WORKER:
+        return _verify_signatures(entries)
+
+    part_size = max(-(-len(entries) // max_workers), _MIN_SIGNATURES_PER_WORKER)
+    parts = [entries[i : i + part_size] for i in range(0, len(entries), part_size)]
+    with ThreadPoolExecutor(max_workers=len(parts)) as executor:
+        return [
+            result
+            for part_results in executor.map(_verify_signatures, parts)
+            for result in part_results
+        ]
+
+
+def _batch_inverse(values: List[int]) -> List[Optional[int]]:
+    """
+    Computes inverses modulo EC_ORDER of all values using Montgomery's trick.
+    Zero values, which have no inverse, are mapped to None.
+    """
+    prefix_products = []
+    product = 1
+    for value in values:
+        if value != 0:
+            product = product * value % EC_ORDER
+        prefix_products.append(product)
+
+    inverse = pow(product, -1, EC_ORDER)
+
+    inverses: List[Optional[int]] = [None] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        if values[i] == 0:
+            continue
+        previous_product = prefix_products[i - 1] if i > 0 else 1
+        inverses[i] = inverse * previous_product % EC_ORDER
+        inverse = inverse * values[i] % EC_ORDER
+    return inverses
+
+
+def _verify_signatures(
+    entries: Sequence[Tuple[int, int, Optional[int], int]],
+) -> List[bool]:
+    verify_function = _get_cpp_verify_function()
+    results = []
+    for msg_hash, sig_r, sig_w, public_key in entries:
+        if sig_w is None:
+            results.append(False)
+            continue
+        results.append(
+            verify_function(
+                public_key.to_bytes(FELT_BYTES_LENGTH, "little"),
+                msg_hash.to_bytes(FELT_BYTES_LENGTH, "little"),
+                sig_r.to_bytes(FELT_BYTES_LENGTH, "little"),
+                sig_w.to_bytes(FELT_BYTES_LENGTH, "little"),
+            )
+        )
+    return results
+
+
+def _get_cpp_verify_function():
+    # The library is loaded when crypto_cpp_py is imported, unless it was unloaded since then
+    if not cpp_binding_loaded():
+        load_cpp_lib(cpp_verify)
+    return cpp_bindings.CPP_LIB_BINDING.Verify
+
+
 def private_to_stark_key(priv_key: int) -> int:
     """
     Deduces the public key given a private key.
@@ -22,6 +22,22 @@ class ClientError(Exception):
         super().__init__(self.message)
 
 
+class HttpStatusError(ClientError):
+    """
+    The node responded with an unsuccessful HTTP status.
+    """
+
+    def __init__(self, status: int, message: str, retry_after: Optional[float] = None):
+        """
+        :param status: HTTP status of the response.
+        :param message: Body of the response.
+        :param retry_after: Delay in seconds requested by the node in the ``Retry-After`` header.
+        """
+        self.status = status
+        self.retry_after = retry_after
+        super().__init__(code=str(status), message=message)
+
+
 class ContractNotFoundError(ClientError):
     """
     Requested contract was not found.
@@ -50,7 +50,7 @@ class Call:
 Calls = Union[Call, Iterable[Call]]
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """
     Dataclass representing a Starknet event.
@@ -61,25 +61,22 @@ class Event:
     data: List[int]
 
 
-@dataclass
+@dataclass(slots=True)
 class _EmittedEventBase(Event):
     transaction_hash: int
     transaction_index: int
     event_index: int
 
 
-@dataclass
-class _EmittedEventDefaultBase(Event):
-    block_hash: Optional[int] = None
-    block_number: Optional[int] = None
-
-
-@dataclass
-class EmittedEvent(_EmittedEventDefaultBase, _EmittedEventBase):
+@dataclass(slots=True)
+class EmittedEvent(_EmittedEventBase):
     """
     Dataclass representing an event emitted by transaction.
     """
 
+    block_hash: Optional[int] = None
+    block_number: Optional[int] = None
+
 
 @dataclass
 class EventsChunk:
@@ -91,7 +88,7 @@ class EventsChunk:
     continuation_token: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class L2toL1Message:
     """
     Dataclass representing a L2->L1 message.
@@ -102,7 +99,7 @@ class L2toL1Message:
     l1_address: int  # to_address in spec
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourcePrice:
     """
     Dataclass representing prices of L1 gas.
@@ -112,7 +109,7 @@ class ResourcePrice:
     price_in_fri: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceBounds:
     """
     Dataclass representing max amount and price of the resource that can be used in the transaction.
@@ -145,7 +142,7 @@ class OutsideExecutionTimeBounds:
         return int(self.execute_before.timestamp())
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceBoundsMapping:
     """
     Dataclass representing resource limits that can be used in the transaction.
@@ -173,7 +170,7 @@ class PriceUnit(Enum):
     FRI = "FRI"
 
 
-@dataclass
+@dataclass(slots=True)
 class FeePayment:
     """
     Dataclass representing fee payment info as it appears in receipts.
@@ -209,7 +206,7 @@ class TransactionType(Enum):
     L1_HANDLER = "L1_HANDLER"
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction(ABC):
     """
     Dataclass representing common attributes of all transactions.
@@ -226,7 +223,7 @@ class Transaction(ABC):
             raise TypeError("Cannot instantiate abstract Transaction class.")
 
 
-@dataclass
+@dataclass(slots=True)
 class DeprecatedTransaction(Transaction):
     """
     Dataclass representing common attributes of transactions v1 and v2.
@@ -239,7 +236,7 @@ class DeprecatedTransaction(Transaction):
             raise TypeError("Cannot instantiate abstract DeprecatedTransaction class.")
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionV3(Transaction):
     """
     Dataclass representing common attributes of all transactions v3.
@@ -256,7 +253,7 @@ class TransactionV3(Transaction):
             raise TypeError("Cannot instantiate abstract TransactionV3 class.")
 
 
-@dataclass
+@dataclass(slots=True)
 class InvokeTransactionV0(DeprecatedTransaction):
     """
     Dataclass representing invoke transaction v0.
@@ -267,7 +264,7 @@ class InvokeTransactionV0(DeprecatedTransaction):
     entry_point_selector: int
 
 
-@dataclass
+@dataclass(slots=True)
 class InvokeTransactionV1(DeprecatedTransaction):
     """
     Dataclass representing invoke transaction v1.
@@ -282,7 +279,7 @@ class InvokeTransactionV1(DeprecatedTransaction):
     nonce: int
 
 
-@dataclass
+@dataclass(slots=True)
 class InvokeTransactionV3(TransactionV3):
     """
     Dataclass representing invoke transaction v3.
@@ -295,7 +292,7 @@ class InvokeTransactionV3(TransactionV3):
     proof_facts: Optional[List[int]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeclareTransactionV0(DeprecatedTransaction):
     """
     Dataclass representing declare transaction v0.
@@ -305,7 +302,7 @@ class DeclareTransactionV0(DeprecatedTransaction):
     class_hash: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DeclareTransactionV1(DeprecatedTransaction):
     """
     Dataclass representing declare transaction v1.
@@ -320,7 +317,7 @@ class DeclareTransactionV1(DeprecatedTransaction):
     nonce: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DeclareTransactionV2(DeprecatedTransaction):
     """
     Dataclass representing declare transaction v2.
@@ -336,7 +333,7 @@ class DeclareTransactionV2(DeprecatedTransaction):
     nonce: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DeclareTransactionV3(TransactionV3):
     """
     Dataclass representing declare transaction v3.
@@ -349,7 +346,7 @@ class DeclareTransactionV3(TransactionV3):
     account_deployment_data: List[int]
 
 
-@dataclass
+@dataclass(slots=True)
 class DeployTransaction(Transaction):
     """
     Dataclass representing deploy transaction.
@@ -360,7 +357,7 @@ class DeployTransaction(Transaction):
     class_hash: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DeployAccountTransactionV1(DeprecatedTransaction):
     """
     Dataclass representing deploy account transaction v1.
@@ -376,7 +373,7 @@ class DeployAccountTransactionV1(DeprecatedTransaction):
     class_hash: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DeployAccountTransactionV3(TransactionV3):
     """
     Dataclass representing deploy account transaction v3.
@@ -388,7 +385,7 @@ class DeployAccountTransactionV3(TransactionV3):
     class_hash: int
 
 
-@dataclass
+@dataclass(slots=True)
 class L1HandlerTransaction(Transaction):
     """
     Dataclass representing l1 handler transaction.
@@ -451,7 +448,7 @@ class TransactionFinalityStatusWithoutL1(Enum):
     ACCEPTED_ON_L2 = "ACCEPTED_ON_L2"
 
 
-@dataclass
+@dataclass(slots=True)
 class InnerCallExecutionResources:
     """
     Dataclass representing the resource consumed by an inner call (does not account for state diffs).
@@ -461,7 +458,7 @@ class InnerCallExecutionResources:
     l2_gas: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResources:
     """
     Dataclass representing the resources consumed by the transaction, includes both computation and data.
@@ -473,7 +470,7 @@ class ExecutionResources:
 
 
 # TODO (#1219): split into PendingTransactionReceipt and TransactionReceipt
-@dataclass
+@dataclass(slots=True)
 class TransactionReceipt:
     """
     Dataclass representing details of sent transaction.
@@ -497,7 +494,7 @@ class TransactionReceipt:
     revert_reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionReceiptWithBlockInfo(TransactionReceipt):
     """
     Dataclass representing details of sent transaction with additional block info.
@@ -507,7 +504,7 @@ class TransactionReceiptWithBlockInfo(TransactionReceipt):
     block_hash: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionWithReceipt:
     transaction: Transaction
     receipt: TransactionReceipt
@@ -692,7 +689,7 @@ class SyncStatus:
     highest_block_num: int
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageEntry:
     """
     Dataclass representing single change in the storage.
@@ -702,7 +699,7 @@ class StorageEntry:
     value: int
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageDiffItem:
     """
     Dataclass representing all storage changes for the contract.
@@ -768,7 +765,7 @@ class EstimatedFee:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DeployedContract:
     """
     Dataclass representing basic data of the deployed contract.
@@ -778,7 +775,7 @@ class DeployedContract:
     class_hash: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ContractsNonce:
     """
     Dataclass representing nonce of the contract.
@@ -788,7 +785,7 @@ class ContractsNonce:
     nonce: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DeclaredContractHash:
     """
     Dataclass containing hashes of the declared contract.
@@ -798,7 +795,7 @@ class DeclaredContractHash:
     compiled_class_hash: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplacedClass:
     """
     Dataclass representing new class_hash of the contract.
@@ -808,7 +805,7 @@ class ReplacedClass:
     class_hash: int
 
 
-@dataclass
+@dataclass(slots=True)
 class MigratedClass:
     """
     Dataclass representing migrated compiled class.
@@ -1050,7 +1047,7 @@ class TransactionStatusResponse:
 # ------------------------------- Trace API dataclasses -------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderedEvent:
     """
     Dataclass representing an event alongside its order within the transaction.
@@ -1061,7 +1058,7 @@ class OrderedEvent:
     order: int
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderedMessage:
     """
     Dataclass representing a message alongside its order within the transaction.
@@ -1149,7 +1146,7 @@ class CallType(Enum):
     CALL = "CALL"
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionInvocation:
     """
     Dataclass representing an invocation of a function.
@@ -1398,15 +1395,16 @@ class OutsideExecution:
         }
 
 
-@dataclass
-class _EmittedEventWithFinalityStatus:
+@dataclass(slots=True)
+class _EmittedEventWithFinalityStatus(_EmittedEventBase):
     finality_status: TransactionFinalityStatus
 
 
-@dataclass
-class EmittedEventWithFinalityStatus(
-    _EmittedEventDefaultBase, _EmittedEventWithFinalityStatus, _EmittedEventBase
-):
+@dataclass(slots=True)
+class EmittedEventWithFinalityStatus(_EmittedEventWithFinalityStatus):
     """
     Dataclass representing an event emitted by transaction.
     """
+
+    block_hash: Optional[int] = None
+    block_number: Optional[int] = None
@@ -1,8 +1,23 @@
-from typing import Dict, List, Optional, Tuple, Union, cast
+import asyncio
+import functools
+from contextlib import aclosing
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import aiohttp
+from marshmallow import Schema
 
-from starknet_py.constants import RPC_CONTRACT_ERROR
+from starknet_py.constants import RPC_CONTRACT_ERROR, RPC_PAGE_SIZE_TOO_BIG_ERROR
 from starknet_py.hash.utils import keccak256
 from starknet_py.net.client import Client
 from starknet_py.net.client_errors import ClientError
@@ -34,6 +49,7 @@ from starknet_py.net.client_models import (
     StarknetBlock,
     StarknetBlockWithReceipts,
     StarknetBlockWithTxHashes,
+    StorageDiffItem,
     StorageProofResponse,
     StorageResponseFlag,
     StorageResult,
@@ -57,12 +73,21 @@ from starknet_py.net.client_utils import (
 )
 from starknet_py.net.executable_models import CasmClass
 from starknet_py.net.http_client import RpcHttpClient
+from starknet_py.net.json_codec import JsonCodec
+from starknet_py.net.lazy_sequence import LazySequence
+from starknet_py.net.managed_session import ConnectionPoolConfig, ManagedSession
 from starknet_py.net.models.transaction import (
     AccountTransaction,
     DeclareV3,
     DeployAccountV3,
     InvokeV3,
 )
+from starknet_py.net.rate_limiter import RateLimiter
+from starknet_py.net.request_coalescer import CoalescingConfig
+from starknet_py.net.response_cache import ResponseCache
+from starknet_py.net.retry_policy import RetryPolicy
+from starknet_py.net.rpc_batch import RpcBatch
+from starknet_py.net.schemas.compiled import load_compiled
 from starknet_py.net.schemas.contracts_storage_keys import ContractsStorageKeysSchema
 from starknet_py.net.schemas.rpc.block import (
     BlockHashAndNumberSchema,
@@ -74,6 +99,7 @@ from starknet_py.net.schemas.rpc.block import (
     StarknetBlockSchema,
     StarknetBlockWithReceiptsSchema,
     StarknetBlockWithTxHashesSchema,
+    StorageDiffSchema,
 )
 from starknet_py.net.schemas.rpc.contract import (
     CasmClassSchema,
@@ -98,11 +124,14 @@ from starknet_py.net.schemas.rpc.transactions import (
     SentTransactionSchema,
     TransactionReceiptWithBlockInfoSchema,
     TransactionStatusResponseSchema,
+    TransactionWithReceiptSchema,
     TypesOfTransactionsSchema,
 )
 from starknet_py.transaction_errors import TransactionNotReceivedError
 from starknet_py.utils.sync import add_sync_methods
 
+# pylint: disable=too-many-lines
+
 
 @add_sync_methods
 class FullNodeClient(Client):
@@ -111,16 +140,134 @@ class FullNodeClient(Client):
         self,
         node_url: str,
         session: Optional[aiohttp.ClientSession] = None,
+        coalescing: Optional[CoalescingConfig] = None,
+        connection_pool: Optional[ConnectionPoolConfig] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        json_codec: Optional[JsonCodec] = None,
     ):
+        # pylint: disable=too-many-arguments
         """
         Client for interacting with Starknet json-rpc interface.
 
         :param node_url: Url of the node providing rpc interface
-        :param session: Aiohttp session to be used for request. If not provided, client will create a session for
-                        every request. When using a custom session, user is responsible for closing it manually.
+        :param session: Aiohttp session to be used for request. If not provided, client will create a session
+                        with pooled connections on first request and reuse it. It is closed by :meth:`close`
+                        or when leaving the ``async with`` block. When using a custom session, user is responsible
+                        for closing it manually.
+        :param coalescing: Configuration of merging calls made concurrently within a short time window
+                        into JSON-RPC batch requests. If not provided, every call is sent in a separate request.
+        :param connection_pool: Configuration of the connection pool of the session created by the client.
+                        Mutually exclusive with ``session`` parameter.
+        :param retry_policy: Policy of retrying requests which failed with a transient error, also setting
+                        the request timeout. If not provided, failed requests are not retried.
+        :param rate_limiter: Limiter of the number and rate of requests sent to the node.
+                        If not provided, requests are sent without limits.
+        :param response_cache: Cache of immutable results of calls, e.g. classes or blocks addressed by
+                        hash or number. Calls addressed by block tags like ``latest`` are never cached.
+        :param json_codec: Codec encoding requests and decoding responses. If not provided,
+                        :func:`~starknet_py.net.json_codec.get_default_json_codec` is used.
         """
+        if session is not None and connection_pool is not None:
+            raise ValueError(
+                "Arguments session and connection_pool are mutually exclusive."
+            )
+
         self.url = node_url
-        self._client = RpcHttpClient(url=node_url, session=session)
+        self._managed_session = (
+            ManagedSession(connection_pool=connection_pool) if session is None else None
+        )
+        self._client = RpcHttpClient(
+            url=node_url,
+            session=session,
+            coalescing=coalescing,
+            managed_session=self._managed_session,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
+            json_codec=json_codec,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """
+        Close the session created by the client. Custom session passed to the client is not closed.
+        """
+        if self._managed_session is not None:
+            await self._managed_session.close()
+
+    def batch(self, max_batch_size: Optional[int] = None) -> RpcBatch:
+        """
+        Create a batch sending the calls of the added coroutines as JSON-RPC batch requests.
+
+        .. code-block:: python
+
+            async with client.batch() as batch:
+                nonce = batch.add(client.get_contract_nonce(address))
+                storage = batch.add(client.get_storage_at(address, key, block_number=100))
+
+            print(nonce.result(), storage.result())
+
+        :param max_batch_size: Maximal number of calls sent in one HTTP request.
+            If not provided, all queued calls are sent together.
+        :return: RpcBatch object, to be used as an async context manager.
+        """
+        return RpcBatch(http_client=self._client, max_batch_size=max_batch_size)
+
+    async def get_raw_response(
+        self, method_name: str, params: Optional[dict] = None
+    ) -> bytes:
+        """
+        Send the JSON-RPC call and return the body of the response without decoding it,
+        for callers parsing large responses themselves.
+
+        The call is not batched, coalesced or cached and errors returned by the node are not raised.
+
+        :param method_name: Name of the method without the ``starknet_`` prefix, e.g. ``"getBlockWithReceipts"``.
+        :param params: Parameters of the call.
+        :return: Body of the JSON-RPC response.
+        """
+        return await self._client.send_raw(method_name=method_name, params=params)
+
+    async def iter_response_items(
+        self,
+        method_name: str,
+        params: Optional[dict] = None,
+        path: Sequence[str] = (),
+    ) -> AsyncIterator[Any]:
+        """
+        Send the JSON-RPC call and iterate over the items of an array in its result, decoding them
+        while the response is being received, so only a single item is kept in memory at a time.
+        Other parts of the result are skipped.
+
+        The call is not batched, coalesced, cached or retried.
+
+        .. code-block:: python
+
+            async for felt in client.iter_response_items(
+                "getClass",
+                {"class_hash": hex(class_hash), "block_id": "latest"},
+                path=["sierra_program"],
+            ):
+                ...
+
+        :param method_name: Name of the method without the ``starknet_`` prefix, e.g. ``"getStateUpdate"``.
+        :param params: Parameters of the call.
+        :param path: Keys leading from the result to the array, e.g. ``["state_diff", "storage_diffs"]``.
+            Empty path means the result is the array.
+        :return: Asynchronous iterator of the items, as decoded from JSON.
+        """
+        async with aclosing(
+            self._client.stream(method_name=method_name, params=params, path=path)
+        ) as items:
+            async for item in items:
+                yield item
 
     async def get_block(
         self,
@@ -138,16 +285,28 @@ class FullNodeClient(Client):
 
         if block_identifier == {"block_id": "pre_confirmed"}:
             return cast(
-                PreConfirmedStarknetBlock, PreConfirmedStarknetBlockSchema().load(res)
+                PreConfirmedStarknetBlock,
+                load_compiled(PreConfirmedStarknetBlockSchema, res),
             )
-        return cast(StarknetBlock, StarknetBlockSchema().load(res))
+        return cast(StarknetBlock, load_compiled(StarknetBlockSchema, res))
 
     async def get_block_with_txs(
         self,
         block_hash: Optional[Union[Hash, Tag]] = None,
         block_number: Optional[Union[int, Tag]] = None,
         response_flags: Optional[List[TransactionResponseFlag]] = None,
+        lazy: bool = False,
     ) -> Union[StarknetBlock, PreConfirmedStarknetBlock]:
+        """
+        Retrieve the block's data by its number or hash.
+
+        :param block_hash: Block's hash or literals `"l1_accepted"`, `"pre_confirmed"` or `"latest"`
+        :param block_number: Block's number or literals `"l1_accepted"`, `"pre_confirmed"` or `"latest"`
+        :param response_flags: Flags that control what additional fields are included in transaction responses
+        :param lazy: If ``True``, transactions are returned as a
+            :class:`~starknet_py.net.lazy_sequence.LazySequence`, decoding every transaction on first access.
+        :return: StarknetBlock object representing retrieved block with transactions.
+        """
         block_identifier = get_block_identifier(
             block_hash=block_hash, block_number=block_number
         )
@@ -162,11 +321,17 @@ class FullNodeClient(Client):
             params=params,
         )
 
-        if block_identifier == {"block_id": "pre_confirmed"}:
-            return cast(
-                PreConfirmedStarknetBlock, PreConfirmedStarknetBlockSchema().load(res)
-            )
-        return cast(StarknetBlock, StarknetBlockSchema().load(res))
+        schema_class = (
+            PreConfirmedStarknetBlockSchema
+            if block_identifier == {"block_id": "pre_confirmed"}
+            else StarknetBlockSchema
+        )
+        if lazy:
+            return _load_block_lazily(schema_class, TypesOfTransactionsSchema, res)
+        return cast(
+            Union[StarknetBlock, PreConfirmedStarknetBlock],
+            load_compiled(schema_class, res),
+        )
 
     async def get_block_with_tx_hashes(
         self,
@@ -185,11 +350,11 @@ class FullNodeClient(Client):
         if block_identifier == {"block_id": "pre_confirmed"}:
             return cast(
                 PreConfirmedStarknetBlockWithTxHashes,
-                PreConfirmedStarknetBlockWithTxHashesSchema().load(res),
+                load_compiled(PreConfirmedStarknetBlockWithTxHashesSchema, res),
             )
         return cast(
             StarknetBlockWithTxHashes,
-            StarknetBlockWithTxHashesSchema().load(res),
+            load_compiled(StarknetBlockWithTxHashesSchema, res),
         )
 
     async def get_block_with_receipts(
@@ -197,7 +362,18 @@ class FullNodeClient(Client):
         block_hash: Optional[Union[Hash, Tag]] = None,
         block_number: Optional[Union[int, Tag]] = None,
         response_flags: Optional[List[TransactionResponseFlag]] = None,
+        lazy: bool = False,
     ) -> Union[StarknetBlockWithReceipts, PreConfirmedStarknetBlockWithReceipts]:
+        """
+        Retrieve the block's data with a list of receipts for contained transactions.
+
+        :param block_hash: Block's hash or literals `"l1_accepted"`, `"pre_confirmed"` or `"latest"`
+        :param block_number: Block's number or literals `"l1_accepted"`, `"pre_confirmed"` or `"latest"`
+        :param response_flags: Flags that control what additional fields are included in transaction responses
+        :param lazy: If ``True``, transactions with receipts are returned as a
+            :class:`~starknet_py.net.lazy_sequence.LazySequence`, decoding every transaction on first access.
+        :return: StarknetBlockWithReceipts object representing retrieved block with transactions.
+        """
         block_identifier = get_block_identifier(
             block_hash=block_hash, block_number=block_number
         )
@@ -212,14 +388,16 @@ class FullNodeClient(Client):
             params=params,
         )
 
-        if block_identifier == {"block_id": "pre_confirmed"}:
-            return cast(
-                PreConfirmedStarknetBlockWithReceipts,
-                PreConfirmedStarknetBlockWithReceiptsSchema().load(res),
-            )
+        schema_class = (
+            PreConfirmedStarknetBlockWithReceiptsSchema
+            if block_identifier == {"block_id": "pre_confirmed"}
+            else StarknetBlockWithReceiptsSchema
+        )
+        if lazy:
+            return _load_block_lazily(schema_class, TransactionWithReceiptSchema, res)
         return cast(
-            StarknetBlockWithReceipts,
-            StarknetBlockWithReceiptsSchema().load(res),
+            Union[StarknetBlockWithReceipts, PreConfirmedStarknetBlockWithReceipts],
+            load_compiled(schema_class, res),
         )
 
     # TODO (#809): add tests with multiple emitted keys
@@ -269,19 +447,12 @@ class FullNodeClient(Client):
         if chunk_size <= 0:
             raise ValueError("Argument chunk_size must be greater than 0.")
 
-        if keys is None:
-            keys = []
-        if address is not None:
-            if isinstance(address, list):
-                address = [_to_rpc_felt(addr) for addr in address]
-            else:
-                address = _to_rpc_felt(address)
+        address, keys = _to_rpc_events_filter(address, keys)
         if from_block_number is None and from_block_hash is None:
             from_block_number = 0
 
         from_block = _get_raw_block_identifier(from_block_hash, from_block_number)
         to_block = _get_raw_block_identifier(to_block_hash, to_block_number)
-        keys = [[_to_rpc_felt(key) for key in inner_list] for inner_list in keys]
 
         events_list = []
         while True:
@@ -299,13 +470,202 @@ class FullNodeClient(Client):
 
         events_response = cast(
             EventsChunk,
-            EventsChunkSchema().load(
-                {"events": events_list, "continuation_token": continuation_token}
+            load_compiled(
+                EventsChunkSchema,
+                {"events": events_list, "continuation_token": continuation_token},
             ),
         )
 
         return events_response
 
+    async def iter_events(
+        self,
+        address: Optional[Union[Hash, List[Hash]]] = None,
+        keys: Optional[List[List[Hash]]] = None,
+        *,
+        from_block_number: Optional[Union[int, Tag]] = None,
+        from_block_hash: Optional[Union[Hash, Tag]] = None,
+        to_block_number: Optional[Union[int, Tag]] = None,
+        to_block_hash: Optional[Union[Hash, Tag]] = None,
+        continuation_token: Optional[str] = None,
+        chunk_size: int = 100,
+    ) -> AsyncIterator[EventsChunk]:
+        # pylint: disable=too-many-arguments
+        """
+        Iterate over pages of events, following continuation tokens until all events are returned.
+
+        The next page is requested only after the previous one is consumed, so the memory usage does not
+        depend on the number of events. To resume the iteration later, persist the ``continuation_token``
+        of the last processed page and pass it along with the same filter.
+
+        :param address: A contract address or a list of addresses from which events should originate.
+        :param keys: List consisting lists of keys by which the events are filtered, as in :meth:`get_events`.
+        :param from_block_number: Number of the block from which events searched for **starts**
+            or literals `"l1_accepted"`, `"pre_confirmed"` or `"latest"`. Mutually exclusive
+            with ``from_block_hash`` parameter.
+            If not provided, query starts from block 0.
+        :param from_block_hash: Hash of the block from which events searched for **starts**
+            or literals `"l1_accepted"`, `"pre_confirmed"` or `"latest"`. Mutually exclusive with
+            ``from_block_number`` parameter.
+            If not provided, query starts from block 0.
+        :param to_block_number: Number of the block to which events searched for **end**
+            or literals `"l1_accepted"`, `"pre_confirmed"` or `"latest"`. Mutually exclusive with
+            ``to_block_hash`` parameter.
+            If not provided, query ends at block `"pre_confirmed"`.
+        :param to_block_hash: Hash of the block to which events searched for **end**
+            or literals `"l1_accepted"`, `"pre_confirmed"` or `"latest"`. Mutually exclusive with
+            ``to_block_number`` parameter.
+            If not provided, query ends at block `"pre_confirmed"`.
+        :param continuation_token: Continuation token from which the iteration starts.
+        :param chunk_size: Number of events in a single page, defaults to 100.
+
+        :return: Asynchronous iterator of ``EventsChunk`` dataclasses, each with the continuation token
+            pointing to the next page.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Argument chunk_size must be greater than 0.")
+
+        address, keys = _to_rpc_events_filter(address, keys)
+        if from_block_number is None and from_block_hash is None:
+            from_block_number = 0
+
+        from_block = _get_raw_block_identifier(from_block_hash, from_block_number)
+        to_block = _get_raw_block_identifier(to_block_hash, to_block_number)
+
+        while True:
+            events, continuation_token = await self._get_events_chunk(
+                from_block=from_block,
+                to_block=to_block,
+                address=address,
+                keys=keys,
+                chunk_size=chunk_size,
+                continuation_token=continuation_token,
+            )
+            yield cast(
+                EventsChunk,
+                load_compiled(
+                    EventsChunkSchema,
+                    {"events": events, "continuation_token": continuation_token},
+                ),
+            )
+            if continuation_token is None:
+                return
+
+    async def get_events_in_parallel(
+        self,
+        address: Optional[Union[Hash, List[Hash]]] = None,
+        keys: Optional[List[List[Hash]]] = None,
+        *,
+        from_block_number: int = 0,
+        to_block_number: Optional[int] = None,
+        blocks_per_shard: int = 1000,
+        max_concurrency: int = 8,
+        chunk_size: int = 100,
+        max_chunk_size: int = 1000,
+    ) -> EventsChunk:
+        # pylint: disable=too-many-arguments
+        """
+        Collect all events emitted in the range of blocks, fetching its parts concurrently.
+
+        The range is split into shards of ``blocks_per_shard`` blocks. Up to ``max_concurrency`` shards are
+        fetched at once, each following its continuation tokens. The page size grows from ``chunk_size``
+        up to ``max_chunk_size`` in shards with many events, and is reduced if the node rejects it as too big.
+        The events are returned in the order they were emitted, like in :meth:`get_events`.
+
+        :param address: A contract address or a list of addresses from which events should originate.
+        :param keys: List consisting lists of keys by which the events are filtered, as in :meth:`get_events`.
+        :param from_block_number: Number of the first block of the range, defaults to 0.
+        :param to_block_number: Number of the last block of the range. If not provided, the latest block is used.
+        :param blocks_per_shard: Number of blocks in a part of the range fetched by a single task.
+        :param max_concurrency: Maximal number of shards fetched at the same time.
+        :param chunk_size: Initial number of events returned by one ``starknet_getEvents`` request.
+        :param max_chunk_size: Maximal number of events returned by one ``starknet_getEvents`` request.
+
+        :return: ``EventsChunk`` dataclass containing all the events, without a continuation token.
+        """
+        if blocks_per_shard <= 0:
+            raise ValueError("Argument blocks_per_shard must be greater than 0.")
+        if max_concurrency <= 0:
+            raise ValueError("Argument max_concurrency must be greater than 0.")
+        if not 0 < chunk_size <= max_chunk_size:
+            raise ValueError(
+                "Argument chunk_size must be greater than 0 and not greater than max_chunk_size."
+            )
+
+        if to_block_number is None:
+            to_block_number = await self.get_block_number()
+        address, keys = _to_rpc_events_filter(address, keys)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get_shard_events(first_block: int, last_block: int) -> list:
+            async with semaphore:
+                return await self._get_events_in_block_range(
+                    first_block=first_block,
+                    last_block=last_block,
+                    address=address,
+                    keys=keys,
+                    chunk_size=chunk_size,
+                    max_chunk_size=max_chunk_size,
+                )
+
+        tasks = [
+            asyncio.ensure_future(
+                get_shard_events(
+                    first_block,
+                    min(first_block + blocks_per_shard - 1, to_block_number),
+                )
+            )
+            for first_block in range(
+                from_block_number, to_block_number + 1, blocks_per_shard
+            )
+        ]
+        try:
+            shards_events = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        # Shards are consecutive, so concatenating them preserves the order of events
+        events_list = [event for events in shards_events for event in events]
+        return cast(
+            EventsChunk, load_compiled(EventsChunkSchema, {"events": events_list})
+        )
+
+    async def _get_events_in_block_range(
+        self,
+        first_block: int,
+        last_block: int,
+        keys: List[List[Hash]],
+        chunk_size: int,
+        max_chunk_size: int,
+        address: Optional[Union[Hash, List[Hash]]] = None,
+    ) -> list:
+        # pylint: disable=too-many-arguments
+        events_list = []
+        continuation_token = None
+        while True:
+            try:
+                events, continuation_token = await self._get_events_chunk(
+                    from_block={"block_number": first_block},
+                    to_block={"block_number": last_block},
+                    address=address,
+                    keys=keys,
+                    chunk_size=chunk_size,
+                    continuation_token=continuation_token,
+                )
+            except ClientError as err:
+                if err.code != RPC_PAGE_SIZE_TOO_BIG_ERROR or chunk_size == 1:
+                    raise
+                chunk_size = max_chunk_size = max(chunk_size // 2, 1)
+                continue
+
+            events_list.extend(events)
+            if continuation_token is None:
+                return events_list
+            chunk_size = min(chunk_size * 2, max_chunk_size)
+
     async def _get_events_chunk(
         self,
         from_block: Union[dict, Hash, Tag, None],
@@ -360,9 +720,42 @@ class FullNodeClient(Client):
         if block_identifier == {"block_id": "pre_confirmed"}:
             return cast(
                 PreConfirmedBlockStateUpdate,
-                PreConfirmedBlockStateUpdateSchema().load(res),
+                load_compiled(PreConfirmedBlockStateUpdateSchema, res),
+            )
+        return cast(BlockStateUpdate, load_compiled(BlockStateUpdateSchema, res))
+
+    async def iter_storage_diffs(
+        self,
+        block_hash: Optional[Union[Hash, Tag]] = None,
+        block_number: Optional[Union[int, Tag]] = None,
+        contract_addresses: Optional[List[Hash]] = None,
+    ) -> AsyncIterator[StorageDiffItem]:
+        """
+        Iterate over the storage diffs of the state update, decoding them while the response is being received.
+        Memory usage is bounded by the size of a single storage diff, rather than the size of the state update.
+
+        :param block_hash: Block's hash or literals `"pre_confirmed"` or `"latest"`
+        :param block_number: Block's number or literals `"pre_confirmed"` or `"latest"`
+        :param contract_addresses: Addresses of the contracts to which the state update is limited.
+        :return: Asynchronous iterator of ``StorageDiffItem`` dataclasses.
+        """
+        params = get_block_identifier(block_hash=block_hash, block_number=block_number)
+        if contract_addresses:
+            params["contract_addresses"] = [
+                _to_rpc_felt(addr) for addr in contract_addresses
+            ]
+
+        async with aclosing(
+            self._client.stream(
+                method_name="getStateUpdate",
+                params=params,
+                path=["state_diff", "storage_diffs"],
             )
-        return cast(BlockStateUpdate, BlockStateUpdateSchema().load(res))
+        ) as storage_diffs:
+            async for storage_diff in storage_diffs:
+                yield cast(
+                    StorageDiffItem, load_compiled(StorageDiffSchema, storage_diff)
+                )
 
     async def get_storage_at(
         self,
@@ -469,7 +862,7 @@ class FullNodeClient(Client):
         except ClientError as ex:
             raise TransactionNotReceivedError() from ex
 
-        return cast(Transaction, TypesOfTransactionsSchema().load(res))
+        return cast(Transaction, load_compiled(TypesOfTransactionsSchema, res))
 
     async def get_l1_message_hash(self, tx_hash: Hash) -> Hash:
         """
@@ -495,7 +888,7 @@ class FullNodeClient(Client):
 
         return cast(
             TransactionReceiptWithBlockInfo,
-            TransactionReceiptWithBlockInfoSchema().load(res),
+            load_compiled(TransactionReceiptWithBlockInfoSchema, res),
         )
 
     async def estimate_fee(
@@ -528,7 +921,7 @@ class FullNodeClient(Client):
 
         return cast(
             EstimatedFee,
-            EstimatedFeeSchema().load(res, many=not single_transaction),
+            load_compiled(EstimatedFeeSchema, res, many=not single_transaction),
         )
 
     async def estimate_message_fee(
@@ -575,7 +968,7 @@ class FullNodeClient(Client):
                     **block_identifier,
                 },
             )
-            return cast(EstimatedFee, EstimatedFeeSchema().load(res))
+            return cast(EstimatedFee, load_compiled(EstimatedFeeSchema, res))
         except ClientError as err:
             if err.code == RPC_CONTRACT_ERROR:
                 raise ClientError(
@@ -749,7 +1142,7 @@ class FullNodeClient(Client):
             method_name="getTransactionByBlockIdAndIndex",
             params=params,
         )
-        return cast(Transaction, TypesOfTransactionsSchema().load(res))
+        return cast(Transaction, load_compiled(TypesOfTransactionsSchema, res))
 
     async def get_block_transaction_count(
         self,
@@ -876,7 +1269,7 @@ class FullNodeClient(Client):
                 "transaction_hash": _to_rpc_felt(tx_hash),
             },
         )
-        return cast(TransactionTrace, TransactionTraceSchema().load(res))
+        return cast(TransactionTrace, load_compiled(TransactionTraceSchema, res))
 
     async def simulate_transactions(
         self,
@@ -937,11 +1330,11 @@ class FullNodeClient(Client):
         if isinstance(res, dict):
             return cast(
                 SimulatedTransactionsWithInitialReads,
-                SimulatedTransactionsWithInitialReadsSchema().load(res),
+                load_compiled(SimulatedTransactionsWithInitialReadsSchema, res),
             )
         return cast(
             List[SimulatedTransaction],
-            SimulatedTransactionSchema().load(res, many=True),
+            load_compiled(SimulatedTransactionSchema, res, many=True),
         )
 
     async def trace_block_transactions(
@@ -949,6 +1342,7 @@ class FullNodeClient(Client):
         block_hash: Optional[Union[Hash, LatestTag]] = None,
         block_number: Optional[Union[int, LatestTag]] = None,
         trace_flags: Optional[List[TraceFlag]] = None,
+        lazy: bool = False,
     ) -> Union[List[BlockTransactionTrace], BlockTransactionTracesWithInitialReads]:
         """
         Retrieve traces for all transactions in the given block.
@@ -956,6 +1350,8 @@ class FullNodeClient(Client):
         :param block_hash: Block's hash or literals `"pre_confirmed"`.
         :param block_number: Block's number or literals `"pre_confirmed"`.
         :param trace_flags: Flags that indicate when additional information should be included in the trace
+        :param lazy: If ``True``, traces are returned as a :class:`~starknet_py.net.lazy_sequence.LazySequence`,
+            decoding every trace on first access.
         :return: List of execution traces of all transactions included in the given block with transaction hashes.
         """
         block_identifier = get_block_identifier(
@@ -971,11 +1367,81 @@ class FullNodeClient(Client):
             params=params,
         )
         if isinstance(res, dict):
+            if lazy and isinstance(res.get("traces"), list):
+                traces = cast(
+                    BlockTransactionTracesWithInitialReads,
+                    load_compiled(BlockTransactionTracesSchema, {**res, "traces": []}),
+                )
+                traces.transaction_traces = _lazy_sequence(
+                    res["traces"], BlockTransactionTraceSchema
+                )
+                return traces
             return cast(
                 BlockTransactionTracesWithInitialReads,
-                BlockTransactionTracesSchema().load(res),
+                load_compiled(BlockTransactionTracesSchema, res),
             )
+        if lazy and isinstance(res, list):
+            return _lazy_sequence(res, BlockTransactionTraceSchema)
         return cast(
             List[BlockTransactionTrace],
-            BlockTransactionTraceSchema().load(res, many=True),
+            load_compiled(BlockTransactionTraceSchema, res, many=True),
+        )
+
+    async def iter_block_transaction_traces(
+        self,
+        block_hash: Optional[Union[Hash, LatestTag]] = None,
+        block_number: Optional[Union[int, LatestTag]] = None,
+    ) -> AsyncIterator[BlockTransactionTrace]:
+        """
+        Iterate over traces of all transactions in the given block, decoding them while the response
+        is being received. Memory usage is bounded by the size of a single trace, rather than the size of
+        all traces of the block.
+
+        :param block_hash: Block's hash or literal `"latest"`.
+        :param block_number: Block's number or literal `"latest"`.
+        :return: Asynchronous iterator of execution traces with transaction hashes.
+        """
+        block_identifier = get_block_identifier(
+            block_hash=block_hash, block_number=block_number, allow_pre_confirmed=False
         )
+
+        async with aclosing(
+            self._client.stream(
+                method_name="traceBlockTransactions", params=block_identifier
+            )
+        ) as traces:
+            async for trace in traces:
+                yield cast(
+                    BlockTransactionTrace,
+                    load_compiled(BlockTransactionTraceSchema, trace),
+                )
+
+
+def _lazy_sequence(raw_items: list, schema_class: Type[Schema]) -> Any:
+    # Returned in place of lists of the models, which it replicates for reading
+    return LazySequence(raw_items, functools.partial(load_compiled, schema_class))
+
+
+def _load_block_lazily(
+    schema_class: Type[Schema], transaction_schema_class: Type[Schema], res: Any
+) -> Any:
+    if not isinstance(res, dict) or not isinstance(res.get("transactions"), list):
+        # Loaded eagerly, so the errors of invalid responses are raised
+        return load_compiled(schema_class, res)
+
+    block = load_compiled(schema_class, {**res, "transactions": []})
+    block.transactions = _lazy_sequence(res["transactions"], transaction_schema_class)
+    return block
+
+
+def _to_rpc_events_filter(
+    address: Optional[Union[Hash, List[Hash]]],
+    keys: Optional[List[List[Hash]]],
+) -> Tuple[Optional[Union[Hash, List[Hash]]], List[List[Hash]]]:
+    if address is not None:
+        if isinstance(address, list):
+            address = [_to_rpc_felt(addr) for addr in address]
+        else:
+            address = _to_rpc_felt(address)
+    rpc_keys = [[_to_rpc_felt(key) for key in inner_list] for inner_list in keys or []]
+    return address, rpc_keys
@@ -1,12 +1,25 @@
 import warnings
 from abc import ABC, abstractmethod
+from contextlib import aclosing, nullcontext
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncGenerator, Dict, List, Optional, Sequence, Tuple, Union
 
-from aiohttp import ClientResponse, ClientSession
+from aiohttp import ClientResponse, ClientSession, ClientTimeout
 
 from starknet_py.constants import EXPECTED_RPC_VERSION
-from starknet_py.net.client_errors import ClientError
+from starknet_py.net.client_errors import ClientError, HttpStatusError
+from starknet_py.net.json_codec import JsonCodec, get_default_json_codec
+from starknet_py.net.json_stream import IncrementalJsonParser
+from starknet_py.net.managed_session import ManagedSession
+from starknet_py.net.rate_limiter import RateLimiter
+from starknet_py.net.request_coalescer import CoalescingConfig, RequestCoalescer
+from starknet_py.net.response_cache import ResponseCache, is_cacheable
+from starknet_py.net.retry_policy import RetryPolicy
+from starknet_py.net.rpc_batch import get_active_batch
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class HttpMethod(Enum):
@@ -15,9 +28,19 @@ class HttpMethod(Enum):
 
 
 class HttpClient(ABC):
-    def __init__(self, url, session: Optional[ClientSession] = None):
+    def __init__(
+        self,
+        url,
+        session: Optional[ClientSession] = None,
+        managed_session: Optional[ManagedSession] = None,
+        json_codec: Optional[JsonCodec] = None,
+    ):
         self.url = url
         self.session = session
+        self.managed_session = managed_session
+        self.json_codec = (
+            json_codec if json_codec is not None else get_default_json_codec()
+        )
 
     async def request(
         self,
@@ -25,16 +48,45 @@ class HttpClient(ABC):
         http_method: HttpMethod,
         params: Optional[dict] = None,
         payload: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+        timeout: Optional[float] = None,
     ):
+        # pylint: disable=too-many-arguments
+        body = await self.request_raw(
+            address=address,
+            http_method=http_method,
+            params=params,
+            payload=payload,
+            timeout=timeout,
+        )
+        return self.json_codec.loads(body) if body.strip() else None
+
+    async def request_raw(
+        self,
+        address: str,
+        http_method: HttpMethod,
+        params: Optional[dict] = None,
+        payload: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        """
+        Send the request and return the body of the response without decoding it.
+        """
+        # pylint: disable=too-many-arguments
         kwargs = {
             "address": address,
             "http_method": http_method,
             "params": params,
             "payload": payload,
+            "timeout": timeout,
         }
         if self.session:
             return await self._make_request(session=self.session, **kwargs)
 
+        if self.managed_session is not None:
+            session = await self.managed_session.get()
+            if session is not None:
+                return await self._make_request(session=session, **kwargs)
+
         async with ClientSession() as session:
             return await self._make_request(session=session, **kwargs)
 
@@ -45,13 +97,80 @@ class HttpClient(ABC):
         http_method: HttpMethod,
         params: dict,
         payload: dict,
-    ) -> dict:
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        # pylint: disable=too-many-arguments
+        # Without the timeout argument, aiohttp applies the timeout of the session
+        timeout_kwargs = (
+            {"timeout": ClientTimeout(total=timeout)} if timeout is not None else {}
+        )
+        # Compressed responses are decompressed by aiohttp, which negotiates gzip and deflate
+        # (and br or zstd, when their libraries are installed) with the Accept-Encoding header
+        async with session.request(
+            method=http_method.value,
+            url=address,
+            params=params,
+            data=self.json_codec.dumps(payload) if payload is not None else None,
+            headers=_JSON_HEADERS if payload is not None else None,
+            **timeout_kwargs,
+        ) as request:
+            await self.handle_request_error(request)
+            return await request.read()
+
+    async def request_stream(
+        self,
+        address: str,
+        http_method: HttpMethod,
+        params: Optional[dict] = None,
+        payload: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Send the request and iterate over the parts of the body of the response, as they are received.
+        """
+        kwargs = {
+            "address": address,
+            "http_method": http_method,
+            "params": params,
+            "payload": payload,
+        }
+        session = self.session
+        if session is None and self.managed_session is not None:
+            session = await self.managed_session.get()
+
+        if session is not None:
+            async with aclosing(
+                self._stream_request(session=session, **kwargs)
+            ) as chunks:
+                async for chunk in chunks:
+                    yield chunk
+            return
+
+        async with ClientSession() as session:
+            async with aclosing(
+                self._stream_request(session=session, **kwargs)
+            ) as chunks:
+                async for chunk in chunks:
+                    yield chunk
+
+    async def _stream_request(
+        self,
+        session: ClientSession,
+        address: str,
+        http_method: HttpMethod,
+        params: Optional[dict],
+        payload: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]],
+    ) -> AsyncGenerator[bytes, None]:
         # pylint: disable=too-many-arguments
         async with session.request(
-            method=http_method.value, url=address, params=params, json=payload
+            method=http_method.value,
+            url=address,
+            params=params,
+            data=self.json_codec.dumps(payload) if payload is not None else None,
+            headers=_JSON_HEADERS if payload is not None else None,
         ) as request:
             await self.handle_request_error(request)
-            return await request.json(content_type=None)
+            async for chunk in request.content.iter_any():
+                yield chunk
 
     @abstractmethod
     async def handle_request_error(self, request: ClientResponse):
@@ -66,28 +185,203 @@ class RpcHttpClient(HttpClient):
         url,
         session: Optional[ClientSession] = None,
         method_prefix: str = "starknet",
+        coalescing: Optional[CoalescingConfig] = None,
+        managed_session: Optional[ManagedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        json_codec: Optional[JsonCodec] = None,
     ):
-        super().__init__(url, session)
+        # pylint: disable=too-many-arguments
+        super().__init__(url, session, managed_session, json_codec)
         self.method_prefix = method_prefix
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
         self._is_spec_version_verified: bool = False
+        self._coalescer = (
+            RequestCoalescer(http_client=self, config=coalescing)
+            if coalescing is not None
+            else None
+        )
 
     async def call(self, method_name: str, params: Optional[dict] = None):
+        if self.response_cache is None:
+            return await self._dispatch(method_name=method_name, params=params)
+
+        key = self.response_cache.get_key(
+            url=self.url,
+            method_name=f"{self.method_prefix}_{method_name}",
+            params=params,
+        )
+        result = await self.response_cache.get_async(key)
+        if result is not None:
+            return result
+
+        result = await self._dispatch(method_name=method_name, params=params)
+        if is_cacheable(method_name=method_name, params=params, result=result):
+            await self.response_cache.put_async(key, result)
+        return result
+
+    async def _dispatch(self, method_name: str, params: Optional[dict] = None):
+        batch = get_active_batch(self)
+        if batch is not None:
+            return await batch.enqueue(method_name=method_name, params=params)
+
+        if self._coalescer is not None:
+            return await self._coalescer.call(method_name=method_name, params=params)
+
+        return await self.send_single(method_name=method_name, params=params)
+
+    async def send_single(self, method_name: str, params: Optional[dict] = None):
+        """
+        Send a single JSON-RPC call to the node, bypassing batching and coalescing.
+        """
+        await self._warn_if_incompatible_rpc_version()
+
+        payload = self._create_payload(method_name=method_name, params=params)
+
+        result = await self._post(payload=payload, method_names=[method_name])
+
+        return self.get_rpc_result(result)
+
+    async def send_raw(self, method_name: str, params: Optional[dict] = None) -> bytes:
+        """
+        Send a single JSON-RPC call to the node and return the body of the response without decoding it.
+        Errors returned by the node are not raised, as the response is not parsed.
+        """
+        await self._warn_if_incompatible_rpc_version()
+
+        payload = self._create_payload(method_name=method_name, params=params)
+
+        return await self._post(payload=payload, method_names=[method_name], raw=True)
+
+    async def stream(
+        self,
+        method_name: str,
+        params: Optional[dict] = None,
+        path: Sequence[str] = (),
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Send a single JSON-RPC call to the node and iterate over the items of an array in its result,
+        decoding them while the response is being received. Only a single item is kept in memory at a time.
+
+        The call is not batched, coalesced, cached or retried.
+
+        :param method_name: Name of the method without the ``starknet_`` prefix.
+        :param params: Parameters of the call.
+        :param path: Keys leading from the result to the array, e.g. ``["state_diff", "storage_diffs"]``.
+            Empty path means the result is the array.
+        :raises ClientError: when the node returned an error for the request.
+        :raises ServerError: when the response contains neither a result nor an error.
+        """
+        await self._warn_if_incompatible_rpc_version()
+
+        payload = self._create_payload(method_name=method_name, params=params)
+        parser = IncrementalJsonParser(path=["result", *path])
+
+        admission = (
+            self.rate_limiter.acquire([method_name])
+            if self.rate_limiter is not None
+            else nullcontext()
+        )
+        # Closing the stream right away releases the response and the admission when iteration stops early
+        async with admission, aclosing(
+            self.request_stream(
+                address=self.url, http_method=HttpMethod.POST, payload=payload
+            )
+        ) as chunks:
+            async for chunk in chunks:
+                for item in parser.feed(chunk):
+                    yield item
+        parser.close()
+
+        if not parser.is_array_found:
+            self.handle_rpc_error(parser.members)
+
+    async def call_batch(
+        self, calls: List[Tuple[str, Optional[dict]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several JSON-RPC calls to the node in a single HTTP request.
+
+        :param calls: List of ``(method_name, params)`` pairs.
+        :return: Raw JSON-RPC response objects, in the same order as ``calls``.
+            Use :meth:`get_rpc_result` to extract the result or raise the error of a single entry.
+        """
         await self._warn_if_incompatible_rpc_version()
 
-        payload = {
+        payload = [
+            self._create_payload(
+                method_name=method_name, params=params, request_id=request_id
+            )
+            for request_id, (method_name, params) in enumerate(calls)
+        ]
+
+        response = await self._post(
+            payload=payload, method_names=[method_name for method_name, _ in calls]
+        )
+
+        # Nodes respond with a single error object when the whole batch is rejected
+        if not isinstance(response, list):
+            self.handle_rpc_error(response)
+
+        responses_by_id = {
+            entry.get("id"): entry for entry in response if isinstance(entry, dict)
+        }
+        return [
+            responses_by_id.get(request_id, {"id": request_id})
+            for request_id in range(len(calls))
+        ]
+
+    async def _post(
+        self,
+        payload: Union[Dict[str, Any], List[Dict[str, Any]]],
+        method_names: List[str],
+        raw: bool = False,
+    ) -> Any:
+        request = self.request_raw if raw else self.request
+
+        async def send(timeout: Optional[float]):
+            admission = (
+                self.rate_limiter.acquire(method_names)
+                if self.rate_limiter is not None
+                else nullcontext()
+            )
+            async with admission:
+                return await request(
+                    http_method=HttpMethod.POST,
+                    address=self.url,
+                    payload=payload,
+                    timeout=timeout,
+                )
+
+        if self.retry_policy is None:
+            return await send(None)
+        return await self.retry_policy.execute(send, method_names=method_names)
+
+    def _create_payload(
+        self, method_name: str, params: Optional[dict] = None, request_id: int = 0
+    ) -> Dict[str, Any]:
+        return {
             "jsonrpc": "2.0",
             "method": f"{self.method_prefix}_{method_name}",
-            "id": 0,
+            "id": request_id,
             "params": params if params else [],
         }
 
-        result = await self.request(
-            http_method=HttpMethod.POST, address=self.url, payload=payload
-        )
+    @classmethod
+    def get_rpc_result(cls, response: dict) -> Any:
+        """
+        Extract the result from a JSON-RPC response object.
 
-        if "result" not in result:
-            self.handle_rpc_error(result)
-        return result["result"]
+        :param response: JSON-RPC response object.
+        :raises ClientError: when the node returned an error for the request.
+        :raises ServerError: when the response contains neither a result nor an error.
+        """
+        if "result" not in response:
+            cls.handle_rpc_error(response)
+        return response["result"]
 
     @staticmethod
     def handle_rpc_error(result: dict):
@@ -110,9 +404,7 @@ class RpcHttpClient(HttpClient):
                 "id": 0,
             }
 
-            res = await self.request(
-                http_method=HttpMethod.POST, address=self.url, payload=payload
-            )
+            res = await self._post(payload=payload, method_names=["specVersion"])
             spec_version = res["result"]
 
             if spec_version != EXPECTED_RPC_VERSION:
@@ -127,7 +419,30 @@ class RpcHttpClient(HttpClient):
 
 async def basic_error_handle(request: ClientResponse):
     if request.status >= 300:
-        raise ClientError(code=str(request.status), message=await request.text())
+        raise HttpStatusError(
+            status=request.status,
+            message=await request.text(),
+            retry_after=_parse_retry_after(request.headers.get("Retry-After")),
+        )
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse the ``Retry-After`` header given either as a number of seconds or as an HTTP date.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
 
 
 class ServerError(Exception):
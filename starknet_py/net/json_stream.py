@@ -0,0 +1,273 @@
+import codecs
+import json
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+_SKIPPED = re.compile(r'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+_SCALAR_END = re.compile(r"[,\]} \t\n\r]")
+
+# States of the parser, outside the items and the values it skips or captures
+_EXPECT_CONTAINER = 0
+_EXPECT_KEY = 1
+_EXPECT_COLON = 2
+_EXPECT_VALUE = 3
+_IN_VALUE = 4
+_EXPECT_ITEM = 5
+_IN_ITEM = 6
+_EXPECT_SEPARATOR = 7
+_DONE = 8
+
+
+class IncrementalJsonParser:
+    """
+    Parser decoding items of an array nested in a JSON document, while the document is being received.
+
+    Only the item being received is buffered, so the memory usage is bounded by the size of a single item
+    rather than the size of the document. Members of the top-level object which are not on the ``path``
+    (e.g. ``"error"`` of a JSON-RPC response) are available in :attr:`members`, other values are skipped
+    without being decoded.
+
+    .. code-block:: python
+
+        parser = IncrementalJsonParser(path=["result", "state_diff", "storage_diffs"])
+        async for chunk in response.content.iter_any():
+            for storage_diff in parser.feed(chunk):
+                ...
+        parser.close()
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, path: Sequence[str]):
+        """
+        :param path: Keys of the objects leading to the array, e.g. ``["result", "traces"]``.
+            Empty path means the document is the array.
+        """
+        self.path = list(path)
+
+        self._members: Dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _EXPECT_CONTAINER
+        # Depth of the objects on the path, the array is at depth equal to the length of the path
+        self._level = 0
+        self._key: Optional[str] = None
+        self._is_first = True
+        self._is_array_found = False
+        self._value_start: Optional[int] = None
+        self._value_depth = 0
+
+    @property
+    def members(self) -> Dict[str, Any]:
+        """
+        Decoded members of the top-level object, other than the first key of the path.
+        """
+        return self._members
+
+    @property
+    def is_array_found(self) -> bool:
+        """
+        ``True`` if the array at the ``path`` was found in the document.
+        """
+        return self._is_array_found
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Parse the next part of the document.
+
+        :param chunk: Next bytes of the document.
+        :return: Items of the array completed by the chunk.
+        :raises json.JSONDecodeError: when the document is not valid JSON.
+        """
+        # Text parsed already is dropped, except for the value which is still being received
+        keep_from = self._pos if self._value_start is None else self._value_start
+        self._buffer = self._buffer[keep_from:] + self._text_decoder.decode(chunk)
+        self._pos -= keep_from
+        if self._value_start is not None:
+            self._value_start -= keep_from
+
+        items: List[Any] = []
+        while self._step(items):
+            pass
+        return items
+
+    def close(self):
+        """
+        Check that the whole document was parsed.
+
+        :raises json.JSONDecodeError: when the document is truncated or not valid JSON.
+        """
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        if self._state != _DONE:
+            self._raise("Unexpected end of document")
+        if _WHITESPACE.match(self._buffer, self._pos).end() != len(self._buffer):
+            self._raise("Extra data")
+
+    def _step(self, items: List[Any]) -> bool:
+        # Advances the parser, returns False when more data is needed
+        # pylint: disable=too-many-branches, too-many-return-statements, too-many-statements
+        if self._state == _IN_ITEM:
+            if not self._scan_value():
+                return False
+            items.append(self._decode(self._value_start, self._pos))
+            self._finish_value()
+            return True
+
+        if self._state == _IN_VALUE:
+            if not self._scan_value():
+                return False
+            if self._value_start is not None:
+                assert self._key is not None
+                self._members[self._key] = self._decode(self._value_start, self._pos)
+            self._finish_value()
+            return True
+
+        if self._state == _DONE:
+            return False
+
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        if self._pos == len(self._buffer):
+            return False
+        char = self._buffer[self._pos]
+
+        if self._state == _EXPECT_CONTAINER:
+            is_object = self._level < len(self.path)
+            if char != ("{" if is_object else "["):
+                self._raise("Expecting object" if is_object else "Expecting array")
+            self._pos += 1
+            self._is_first = True
+            self._is_array_found = self._is_array_found or not is_object
+            self._state = _EXPECT_KEY if is_object else _EXPECT_ITEM
+            return True
+
+        if self._state == _EXPECT_KEY:
+            if char == "}" and self._is_first:
+                self._close_container()
+                return True
+            if char != '"':
+                self._raise("Expecting property name enclosed in double quotes")
+            match = _STRING.match(self._buffer, self._pos)
+            if match is None:
+                return False
+            self._key = self._decode(self._pos, match.end())
+            self._pos = match.end()
+            self._state = _EXPECT_COLON
+            return True
+
+        if self._state == _EXPECT_COLON:
+            if char != ":":
+                self._raise("Expecting ':' delimiter")
+            self._pos += 1
+            self._state = _EXPECT_VALUE
+            return True
+
+        if self._state == _EXPECT_VALUE:
+            if self._key == self.path[self._level]:
+                self._level += 1
+                self._state = _EXPECT_CONTAINER
+            else:
+                self._start_value(capture=self._level == 0)
+                self._state = _IN_VALUE
+            return True
+
+        if self._state == _EXPECT_ITEM:
+            if char == "]" and self._is_first:
+                self._close_container()
+                return True
+            # Items received whole are decoded right away, others are scanned until they are received
+            try:
+                item, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                end = None
+            # Number decoded from a prefix, e.g. "1" of "1.5e3", may continue in the next chunk
+            if end is None or (
+                _is_number(item)
+                and (end == len(self._buffer) or self._buffer[end] in ".eE+-")
+            ):
+                self._start_value(capture=True)
+                self._state = _IN_ITEM
+                return True
+            items.append(item)
+            self._pos = end
+            self._state = _EXPECT_SEPARATOR
+            return True
+
+        # _EXPECT_SEPARATOR
+        closing = "}" if self._level < len(self.path) else "]"
+        if char == closing:
+            self._close_container()
+        elif char == ",":
+            self._pos += 1
+            self._is_first = False
+            self._state = _EXPECT_KEY if self._level < len(self.path) else _EXPECT_ITEM
+        else:
+            self._raise(f"Expecting ',' delimiter or '{closing}'")
+        return True
+
+    def _start_value(self, capture: bool):
+        self._value_start = self._pos if capture else None
+        self._value_depth = 0
+
+    def _finish_value(self):
+        self._value_start = None
+        self._state = _EXPECT_SEPARATOR
+
+    def _close_container(self):
+        self._pos += 1
+        if self._level == 0:
+            self._state = _DONE
+            return
+        self._level -= 1
+        self._state = _EXPECT_SEPARATOR
+
+    def _scan_value(self) -> bool:
+        # Moves to the end of the value, returns False if it is not received yet
+        buffer = self._buffer
+        if self._value_depth == 0:
+            char = buffer[self._pos]
+            if char == '"':
+                match = _STRING.match(buffer, self._pos)
+                if match is None:
+                    return False
+                self._pos = match.end()
+                return True
+            if char not in "[{":
+                match = _SCALAR_END.search(buffer, self._pos)
+                if match is None:
+                    return False
+                if match.start() == self._pos:
+                    self._raise("Expecting value")
+                self._pos = match.start()
+                return True
+            self._value_depth = 1
+            self._pos += 1
+
+        # Strings and scalars between the brackets are skipped in one match, so only brackets are counted
+        depth = self._value_depth
+        pos = self._pos
+        while depth > 0:
+            pos = _SKIPPED.match(buffer, pos).end()
+            # Either the end of the buffer or a string which is not received yet
+            if pos == len(buffer) or buffer[pos] == '"':
+                break
+            depth += 1 if buffer[pos] in "[{" else -1
+            pos += 1
+
+        self._pos = pos
+        self._value_depth = depth
+        return depth == 0
+
+    def _decode(self, start: Optional[int], end: int) -> Any:
+        assert start is not None
+        return self._decoder.decode(self._buffer[start:end])
+
+    def _raise(self, message: str):
+        raise json.JSONDecodeError(message, self._buffer, self._pos)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
@@ -0,0 +1,81 @@
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    overload,
+)
+
+T = TypeVar("T")
+
+
+class LazySequence(Sequence[T]):
+    """
+    Sequence of items decoded from the raw RPC response on first access.
+
+    Every item is decoded at most once, so code touching only a part of a large response
+    (e.g. a few transactions of a block) pays only for decoding that part. Raw items are available
+    in :attr:`raw_items`, so they can be filtered without decoding.
+
+    Invalid items raise :class:`marshmallow.ValidationError` when they are accessed.
+    """
+
+    def __init__(self, raw_items: List[Any], decode: Callable[[Any], T]):
+        """
+        :param raw_items: Items of the RPC response.
+        :param decode: Function decoding a raw item.
+        """
+        self._raw_items = raw_items
+        self._decode = decode
+        self._items: List[Optional[T]] = [None] * len(raw_items)
+
+    @property
+    def raw_items(self) -> List[Any]:
+        """
+        Items of the RPC response, as returned by the node.
+        """
+        return self._raw_items
+
+    @property
+    def decoded_count(self) -> int:
+        """
+        Number of items decoded so far.
+        """
+        return sum(item is not None for item in self._items)
+
+    def __len__(self) -> int:
+        return len(self._raw_items)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        item = self._items[index]
+        if item is None:
+            item = self._decode(self._raw_items[index])
+            self._items[index] = item
+        return item
+
+    def __iter__(self) -> Iterator[T]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            item == other_item for item, other_item in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        return repr(list(self))
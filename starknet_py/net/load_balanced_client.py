@@ -0,0 +1,419 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from contextlib import aclosing
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+import aiohttp
+
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.http_client import RpcHttpClient
+from starknet_py.net.json_codec import JsonCodec
+from starknet_py.net.managed_session import ConnectionPoolConfig
+from starknet_py.net.rate_limiter import RateLimiter
+from starknet_py.net.request_coalescer import CoalescingConfig
+from starknet_py.net.response_cache import ResponseCache
+from starknet_py.net.retry_policy import NON_IDEMPOTENT_METHODS, RetryPolicy
+from starknet_py.utils.sync import add_sync_methods
+
+T = TypeVar("T")
+
+_sticky_backends: ContextVar[
+    Mapping[LoadBalancedRpcHttpClient, Tuple[Backend, float]]
+] = ContextVar("_sticky_backends", default=MappingProxyType({}))
+
+
+class LoadBalancingStrategy(Enum):
+    """
+    Strategy of selecting the node a call is sent to.
+    """
+
+    ROUND_ROBIN = "ROUND_ROBIN"
+    """Nodes are selected in turns."""
+
+    LEAST_OUTSTANDING = "LEAST_OUTSTANDING"
+    """The node with the least requests in progress is selected."""
+
+    LATENCY_WEIGHTED = "LATENCY_WEIGHTED"
+    """Nodes are selected randomly, with probability inversely proportional to their average latency."""
+
+
+@dataclass
+class Backend:
+    """
+    State of a single node used by the load balanced client.
+    """
+
+    http_client: RpcHttpClient
+    outstanding_requests: int = 0
+    latency: Optional[float] = None
+    """Exponentially weighted moving average of the latency of requests, in seconds."""
+    block_number: Optional[int] = None
+    """Block number reported by the node during the last health check."""
+    is_lagging: bool = False
+    ejected_until: float = 0.0
+
+    @property
+    def url(self) -> str:
+        return self.http_client.url
+
+    def is_available(self, now: float) -> bool:
+        return not self.is_lagging and now >= self.ejected_until
+
+
+class LoadBalancedRpcHttpClient(RpcHttpClient):
+    """
+    RpcHttpClient distributing calls between several nodes.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        backends: List[RpcHttpClient],
+        strategy: LoadBalancingStrategy = LoadBalancingStrategy.LEAST_OUTSTANDING,
+        max_block_lag: int = 3,
+        health_check_interval: Optional[float] = 30.0,
+        failure_cooldown: float = 5.0,
+        sticky_duration: float = 30.0,
+        latency_ewma_alpha: float = 0.3,
+        coalescing: Optional[CoalescingConfig] = None,
+        response_cache: Optional[ResponseCache] = None,
+    ):
+        # pylint: disable=too-many-arguments
+        if not backends:
+            raise ValueError("At least one backend must be provided.")
+        if not 0 < latency_ewma_alpha <= 1:
+            raise ValueError("Argument latency_ewma_alpha must be in range (0, 1].")
+
+        super().__init__(
+            url=backends[0].url, coalescing=coalescing, response_cache=response_cache
+        )
+        self.backends = [Backend(http_client=client) for client in backends]
+        self.strategy = strategy
+        self.max_block_lag = max_block_lag
+        self.health_check_interval = health_check_interval
+        self.failure_cooldown = failure_cooldown
+        self.sticky_duration = sticky_duration
+        self.latency_ewma_alpha = latency_ewma_alpha
+
+        self._failover_policy = RetryPolicy()
+        self._round_robin_index = 0
+        self._last_health_check: Optional[float] = None
+        self._health_check_tasks: Set[asyncio.Task] = set()
+
+    async def _dispatch(self, method_name: str, params: Optional[dict] = None):
+        # The coalescer routes calls from its own task, so it neither sees the node the caller sticks to
+        # nor records the node a transaction is sent to. Such calls are routed in the task of the caller.
+        if self._coalescer is not None and (
+            method_name in NON_IDEMPOTENT_METHODS
+            or self._get_sticky_backend(time.monotonic()) is not None
+        ):
+            return await self.send_single(method_name=method_name, params=params)
+        return await super()._dispatch(method_name=method_name, params=params)
+
+    async def send_single(self, method_name: str, params: Optional[dict] = None):
+        return await self._route(
+            lambda client: client.send_single(method_name=method_name, params=params),
+            method_names=[method_name],
+        )
+
+    async def send_raw(self, method_name: str, params: Optional[dict] = None) -> bytes:
+        return await self._route(
+            lambda client: client.send_raw(method_name=method_name, params=params),
+            method_names=[method_name],
+        )
+
+    async def stream(
+        self,
+        method_name: str,
+        params: Optional[dict] = None,
+        path: Sequence[str] = (),
+    ) -> AsyncGenerator[Any, None]:
+        # Items may be consumed before the stream fails, so it is not failed over to other nodes
+        self._schedule_health_check()
+        backend = self._select_backend(excluded=[])
+
+        backend.outstanding_requests += 1
+        try:
+            async with aclosing(
+                backend.http_client.stream(
+                    method_name=method_name, params=params, path=path
+                )
+            ) as items:
+                async for item in items:
+                    yield item
+        except Exception as err:
+            if self._failover_policy.is_retryable(err, idempotent=True):
+                backend.ejected_until = time.monotonic() + self.failure_cooldown
+            raise
+        finally:
+            backend.outstanding_requests -= 1
+
+    async def call_batch(
+        self, calls: List[Tuple[str, Optional[dict]]]
+    ) -> List[Dict[str, Any]]:
+        return await self._route(
+            lambda client: client.call_batch(calls),
+            method_names=[method_name for method_name, _ in calls],
+        )
+
+    async def check_health(self):
+        """
+        Query the block number of every node, ejecting the unreachable nodes and the nodes lagging
+        more than ``max_block_lag`` blocks behind the highest one.
+        """
+        self._last_health_check = time.monotonic()
+
+        async def get_block_number(backend: Backend) -> Optional[int]:
+            try:
+                return await self._send_to(
+                    backend,
+                    lambda client: client.send_single(method_name="blockNumber"),
+                )
+            except Exception:  # pylint: disable=broad-exception-caught
+                return None
+
+        block_numbers = await asyncio.gather(
+            *(get_block_number(backend) for backend in self.backends)
+        )
+        known_block_numbers = [number for number in block_numbers if number is not None]
+        highest_block_number = max(known_block_numbers, default=None)
+
+        now = time.monotonic()
+        for backend, block_number in zip(self.backends, block_numbers):
+            if block_number is None:
+                backend.ejected_until = now + self.failure_cooldown
+                continue
+            backend.block_number = block_number
+            backend.ejected_until = 0.0
+            assert highest_block_number is not None
+            backend.is_lagging = (
+                block_number < highest_block_number - self.max_block_lag
+            )
+
+    async def _route(
+        self,
+        send: Callable[[RpcHttpClient], Awaitable[T]],
+        method_names: List[str],
+    ) -> T:
+        self._schedule_health_check()
+
+        idempotent = NON_IDEMPOTENT_METHODS.isdisjoint(method_names)
+        tried: List[Backend] = []
+        backend = self._select_backend(excluded=tried)
+
+        while True:
+            try:
+                result = await self._send_to(backend, send)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                if not self._failover_policy.is_retryable(err, idempotent):
+                    raise
+                backend.ejected_until = time.monotonic() + self.failure_cooldown
+                tried.append(backend)
+                if len(tried) == len(self.backends):
+                    raise
+                backend = self._select_backend(excluded=tried)
+                continue
+
+            if not idempotent:
+                self._stick_to(backend)
+            return result
+
+    async def _send_to(
+        self, backend: Backend, send: Callable[[RpcHttpClient], Awaitable[T]]
+    ) -> T:
+        backend.outstanding_requests += 1
+        start = time.monotonic()
+        try:
+            result = await send(backend.http_client)
+        finally:
+            backend.outstanding_requests -= 1
+        self._record_latency(backend, time.monotonic() - start)
+        return result
+
+    def _record_latency(self, backend: Backend, latency: float):
+        if backend.latency is None:
+            backend.latency = latency
+        else:
+            backend.latency = (
+                self.latency_ewma_alpha * latency
+                + (1 - self.latency_ewma_alpha) * backend.latency
+            )
+
+    def _select_backend(self, excluded: List[Backend]) -> Backend:
+        now = time.monotonic()
+        candidates = [backend for backend in self.backends if backend not in excluded]
+
+        sticky_backend = self._get_sticky_backend(now)
+        if (
+            sticky_backend is not None
+            and sticky_backend in candidates
+            and sticky_backend.is_available(now)
+        ):
+            return sticky_backend
+
+        # When no node is available, calling any of them is better than failing right away
+        candidates = [
+            backend for backend in candidates if backend.is_available(now)
+        ] or candidates
+
+        if self.strategy == LoadBalancingStrategy.ROUND_ROBIN:
+            self._round_robin_index = (self._round_robin_index + 1) % len(candidates)
+            return candidates[self._round_robin_index]
+
+        if self.strategy == LoadBalancingStrategy.LEAST_OUTSTANDING:
+            return min(
+                candidates,
+                key=lambda backend: (
+                    backend.outstanding_requests,
+                    backend.latency or 0,
+                ),
+            )
+
+        # Nodes without measured latency are weighted as the fastest known node, so they get probed
+        known_latencies = [
+            backend.latency for backend in candidates if backend.latency is not None
+        ]
+        default_latency = min(known_latencies, default=1.0)
+        weights = [
+            1 / max(backend.latency or default_latency, 1e-6) for backend in candidates
+        ]
+        return random.choices(candidates, weights=weights)[0]
+
+    def _get_sticky_backend(self, now: float) -> Optional[Backend]:
+        sticky = _sticky_backends.get().get(self)
+        if sticky is None:
+            return None
+        sticky_backend, sticky_until = sticky
+        return sticky_backend if now < sticky_until else None
+
+    def _stick_to(self, backend: Backend):
+        sticky_backends = dict(_sticky_backends.get())
+        sticky_backends[self] = (backend, time.monotonic() + self.sticky_duration)
+        _sticky_backends.set(MappingProxyType(sticky_backends))
+
+    def _schedule_health_check(self):
+        if self.health_check_interval is None or self._health_check_tasks:
+            return
+        if (
+            self._last_health_check is not None
+            and time.monotonic() - self._last_health_check < self.health_check_interval
+        ):
+            return
+
+        self._last_health_check = time.monotonic()
+        task = asyncio.ensure_future(self.check_health())
+        self._health_check_tasks.add(task)
+        task.add_done_callback(self._health_check_tasks.discard)
+
+
+@add_sync_methods
+class LoadBalancedClient(FullNodeClient):
+    """
+    Client distributing calls between several Starknet nodes.
+
+    Unreachable nodes and nodes lagging behind the others are temporarily excluded. After a transaction
+    is sent, subsequent calls made in the same task are sent to the same node for ``sticky_duration``
+    seconds, so the transaction and its effects are visible to them.
+    """
+
+    def __init__(
+        self,
+        node_urls: List[str],
+        session: Optional[aiohttp.ClientSession] = None,
+        strategy: LoadBalancingStrategy = LoadBalancingStrategy.LEAST_OUTSTANDING,
+        max_block_lag: int = 3,
+        health_check_interval: Optional[float] = 30.0,
+        failure_cooldown: float = 5.0,
+        sticky_duration: float = 30.0,
+        coalescing: Optional[CoalescingConfig] = None,
+        connection_pool: Optional[ConnectionPoolConfig] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        json_codec: Optional[JsonCodec] = None,
+    ):
+        # pylint: disable=too-many-arguments
+        """
+        :param node_urls: Urls of the nodes providing rpc interface.
+        :param session: Aiohttp session to be used for request. If not provided, client will create a session
+                        with pooled connections on first request and reuse it.
+        :param strategy: Strategy of selecting the node a call is sent to.
+        :param max_block_lag: Number of blocks a node can lag behind the highest one before being excluded.
+        :param health_check_interval: Interval in seconds between health checks of the nodes,
+                        performed in the background. If ``None``, health checks are performed only
+                        by calling :meth:`check_health`.
+        :param failure_cooldown: Time in seconds for which a node is excluded after failing a request.
+        :param sticky_duration: Time in seconds for which calls are sent to the node the transaction was sent to.
+        :param coalescing: Configuration of merging calls made concurrently within a short time window
+                        into JSON-RPC batch requests.
+        :param connection_pool: Configuration of the connection pool of the session created by the client.
+                        Mutually exclusive with ``session`` parameter.
+        :param retry_policy: Policy of retrying requests sent to a single node.
+        :param rate_limiter: Limiter of the number and rate of requests sent to all the nodes combined.
+        :param response_cache: Cache of immutable results of calls, shared by all the nodes.
+        :param json_codec: Codec encoding requests and decoding responses.
+                        If not provided, :func:`~starknet_py.net.json_codec.get_default_json_codec` is used.
+        """
+        if not node_urls:
+            raise ValueError("At least one node url must be provided.")
+
+        super().__init__(
+            node_url=node_urls[0], session=session, connection_pool=connection_pool
+        )
+        self._client = LoadBalancedRpcHttpClient(
+            backends=[
+                RpcHttpClient(
+                    url=node_url,
+                    session=session,
+                    managed_session=self._managed_session,
+                    retry_policy=retry_policy,
+                    rate_limiter=rate_limiter,
+                    json_codec=json_codec,
+                )
+                for node_url in node_urls
+            ],
+            strategy=strategy,
+            max_block_lag=max_block_lag,
+            health_check_interval=health_check_interval,
+            failure_cooldown=failure_cooldown,
+            sticky_duration=sticky_duration,
+            coalescing=coalescing,
+            response_cache=response_cache,
+        )
+
+    @property
+    def backends(self) -> List[Backend]:
+        """
+        State of the nodes used by the client.
+        """
+        assert isinstance(self._client, LoadBalancedRpcHttpClient)
+        return self._client.backends
+
+    async def check_health(self):
+        """
+        Query the block number of every node, excluding the unreachable nodes and the nodes lagging
+        more than ``max_block_lag`` blocks behind the highest one.
+        """
+        assert isinstance(self._client, LoadBalancedRpcHttpClient)
+        await self._client.check_health()
@@ -0,0 +1,96 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Optional
+
+from aiohttp import ClientSession, TCPConnector
+
+from starknet_py.utils.sync import register_sync_call_cleanup
+
+
+@dataclass(frozen=True)
+class ConnectionPoolConfig:
+    """
+    Configuration of the connection pool used by the session owned by the client.
+
+    :param limit: Maximal number of simultaneous connections, 0 means no limit.
+    :param limit_per_host: Maximal number of simultaneous connections to a single host, 0 means no limit.
+    :param keepalive_timeout: Time in seconds for which idle connections are kept open for reuse.
+    :param ttl_dns_cache: Time in seconds for which resolved DNS entries are cached,
+        ``None`` means they are cached forever.
+    """
+
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 15.0
+    ttl_dns_cache: Optional[int] = 10
+
+    def __post_init__(self):
+        if self.limit < 0:
+            raise ValueError("Argument limit must be greater than or equal to 0.")
+        if self.limit_per_host < 0:
+            raise ValueError(
+                "Argument limit_per_host must be greater than or equal to 0."
+            )
+
+
+class ManagedSession:
+    """
+    Aiohttp session created lazily on first use and owned by the client.
+
+    The session, and with it the pooled connections, is reused by all requests made from the event loop
+    it was created in. Synchronous versions of client methods run every call in a new event loop,
+    so the session created by such a call is closed when it returns.
+    """
+
+    def __init__(self, connection_pool: Optional[ConnectionPoolConfig] = None):
+        """
+        :param connection_pool: Configuration of the connection pool. If not provided, defaults are used.
+        """
+        self.connection_pool = connection_pool or ConnectionPoolConfig()
+        self._session: Optional[ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def get(self) -> Optional[ClientSession]:
+        """
+        Return the session for the running event loop.
+
+        :return: The owned session or ``None``, if it is in use by another running event loop.
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._session is not None and self._loop is not loop:
+            assert self._loop is not None
+            if not self._loop.is_closed():
+                return None
+            # Connections bound to a closed event loop cannot be reused
+            await self.close()
+
+        if self._session is None or self._session.closed:
+            session = self._create_session()
+            self._session = session
+            self._loop = loop
+            register_sync_call_cleanup(lambda: self._close_session(session))
+
+        return self._session
+
+    async def close(self):
+        """
+        Close the session and all pooled connections.
+        """
+        if self._session is not None:
+            await self._close_session(self._session)
+
+    async def _close_session(self, session: ClientSession):
+        await session.close()
+        if self._session is session:
+            self._session = None
+            self._loop = None
+
+    def _create_session(self) -> ClientSession:
+        connector = TCPConnector(
+            limit=self.connection_pool.limit,
+            limit_per_host=self.connection_pool.limit_per_host,
+            keepalive_timeout=self.connection_pool.keepalive_timeout,
+            ttl_dns_cache=self.connection_pool.ttl_dns_cache,
+        )
+        return ClientSession(connector=connector)
@@ -0,0 +1,148 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Mapping, Optional
+
+
+@dataclass(frozen=True)
+class RateLimiterStats:
+    """
+    Snapshot of the state of the rate limiter.
+    """
+
+    in_flight: int
+    """Number of requests in progress."""
+    queued: int
+    """Number of requests waiting for admission."""
+    max_queued: int
+    """Highest number of requests waiting for admission at once."""
+    admitted: int
+    """Total number of admitted requests."""
+    total_wait_time: float
+    """Total time in seconds spent by requests waiting for admission."""
+
+
+class RateLimiter:
+    """
+    Admission control of requests sent to the node.
+
+    Limits the number of requests in progress and the rate of sending them using a token bucket.
+    Every request consumes tokens equal to the sum of weights of the RPC methods it calls,
+    so expensive methods can be accounted for, e.g. ``{"traceBlockTransactions": 50}``.
+    Requests are admitted in the order of arrival.
+
+    The same instance can be shared by several clients to limit their combined traffic.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[float] = None,
+        method_weights: Optional[Mapping[str, float]] = None,
+    ):
+        """
+        :param max_in_flight: Maximal number of requests in progress. If not provided, it is not limited.
+        :param requests_per_second: Rate at which tokens are added to the bucket.
+            If not provided, the rate of requests is not limited.
+        :param burst: Capacity of the bucket, defaults to ``requests_per_second``.
+        :param method_weights: Number of tokens consumed by a call of the given RPC method, defaults to 1.
+        """
+        if max_in_flight is not None and max_in_flight <= 0:
+            raise ValueError("Argument max_in_flight must be greater than 0.")
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("Argument requests_per_second must be greater than 0.")
+        if burst is not None and burst <= 0:
+            raise ValueError("Argument burst must be greater than 0.")
+
+        self.max_in_flight = max_in_flight
+        self.requests_per_second = requests_per_second
+        self.burst = burst if burst is not None else requests_per_second
+        self.method_weights = dict(method_weights or {})
+
+        self._semaphore = (
+            asyncio.Semaphore(max_in_flight) if max_in_flight is not None else None
+        )
+        self._bucket_lock = asyncio.Lock()
+        self._tokens = self.burst or 0.0
+        self._last_refill = time.monotonic()
+
+        self._in_flight = 0
+        self._queued = 0
+        self._max_queued = 0
+        self._admitted = 0
+        self._total_wait_time = 0.0
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        return RateLimiterStats(
+            in_flight=self._in_flight,
+            queued=self._queued,
+            max_queued=self._max_queued,
+            admitted=self._admitted,
+            total_wait_time=self._total_wait_time,
+        )
+
+    def get_weight(self, method_names: List[str]) -> float:
+        """
+        Return the number of tokens consumed by a request calling the given RPC methods.
+        """
+        return sum(self.method_weights.get(name, 1) for name in method_names)
+
+    @asynccontextmanager
+    async def acquire(self, method_names: List[str]) -> AsyncIterator[None]:
+        """
+        Wait until a request calling the given RPC methods can be sent and hold its slot until the block exits.
+        """
+        start = time.monotonic()
+        self._queued += 1
+        self._max_queued = max(self._max_queued, self._queued)
+        try:
+            if self._semaphore is not None:
+                await self._semaphore.acquire()
+            try:
+                await self._consume_tokens(self.get_weight(method_names))
+            except BaseException:
+                if self._semaphore is not None:
+                    self._semaphore.release()
+                raise
+        finally:
+            self._queued -= 1
+
+        self._admitted += 1
+        self._total_wait_time += time.monotonic() - start
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    async def _consume_tokens(self, weight: float):
+        if self.requests_per_second is None or self.burst is None:
+            return
+
+        # The lock is held while waiting, so the requests are admitted in the order of arrival
+        async with self._bucket_lock:
+            self._refill()
+            # Requests heavier than the bucket capacity wait for a full bucket and leave a debt
+            required = min(weight, self.burst)
+            if self._tokens < required:
+                await asyncio.sleep(
+                    (required - self._tokens) / self.requests_per_second
+                )
+                self._refill()
+            self._tokens -= weight
+
+    def _refill(self):
+        assert self.requests_per_second is not None and self.burst is not None
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst,
+            self._tokens + (now - self._last_refill) * self.requests_per_second,
+        )
+        self._last_refill = now
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from starknet_py.net.http_client import RpcHttpClient
+
+
+@dataclass(frozen=True)
+class CoalescingConfig:
+    """
+    Configuration of the automatic merging of concurrent calls into JSON-RPC batch requests.
+
+    :param window: Time in seconds during which calls are collected before being sent.
+    :param max_batch_size: Number of collected calls after which the batch is sent immediately.
+    :param deduplicate: Whether identical in-flight calls (same method and params) should share one request.
+    """
+
+    window: float = 0.002
+    max_batch_size: int = 100
+    deduplicate: bool = True
+
+    def __post_init__(self):
+        if self.window < 0:
+            raise ValueError("Argument window must be greater than or equal to 0.")
+        if self.max_batch_size <= 0:
+            raise ValueError("Argument max_batch_size must be greater than 0.")
+
+
+_CallKey = Tuple[str, str]
+
+
+@dataclass
+class _PendingCall:
+    method_name: str
+    params: Optional[dict]
+    future: asyncio.Future
+    key: Optional[_CallKey] = None
+
+
+class RequestCoalescer:
+    """
+    Merges calls made by concurrent tasks within a short time window into JSON-RPC batch requests.
+    """
+
+    def __init__(self, http_client: RpcHttpClient, config: CoalescingConfig):
+        self.http_client = http_client
+        self.config = config
+        self._pending: List[_PendingCall] = []
+        self._in_flight: Dict[_CallKey, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._send_tasks: Set[asyncio.Task] = set()
+
+    async def call(self, method_name: str, params: Optional[dict] = None) -> Any:
+        key = None
+        if self.config.deduplicate:
+            key = (method_name, json.dumps(params, sort_keys=True))
+            if key in self._in_flight:
+                # Shielded, so that cancelling one of the callers does not cancel the shared call
+                return await asyncio.shield(self._in_flight[key])
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(
+            _PendingCall(method_name=method_name, params=params, future=future, key=key)
+        )
+        if key is not None:
+            self._in_flight[key] = future
+
+        if len(self._pending) >= self.config.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.config.window, self._flush)
+
+        return await asyncio.shield(future)
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        task = asyncio.ensure_future(self._send(pending))
+        self._send_tasks.add(task)
+        task.add_done_callback(self._send_tasks.discard)
+
+    async def _send(self, pending: List[_PendingCall]):
+        try:
+            if len(pending) == 1:
+                call = pending[0]
+                results = [
+                    await self.http_client.send_single(
+                        method_name=call.method_name, params=call.params
+                    )
+                ]
+            else:
+                responses = await self.http_client.call_batch(
+                    [(call.method_name, call.params) for call in pending]
+                )
+                results = [
+                    _get_result_or_exception(self.http_client, response)
+                    for response in responses
+                ]
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            results = [err] * len(pending)
+
+        for call, result in zip(pending, results):
+            if call.key is not None:
+                self._in_flight.pop(call.key, None)
+            if call.future.done():
+                continue
+            if isinstance(result, Exception):
+                call.future.set_exception(result)
+            else:
+                call.future.set_result(result)
+
+
+def _get_result_or_exception(http_client: RpcHttpClient, response: dict) -> Any:
+    try:
+        return http_client.get_rpc_result(response)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        return err
@@ -0,0 +1,222 @@
+import asyncio
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Union
+
+BLOCK_SCOPED_METHODS = frozenset(
+    {
+        "getBlockWithTxs",
+        "getBlockWithTxHashes",
+        "getBlockWithReceipts",
+        "getBlockTransactionCount",
+        "getTransactionByBlockIdAndIndex",
+        "getStateUpdate",
+        "getStorageAt",
+        "getStorageProof",
+        "getNonce",
+        "getClassHashAt",
+        "getClassAt",
+        "call",
+        "traceBlockTransactions",
+    }
+)
+"""
+RPC methods whose results are cached only when called with a concrete block hash or block number.
+"""
+
+IMMUTABLE_METHODS = frozenset(
+    {
+        "chainId",
+        "getClass",
+        "getCompiledCasm",
+        "getTransactionByHash",
+    }
+)
+"""
+RPC methods whose successful results never change.
+"""
+
+
+def is_cacheable(method_name: str, params: Optional[dict], result: Any) -> bool:
+    """
+    Check whether the result of the RPC call is immutable and can be cached.
+
+    Results of calls addressed by a block tag (e.g. ``latest`` or ``pre_confirmed``) are never cached.
+    Transaction receipts are cached once the transaction is accepted on L1.
+    """
+    if method_name in IMMUTABLE_METHODS:
+        return True
+
+    if method_name in BLOCK_SCOPED_METHODS:
+        return isinstance((params or {}).get("block_id"), dict)
+
+    if method_name == "getTransactionReceipt":
+        return (
+            isinstance(result, dict)
+            and result.get("finality_status") == "ACCEPTED_ON_L1"
+        )
+
+    return False
+
+
+class ResponseCache:
+    """
+    Cache of immutable results of RPC calls.
+
+    Results are kept in memory in their encoded form and evicted in the least recently used order
+    once their total size exceeds ``max_size``. When ``path`` is provided, results are also stored
+    in a SQLite database, so they survive restarts of the application.
+
+    The same instance can be shared by several clients, also running in different threads.
+    Clients read and write the database in worker threads, so the event loop is not blocked.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        max_size: int = 64 * 1024 * 1024,
+        path: Optional[Union[str, Path]] = None,
+    ):
+        """
+        :param max_size: Maximal total size in bytes of the encoded results kept in memory.
+        :param path: Path of the SQLite database the results are persisted to.
+            If not provided, results are kept only in memory.
+        """
+        if max_size <= 0:
+            raise ValueError("Argument max_size must be greater than 0.")
+
+        self.max_size = max_size
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._size = 0
+        # Synchronous client methods run in worker threads, so the connection is shared between threads
+        self._lock = threading.RLock()
+        self._connection: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._connection = sqlite3.connect(str(path), check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._connection.commit()
+
+    @property
+    def size(self) -> int:
+        """
+        Total size in bytes of the encoded results kept in memory.
+        """
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def get_key(url: str, method_name: str, params: Optional[dict]) -> str:
+        return json.dumps([url, method_name, params], sort_keys=True)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached result for the key or ``None`` if it is not cached.
+        """
+        return self._decode(self._get_encoded(key))
+
+    async def get_async(self, key: str) -> Optional[Any]:
+        """
+        Return the cached result for the key or ``None`` if it is not cached,
+        reading the database in a worker thread.
+        """
+        with self._lock:
+            is_in_memory = key in self._entries or self._connection is None
+        if is_in_memory:
+            return self.get(key)
+        return self._decode(await asyncio.to_thread(self._get_encoded, key))
+
+    def put(self, key: str, result: Any):
+        """
+        Cache the result for the key.
+        """
+        encoded = json.dumps(result)
+        self._store_in_memory(key, encoded)
+        self._store_in_database(key, encoded)
+
+    async def put_async(self, key: str, result: Any):
+        """
+        Cache the result for the key, writing it to the database in a worker thread.
+        """
+        encoded = json.dumps(result)
+        self._store_in_memory(key, encoded)
+        if self._connection is not None:
+            await asyncio.to_thread(self._store_in_database, key, encoded)
+
+    def clear(self):
+        """
+        Remove all cached results, including the persisted ones.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM responses")
+                self._connection.commit()
+
+    def close(self):
+        """
+        Close the database the results are persisted to.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _get_encoded(self, key: str) -> Optional[str]:
+        with self._lock:
+            encoded = self._entries.get(key)
+            if encoded is not None:
+                self._entries.move_to_end(key)
+            elif self._connection is not None:
+                row = self._connection.execute(
+                    "SELECT value FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    encoded = row[0]
+                    self._store_in_memory(key, encoded)
+            return encoded
+
+    def _decode(self, encoded: Optional[str]) -> Optional[Any]:
+        with self._lock:
+            if encoded is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(encoded)
+
+    def _store_in_database(self, key: str, encoded: str):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)",
+                    (key, encoded),
+                )
+                self._connection.commit()
+
+    def _store_in_memory(self, key: str, encoded: str):
+        if len(encoded) > self.max_size:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = encoded
+            self._size += len(encoded)
+
+            while self._size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
@@ -0,0 +1,135 @@
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, FrozenSet, List, Mapping, Optional, TypeVar
+
+import aiohttp
+
+from starknet_py.net.client_errors import HttpStatusError
+
+T = TypeVar("T")
+
+NON_IDEMPOTENT_METHODS = frozenset(
+    {
+        "addInvokeTransaction",
+        "addDeclareTransaction",
+        "addDeployAccountTransaction",
+    }
+)
+"""
+Methods which must not be retried when the node could have already processed the request.
+"""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Policy of retrying calls to the node which failed with a transient error.
+
+    Failed requests are retried with exponential backoff: the n-th retry is delayed by
+    ``min(backoff_max, backoff_base * 2**n)`` seconds, randomized to ``[0, delay]`` when ``jitter`` is enabled.
+
+    Calls adding transactions (see :data:`NON_IDEMPOTENT_METHODS`) are retried only when the request
+    was certainly not processed by the node, that is when the connection could not be established
+    or the node responded with ``429 Too Many Requests``.
+
+    :param max_retries: Maximal number of retries of a single request.
+    :param backoff_base: Delay in seconds before the first retry.
+    :param backoff_max: Maximal delay in seconds between retries.
+    :param jitter: Whether the delays should be randomized, to spread the retries of concurrent requests.
+    :param timeout: Total timeout in seconds of a single request.
+        If not provided, the timeout of the session is used.
+    :param retry_on_status: HTTP statuses of responses which should be retried.
+    :param respect_retry_after: Whether the delay requested in the ``Retry-After`` header should be honoured.
+    :param max_retry_after: Maximal delay in seconds honoured from the ``Retry-After`` header.
+        Longer delays requested by the node are shortened to it.
+    :param method_overrides: Policies used instead of this one for the given RPC methods,
+        e.g. ``{"traceBlockTransactions": RetryPolicy(timeout=60)}``.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    max_retries: int = 3
+    backoff_base: float = 0.1
+    backoff_max: float = 5.0
+    jitter: bool = True
+    timeout: Optional[float] = None
+    retry_on_status: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0
+    method_overrides: Mapping[str, "RetryPolicy"] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if self.max_retries < 0:
+            raise ValueError("Argument max_retries must be greater than or equal to 0.")
+        if self.backoff_base < 0 or self.backoff_max < 0:
+            raise ValueError("Backoff delays must be greater than or equal to 0.")
+        if self.timeout is not None and self.timeout <= 0:
+            raise ValueError("Argument timeout must be greater than 0.")
+        if self.max_retry_after < 0:
+            raise ValueError(
+                "Argument max_retry_after must be greater than or equal to 0."
+            )
+
+    def for_methods(self, method_names: List[str]) -> "RetryPolicy":
+        """
+        Return the policy to be used for a request calling the given RPC methods.
+        """
+        if len(set(method_names)) == 1 and method_names[0] in self.method_overrides:
+            return self.method_overrides[method_names[0]]
+        return self
+
+    async def execute(
+        self,
+        send: Callable[[Optional[float]], Awaitable[T]],
+        method_names: List[str],
+    ) -> T:
+        """
+        Send the request, retrying it according to the policy.
+
+        :param send: Function sending the request, taking the request timeout.
+        :param method_names: Names of the RPC methods called by the request.
+        :return: Result of the request.
+        """
+        policy = self.for_methods(method_names)
+        idempotent = NON_IDEMPOTENT_METHODS.isdisjoint(method_names)
+
+        attempt = 0
+        while True:
+            try:
+                return await send(policy.timeout)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                if attempt >= policy.max_retries or not policy.is_retryable(
+                    err, idempotent
+                ):
+                    raise
+                await asyncio.sleep(policy.get_delay(attempt, err))
+                attempt += 1
+
+    def is_retryable(self, err: Exception, idempotent: bool) -> bool:
+        """
+        Check whether the request which failed with the given error can be retried.
+        """
+        if isinstance(err, HttpStatusError):
+            if idempotent:
+                return err.status in self.retry_on_status
+            return err.status == 429
+        if isinstance(err, aiohttp.ClientConnectorError):
+            return True
+        if isinstance(err, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+            return idempotent
+        return False
+
+    def get_delay(self, attempt: int, err: Optional[Exception] = None) -> float:
+        """
+        Compute the delay in seconds before the retry following the given attempt.
+        """
+        delay = min(self.backoff_max, self.backoff_base * 2**attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if (
+            self.respect_retry_after
+            and isinstance(err, HttpStatusError)
+            and err.retry_after is not None
+        ):
+            delay = max(delay, min(err.retry_after, self.max_retry_after))
+        return delay
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, List, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from starknet_py.net.http_client import RpcHttpClient
+
+T = TypeVar("T")
+
+_active_batch: ContextVar[Optional[RpcBatch]] = ContextVar(
+    "_active_batch", default=None
+)
+
+
+def get_active_batch(http_client: RpcHttpClient) -> Optional[RpcBatch]:
+    """
+    Return the batch collecting calls of the given client in the current context, if there is one.
+    """
+    batch = _active_batch.get()
+    if batch is not None and batch.http_client is http_client:
+        return batch
+    return None
+
+
+@dataclass
+class _QueuedCall:
+    method_name: str
+    params: Optional[dict]
+    future: asyncio.Future
+
+
+class RpcBatch:
+    """
+    Collects JSON-RPC calls made by the client and sends them to the node in batch requests.
+
+    Coroutines passed to :meth:`add` are scheduled as tasks. Calls they make to the node are queued
+    and sent together once the batch is executed, after which the tasks return the usual deserialized
+    results. Errors returned by the node for a single call are raised from the corresponding task
+    as :class:`~starknet_py.net.client_errors.ClientError`.
+
+    .. code-block:: python
+
+        async with client.batch() as batch:
+            nonce = batch.add(client.get_contract_nonce(address))
+            class_hash = batch.add(client.get_class_hash_at(address))
+
+        print(nonce.result(), class_hash.result())
+    """
+
+    def __init__(
+        self, http_client: RpcHttpClient, max_batch_size: Optional[int] = None
+    ):
+        """
+        :param http_client: Client used to send the batch requests.
+        :param max_batch_size: Maximal number of calls sent in one HTTP request.
+            If not provided, all queued calls are sent together.
+        """
+        if max_batch_size is not None and max_batch_size <= 0:
+            raise ValueError("Argument max_batch_size must be greater than 0.")
+
+        self.http_client = http_client
+        self.max_batch_size = max_batch_size
+        self._tasks: List[asyncio.Task] = []
+        self._queue: List[_QueuedCall] = []
+        self._call_queued = asyncio.Event()
+        self._executed = False
+
+    async def __aenter__(self) -> RpcBatch:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            for task in self._tasks:
+                task.cancel()
+            return
+        await self.execute()
+
+    def add(self, awaitable: Awaitable[T]) -> "asyncio.Task[T]":
+        """
+        Schedule a coroutine whose calls to the node should be batched.
+
+        :param awaitable: Coroutine, e.g. ``client.get_storage_at(...)``.
+        :return: Task resolved with the result of the coroutine once the batch is executed.
+        """
+        if self._executed:
+            raise ValueError(
+                "Cannot add calls to a batch that has already been executed."
+            )
+
+        task = asyncio.ensure_future(self._run_in_batch(awaitable))
+        self._tasks.append(task)
+        return task
+
+    async def execute(self):
+        """
+        Send all queued calls and wait until every added coroutine completes.
+        """
+        self._executed = True
+
+        pending = [task for task in self._tasks if not task.done()]
+        while pending:
+            if self._queue:
+                queued, self._queue = self._queue, []
+                await self._send(queued)
+            else:
+                # Let the tasks run until they either complete or queue another call
+                self._call_queued.clear()
+                call_queued = asyncio.ensure_future(self._call_queued.wait())
+                await asyncio.wait(
+                    [*pending, call_queued], return_when=asyncio.FIRST_COMPLETED
+                )
+                call_queued.cancel()
+
+            pending = [task for task in self._tasks if not task.done()]
+
+    async def enqueue(self, method_name: str, params: Optional[dict] = None) -> Any:
+        """
+        Queue a call and wait for its result.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append(
+            _QueuedCall(method_name=method_name, params=params, future=future)
+        )
+        self._call_queued.set()
+        return await future
+
+    async def _run_in_batch(self, awaitable: Awaitable[T]) -> T:
+        # Each task runs in its own copy of the context, so the calls made outside
+        # of the added coroutines are not affected
+        _active_batch.set(self)
+        return await awaitable
+
+    async def _send(self, queued: List[_QueuedCall]):
+        size = self.max_batch_size or len(queued)
+        chunks = [queued[i : i + size] for i in range(0, len(queued), size)]
+        await asyncio.gather(*(self._send_chunk(chunk) for chunk in chunks))
+
+    async def _send_chunk(self, chunk: List[_QueuedCall]):
+        try:
+            responses = await self.http_client.call_batch(
+                [(call.method_name, call.params) for call in chunk]
+            )
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            for call in chunk:
+                if not call.future.done():
+                    call.future.set_exception(err)
+            return
+
+        for call, response in zip(chunk, responses):
+            if call.future.done():
+                continue
+            try:
+                call.future.set_result(self.http_client.get_rpc_result(response))
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                call.future.set_exception(err)
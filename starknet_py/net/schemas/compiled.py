@@ -0,0 +1,327 @@
+import re
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from marshmallow import EXCLUDE, INCLUDE
+from marshmallow import Schema as MarshmallowSchema
+from marshmallow import fields, missing
+from marshmallow_oneofschema.one_of_schema import OneOfSchema
+
+from starknet_py.net.schemas.common import NumberAsHex
+
+# Compiled loaders replicate the loading implemented by marshmallow, so they use its internals
+# pylint: disable=protected-access
+
+Loader = Callable[[Any, Optional[str]], Any]
+ValueLoader = Callable[[Any], Any]
+
+_MAX_CACHED_ENUM_VALUES = 64
+
+
+class _FallbackError(Exception):
+    """
+    Raised by compiled loaders when the data cannot be loaded without marshmallow.
+    """
+
+
+def load_compiled(schema_class: Type[MarshmallowSchema], data: Any, many: bool = False):
+    """
+    Load the data with the schema, producing the same result as ``schema_class().load(data, many=many)``.
+
+    The schema is compiled on first use into a loader, which deserializes values of the fields directly,
+    without the bookkeeping of marshmallow. Data which the compiled loader cannot load (e.g. invalid data)
+    is loaded by marshmallow, so the same errors are raised.
+
+    :param schema_class: Schema to load the data with.
+    :param data: Data to load.
+    :param many: Whether the data is a list of objects.
+    :return: Loaded data.
+    """
+    schema, loader = _get_compiled_schema(schema_class)
+    try:
+        if many:
+            if not isinstance(data, list):
+                raise _FallbackError()
+            return [loader(item, None) for item in data]
+        return loader(data, None)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return schema.load(data, many=many)
+
+
+def _get_compiled_schema(
+    schema_class: Type[MarshmallowSchema],
+) -> Tuple[MarshmallowSchema, Loader]:
+    if schema_class not in _compiled_schemas:
+        schema = schema_class()
+        _compiled_schemas[schema_class] = (schema, _compiler.compile(schema))
+    return _compiled_schemas[schema_class]
+
+
+class _SchemaCompiler:
+    """
+    Compiles schemas and their fields into loaders. Schemas are compiled once per class,
+    so nested and recursive schemas refer to the same loader.
+    """
+
+    def __init__(self):
+        self._loaders: Dict[Type[MarshmallowSchema], Loader] = {}
+
+    def compile(self, schema: MarshmallowSchema) -> Loader:
+        if not _is_compilable(schema):
+            return _delegate_to_schema(schema)
+
+        schema_class = type(schema)
+        if schema_class not in self._loaders:
+            if isinstance(schema, OneOfSchema):
+                self._loaders[schema_class] = self._compile_one_of_schema(schema)
+            else:
+                self._loaders[schema_class] = self._compile_schema(schema)
+        loader = self._loaders[schema_class]
+        default_unknown = schema.unknown
+
+        # Instances of the same schema class may differ only in handling of unknown fields
+        return lambda data, unknown: loader(data, unknown or default_unknown)
+
+    def _compile_schema(self, schema: MarshmallowSchema) -> Loader:
+        # Registered before compiling the fields, so recursive schemas refer to the same loader
+        compiled_fields: List[Tuple[str, str, fields.Field, ValueLoader]] = []
+        post_loads = [
+            getattr(schema, attr_name) for attr_name, _, _ in schema._hooks["post_load"]
+        ]
+        data_keys = frozenset(
+            field.data_key if field.data_key is not None else name
+            for name, field in schema.load_fields.items()
+        )
+
+        def load(data: Any, unknown: Optional[str]) -> Any:
+            if not isinstance(data, dict):
+                raise _FallbackError()
+            result = {}
+            for data_key, attribute, field, load_value in compiled_fields:
+                value = data.get(data_key, missing)
+                if value is missing:
+                    if field.required:
+                        raise _FallbackError()
+                    default = field.load_default
+                    value = default() if callable(default) else default
+                    if value is missing:
+                        continue
+                elif value is None:
+                    if not field.allow_none:
+                        raise _FallbackError()
+                else:
+                    value = load_value(value)
+                result[attribute] = value
+
+            if unknown != EXCLUDE and not data.keys() <= data_keys:
+                if unknown != INCLUDE:
+                    raise _FallbackError()
+                for key in data.keys() - data_keys:
+                    result[key] = data[key]
+
+            for post_load in post_loads:
+                result = post_load(result, many=False, partial=None)
+            return result
+
+        self._loaders[type(schema)] = load
+        compiled_fields.extend(
+            (
+                field.data_key if field.data_key is not None else name,
+                field.attribute or name,
+                field,
+                self._compile_field(field),
+            )
+            for name, field in schema.load_fields.items()
+        )
+        return load
+
+    def _compile_one_of_schema(self, schema: OneOfSchema) -> Loader:
+        type_loaders: Dict[str, Loader] = {}
+        for data_type, type_schema in schema.type_schemas.items():
+            if not isinstance(type_schema, MarshmallowSchema):
+                type_schema = type_schema()
+            type_loaders[data_type] = self.compile(type_schema)
+
+        # Types are resolved as in OneOfSchema, which may remove the type field from a copy of the data
+        get_data_type = schema.get_data_type
+
+        def load(data: Any, unknown: Optional[str]) -> Any:
+            if not isinstance(data, dict):
+                raise _FallbackError()
+            data = dict(data)
+            type_loader = type_loaders.get(get_data_type(data))
+            if type_loader is None:
+                raise _FallbackError()
+            return type_loader(data, unknown)
+
+        return load
+
+    def _compile_field(self, field: fields.Field) -> ValueLoader:
+        if field.validators:
+            load_value = self._compile_field_without_validators(field)
+            validators = list(field.validators)
+
+            def load_validated_value(value: Any) -> Any:
+                value = load_value(value)
+                for validator in validators:
+                    if validator(value) is False:
+                        raise _FallbackError()
+                return value
+
+            return load_validated_value
+
+        return self._compile_field_without_validators(field)
+
+    def _compile_field_without_validators(self, field: fields.Field) -> ValueLoader:
+        # pylint: disable=too-many-return-statements
+        field_class = type(field)
+        if field_class._deserialize is fields.Field._deserialize:
+            return lambda value: value
+
+        if (
+            isinstance(field, NumberAsHex)
+            and field_class._deserialize is NumberAsHex._deserialize
+        ):
+            return _compile_number_as_hex(field)
+
+        if field_class is fields.String:
+            return lambda value: value if isinstance(value, str) else _fallback()
+
+        if field_class is fields.Integer and not field.strict:
+            return lambda value: (
+                value
+                if type(value) is int  # pylint: disable=unidiomatic-typecheck
+                else field.deserialize(value)
+            )
+
+        if field_class is fields.List:
+            load_inner = self._compile_element(field.inner)
+            return lambda value: (
+                [load_inner(item) for item in value]
+                if isinstance(value, list)
+                else _fallback()
+            )
+
+        if field_class is fields.Nested and not _has_nested_options(field):
+            load_nested = self.compile(field.schema)
+            unknown = field.unknown
+            if field.many:
+                return lambda value: (
+                    [load_nested(item, unknown) for item in value]
+                    if isinstance(value, list)
+                    else _fallback()
+                )
+            return lambda value: load_nested(value, unknown)
+
+        if field_class.__module__.startswith("starknet_py."):
+            return _compile_cached_field(field)
+
+        return field.deserialize
+
+    def _compile_element(self, field: fields.Field) -> ValueLoader:
+        # Elements of lists go through all checks of Field.deserialize, including missing and null values
+        load_value = self._compile_field(field)
+        allow_none = field.allow_none
+
+        def load_element(value: Any) -> Any:
+            if value is None:
+                return None if allow_none else _fallback()
+            return load_value(value)
+
+        return load_element
+
+
+def _compile_number_as_hex(field: NumberAsHex) -> ValueLoader:
+    fullmatch = re.compile(field.REGEX_PATTERN).fullmatch
+    max_value = field.MAX_VALUE
+
+    def load_number(value: Any) -> int:
+        if isinstance(value, str):
+            if fullmatch(value) is None:
+                raise _FallbackError()
+            return int(value, 16)
+        if isinstance(value, int) and 0 <= value < max_value:
+            return value
+        raise _FallbackError()
+
+    return load_number
+
+
+def _compile_cached_field(field: fields.Field) -> ValueLoader:
+    """
+    Returns the loader of custom fields of starknet.py, which caches members of enums deserialized from strings.
+    """
+    cache: Dict[str, Enum] = {}
+    deserialize = field.deserialize
+
+    def load_value(value: Any) -> Any:
+        if isinstance(value, str):
+            cached = cache.get(value)
+            if cached is not None:
+                return cached
+        result = deserialize(value)
+        if (
+            isinstance(value, str)
+            and isinstance(result, Enum)
+            and len(cache) < _MAX_CACHED_ENUM_VALUES
+        ):
+            cache[value] = result
+        return result
+
+    return load_value
+
+
+def _delegate_to_schema(schema: MarshmallowSchema) -> Loader:
+    return lambda data, unknown: schema.load(data, unknown=unknown)
+
+
+def _is_compilable(schema: MarshmallowSchema) -> bool:
+    """
+    Checks whether the schema is loaded only by the default implementation of marshmallow
+    with hooks supported by the compiled loaders.
+    """
+    if schema.many or schema.partial or schema.only is not None or schema.exclude:
+        return False
+
+    if isinstance(schema, OneOfSchema):
+        return (
+            type(schema).load is OneOfSchema.load
+            and type(schema)._load is OneOfSchema._load
+        )
+
+    schema_class = type(schema)
+    if any(
+        getattr(schema_class, name) is not getattr(MarshmallowSchema, name)
+        for name in ("load", "_do_load", "_deserialize", "handle_error")
+    ):
+        return False
+
+    if schema.dict_class is not dict or any(
+        hooks
+        for tag, hooks in schema._hooks.items()
+        if tag not in ("post_load", "post_dump", "pre_dump")
+    ):
+        return False
+
+    if any(
+        hook_many or hook_kwargs.get("pass_original", False)
+        for _, hook_many, hook_kwargs in schema._hooks["post_load"]
+    ):
+        return False
+
+    return all(
+        "." not in (field.attribute or name)
+        for name, field in schema.load_fields.items()
+    )
+
+
+def _has_nested_options(field: fields.Nested) -> bool:
+    return field.only is not None or bool(field.exclude)
+
+
+def _fallback() -> Any:
+    raise _FallbackError()
+
+
+_compiler = _SchemaCompiler()
+_compiled_schemas: Dict[Type[MarshmallowSchema], Tuple[MarshmallowSchema, Loader]] = {}
@@ -1,4 +1,7 @@
-from typing import List
+import asyncio
+from concurrent.futures import Executor
+from itertools import repeat
+from typing import List, Optional, Sequence
 
 from starknet_py.hash.utils import message_signature
 from starknet_py.net.models import AddressRepresentation, parse_address
@@ -8,6 +11,8 @@ from starknet_py.net.signer.base_signer import BaseSigner
 from starknet_py.net.signer.key_pair import KeyPair
 from starknet_py.utils.typed_data import TypedData
 
+DEFAULT_SIGNING_CHUNK_SIZE = 16
+
 
 class StarkCurveSigner(BaseSigner):
     def __init__(
@@ -43,8 +48,95 @@ class StarkCurveSigner(BaseSigner):
         r, s = message_signature(msg_hash=tx_hash, priv_key=self.private_key)
         return [r, s]
 
+    def sign_transactions(
+        self,
+        transactions: Sequence[AccountTransaction],
+        executor: Optional[Executor] = None,
+        chunk_size: int = DEFAULT_SIGNING_CHUNK_SIZE,
+    ) -> List[List[int]]:
+        """
+        Sign multiple transactions.
+
+        Hashing and signing of transactions is CPU bound. When ``executor`` is provided, chunks
+        of transactions are signed concurrently by its workers. Use
+        :class:`~concurrent.futures.ProcessPoolExecutor` to scale signing with the number of cores.
+
+        :param transactions: Transactions to sign.
+        :param executor: Executor signing chunks of transactions. If not provided, transactions are signed
+            in the calling thread.
+        :param chunk_size: Number of transactions signed by a single task of the executor.
+        :return: Signatures of the transactions, in the same order.
+        """
+        if executor is None:
+            return _sign_transactions(transactions, self.chain_id, self.private_key)
+
+        chunks = _split_into_chunks(transactions, chunk_size)
+        results = executor.map(
+            _sign_transactions,
+            chunks,
+            repeat(self.chain_id),
+            repeat(self.private_key),
+        )
+        return [signature for result in results for signature in result]
+
+    async def sign_transactions_async(
+        self,
+        transactions: Sequence[AccountTransaction],
+        executor: Optional[Executor] = None,
+        chunk_size: int = DEFAULT_SIGNING_CHUNK_SIZE,
+    ) -> List[List[int]]:
+        """
+        Sign multiple transactions without blocking the event loop.
+
+        Chunks of transactions are signed concurrently by the workers of the executor.
+
+        :param transactions: Transactions to sign.
+        :param executor: Executor signing chunks of transactions. If not provided, the default executor
+            of the event loop is used.
+        :param chunk_size: Number of transactions signed by a single task of the executor.
+        :return: Signatures of the transactions, in the same order.
+        """
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor,
+                    _sign_transactions,
+                    chunk,
+                    self.chain_id,
+                    self.private_key,
+                )
+                for chunk in _split_into_chunks(transactions, chunk_size)
+            )
+        )
+        return [signature for result in results for signature in result]
+
     def sign_message(self, typed_data: TypedData, account_address: int) -> List[int]:
         msg_hash = typed_data.message_hash(account_address)
         # pylint: disable=invalid-name
         r, s = message_signature(msg_hash=msg_hash, priv_key=self.private_key)
         return [r, s]
+
+
+def _sign_transactions(
+    transactions: Sequence[AccountTransaction], chain_id: ChainId, private_key: int
+) -> List[List[int]]:
+    # Defined on the module level, so it can be sent to workers of a process pool
+    signatures = []
+    for transaction in transactions:
+        tx_hash = transaction.calculate_hash(chain_id)
+        # pylint: disable=invalid-name
+        r, s = message_signature(msg_hash=tx_hash, priv_key=private_key)
+        signatures.append([r, s])
+    return signatures
+
+
+def _split_into_chunks(
+    transactions: Sequence[AccountTransaction], chunk_size: int
+) -> List[Sequence[AccountTransaction]]:
+    if chunk_size <= 0:
+        raise ValueError("Argument chunk_size must be greater than 0.")
+    return [
+        transactions[start : start + chunk_size]
+        for start in range(0, len(transactions), chunk_size)
+    ]
@@ -1,5 +1,4 @@
 import asyncio
-import json
 from typing import Any, Callable, Dict, List, Literal, Optional, Union, cast
 
 from websockets import InvalidState, State
@@ -12,6 +11,7 @@ from starknet_py.net.client_models import (
     TransactionStatusWithoutL1,
 )
 from starknet_py.net.client_utils import _to_rpc_felt, get_block_identifier
+from starknet_py.net.json_codec import JsonCodec, get_default_json_codec
 from starknet_py.net.schemas.rpc.websockets import (
     NewEventsNotificationSchema,
     NewHeadsNotificationSchema,
@@ -64,11 +64,16 @@ class WebsocketClient:
     Starknet client for WebSocket API.
     """
 
-    def __init__(self, node_url: str):
+    def __init__(self, node_url: str, json_codec: Optional[JsonCodec] = None):
         """
         :param node_url: URL of the node providing the WebSocket API.
+        :param json_codec: Codec encoding requests and decoding messages. If not provided,
+            :func:`~starknet_py.net.json_codec.get_default_json_codec` is used.
         """
         self.node_url: str = node_url
+        self.json_codec = (
+            json_codec if json_codec is not None else get_default_json_codec()
+        )
         self.connection: Optional[ClientConnection] = None
         self._listen_task: Optional[asyncio.Task] = None
         self._subscriptions: Dict[str, NotificationHandler] = {}
@@ -406,7 +411,8 @@ class WebsocketClient:
         future = asyncio.get_running_loop().create_future()
         self._pending_responses[message_id] = future
 
-        await self.connection.send(json.dumps(payload))
+        # Sent as a text frame
+        await self.connection.send(self.json_codec.dumps(payload).decode("utf-8"))
 
         if self._listen_failed is not None:
             # Get the first future that completes
@@ -431,7 +437,7 @@ class WebsocketClient:
 
         :param message: The message received from the WebSocket server.
         """
-        data = cast(Dict, json.loads(message))
+        data = cast(Dict, self.json_codec.loads(message))
 
         # case when the message is a response to `subscribe_{method}`
         if "id" in data and data["id"] in self._pending_responses:
@@ -0,0 +1,74 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from starknet_py.abi.v0.shape import AbiDictList
+
+
+class AbiCache:
+    """
+    Cache of ABIs of contract classes used by :meth:`~starknet_py.contract.Contract.from_address`.
+
+    ABIs and Cairo versions are stored by class hash, which identifies the class content, so they never
+    become stale. Implementations of proxy contracts are not cached, since upgrades may change only
+    the storage of the proxy. They are read from the proxy with the proxy checks on every resolution,
+    and only the class of the implementation is taken from the cache.
+
+    When ``path`` is provided, the cache is persisted to the directory, so it survives restarts
+    of the application. With a warm cache, creating a contract which is not a proxy requires
+    a single ``get_class_hash_at`` call.
+    """
+
+    _CLASSES_DIRECTORY = "classes"
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        :param path: Directory the cache is persisted to. It is created if it does not exist.
+            If not provided, the cache is kept only in memory.
+        """
+        self.path = Path(path) if path is not None else None
+        self._abis: Dict[int, Tuple[AbiDictList, int]] = {}
+
+        if self.path is not None:
+            (self.path / self._CLASSES_DIRECTORY).mkdir(parents=True, exist_ok=True)
+
+    def get(self, class_hash: int) -> Optional[Tuple[AbiDictList, int]]:
+        """
+        Return the ABI and the Cairo version of the class or ``None`` if it is not cached.
+        """
+        if class_hash in self._abis:
+            return self._abis[class_hash]
+        if self.path is None:
+            return None
+
+        class_path = self._get_class_path(class_hash)
+        if not class_path.exists():
+            return None
+        with open(class_path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        self._abis[class_hash] = (data["abi"], data["cairo_version"])
+        return self._abis[class_hash]
+
+    def put(self, class_hash: int, abi: AbiDictList, cairo_version: int):
+        """
+        Cache the ABI and the Cairo version of the class.
+        """
+        self._abis[class_hash] = (abi, cairo_version)
+        if self.path is not None:
+            _write_json(
+                self._get_class_path(class_hash),
+                {"abi": abi, "cairo_version": cairo_version},
+            )
+
+    def _get_class_path(self, class_hash: int) -> Path:
+        assert self.path is not None
+        return self.path / self._CLASSES_DIRECTORY / f"{hex(class_hash)}.json"
+
+
+def _write_json(path: Path, data: dict):
+    # Written to a temporary file first, so concurrent readers never see partially written data
+    temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(temporary_path, "w", encoding="utf-8") as file:
+        json.dump(data, file)
+    os.replace(temporary_path, path)
@@ -1,7 +1,7 @@
 import json
 import re
 from enum import Enum
-from typing import AsyncGenerator, List, Tuple, TypedDict, Union, cast
+from typing import AsyncGenerator, List, Optional, Tuple, TypedDict, Union, cast
 
 from starknet_py.abi.v0.shape import AbiDictList
 from starknet_py.constants import (
@@ -14,6 +14,7 @@ from starknet_py.net.client import Client
 from starknet_py.net.client_errors import ClientError, ContractNotFoundError
 from starknet_py.net.client_models import DeprecatedContractClass, SierraContractClass
 from starknet_py.net.models import Address
+from starknet_py.proxy.abi_cache import AbiCache
 from starknet_py.proxy.proxy_check import (
     ArgentProxyCheck,
     OpenZeppelinProxyCheck,
@@ -63,15 +64,18 @@ class ContractAbiResolver:
         address: Address,
         client: Client,
         proxy_config: ProxyConfig,
+        abi_cache: Optional[AbiCache] = None,
     ):
         """
         :param address: Contract's address
         :param client: Client used for resolving abi
         :param proxy_config: Proxy config for resolving proxy
+        :param abi_cache: Cache of resolved abis. If provided, classes are fetched only when not cached.
         """
         self.address = address
         self.client = client
         self.proxy_config = proxy_config
+        self.abi_cache = abi_cache
 
     async def resolve(self) -> Tuple[AbiDictList, int]:
         """
@@ -82,6 +86,8 @@ class ContractAbiResolver:
         :raises ProxyResolutionError: when given ProxyChecks were not sufficient to resolve proxy
         :raises AbiNotFoundError: when abi is not present in contract class at address
         """
+        if self.abi_cache is not None:
+            return await self._resolve_with_cache(self.abi_cache)
         if len(self.proxy_config) == 0:
             return await self.get_abi_for_address()
         return await self.resolve_abi()
@@ -130,15 +136,55 @@ class ContractAbiResolver:
                     contract_class
                 ), self._get_cairo_version(contract_class)
             except ClientError as err:
-                if not (
-                    "is not declared" in err.message
-                    or err.code == RPC_CLASS_HASH_NOT_FOUND_ERROR
-                    or isinstance(err, ContractNotFoundError)
-                ):
+                if not _is_implementation_not_found(err):
+                    raise err
+
+        raise ProxyResolutionError(self.proxy_config.get("proxy_checks", []))
+
+    async def _resolve_with_cache(self, abi_cache: AbiCache) -> Tuple[AbiDictList, int]:
+        if len(self.proxy_config) == 0:
+            class_hash = await _get_class_hash_at(
+                address=self.address, client=self.client
+            )
+            return await self._get_abi_for_class_hash(class_hash, abi_cache)
+
+        # Implementation may be changed without changing the class of the proxy, so it is always read
+        # from the proxy and only the class of the implementation is taken from the cache
+        async for (
+            implementation,
+            implementation_type,
+        ) in self._get_implementation_from_proxy():
+            try:
+                if implementation_type == ImplementationType.ADDRESS:
+                    implementation = await _get_class_hash_at(
+                        address=implementation, client=self.client
+                    )
+                result = await self._get_abi_for_class_hash(implementation, abi_cache)
+            except ClientError as err:
+                if not _is_implementation_not_found(err):
                     raise err
+                continue
+
+            return result
 
         raise ProxyResolutionError(self.proxy_config.get("proxy_checks", []))
 
+    async def _get_abi_for_class_hash(
+        self, class_hash: int, abi_cache: AbiCache
+    ) -> Tuple[AbiDictList, int]:
+        cached = abi_cache.get(class_hash)
+        if cached is not None:
+            return cached
+
+        contract_class = await self.client.get_class_by_hash(class_hash=class_hash)
+        if contract_class.abi is None:
+            raise AbiNotFoundError()
+
+        abi = self.get_abi_from_contract_class(contract_class)
+        cairo_version = self._get_cairo_version(contract_class)
+        abi_cache.put(class_hash, abi, cairo_version)
+        return abi, cairo_version
+
     @staticmethod
     def _get_cairo_version(
         contract_class: Union[DeprecatedContractClass, SierraContractClass]
@@ -223,12 +269,33 @@ async def _get_class_at(
         contract_class_hash = await client.get_class_hash_at(contract_address=address)
         contract_class = await client.get_class_by_hash(class_hash=contract_class_hash)
     except ClientError as err:
-        if (
-            "is not deployed" in err.message
-            or err.code == RPC_CLASS_HASH_NOT_FOUND_ERROR
-            or err.code == RPC_CONTRACT_NOT_FOUND_ERROR
-        ):
+        if _is_contract_not_found(err):
             raise ContractNotFoundError(address=address) from err
         raise err
 
     return contract_class
+
+
+async def _get_class_hash_at(address: Address, client: Client) -> int:
+    try:
+        return await client.get_class_hash_at(contract_address=address)
+    except ClientError as err:
+        if _is_contract_not_found(err):
+            raise ContractNotFoundError(address=address) from err
+        raise err
+
+
+def _is_contract_not_found(err: ClientError) -> bool:
+    return (
+        "is not deployed" in err.message
+        or err.code == RPC_CLASS_HASH_NOT_FOUND_ERROR
+        or err.code == RPC_CONTRACT_NOT_FOUND_ERROR
+    )
+
+
+def _is_implementation_not_found(err: ClientError) -> bool:
+    return (
+        "is not declared" in err.message
+        or err.code == RPC_CLASS_HASH_NOT_FOUND_ERROR
+        or isinstance(err, ContractNotFoundError)
+    )
@@ -204,6 +204,38 @@ async def test_get_events(client, contract_address):
     # docs-end: get_events
 
 
+@pytest.mark.asyncio
+async def test_get_events_in_parallel(client, contract_address):
+    # docs-start: get_events_in_parallel
+    address = 0x1 or 1 or "0x1"
+    # docs-end: get_events_in_parallel
+    address = contract_address
+    # docs-start: get_events_in_parallel
+    events_response = await client.get_events_in_parallel(
+        address=address,
+        from_block_number=0,
+        blocks_per_shard=100,
+        max_concurrency=4,
+    )
+    # docs-end: get_events_in_parallel
+
+
+@pytest.mark.asyncio
+async def test_iter_events(client, contract_address):
+    # docs-start: iter_events
+    address = 0x1 or 1 or "0x1"
+    # docs-end: iter_events
+    address = contract_address
+    # docs-start: iter_events
+    async for events_chunk in client.iter_events(
+        address=address, from_block_number=0, to_block_number="latest"
+    ):
+        for event in events_chunk.events:
+            ...
+        # Persist events_chunk.continuation_token to resume later
+    # docs-end: iter_events
+
+
 # TODO (#1219): fix that after update to RPC to v0.6.0
 @pytest.mark.xfail(
     reason="Passing devnet client without implemented methods - test simply for a code example."
@@ -0,0 +1,97 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from starknet_py.hash.address import compute_address, compute_addresses, find_salt
+
+CLASS_HASH = 0x1234
+CONSTRUCTOR_CALLDATA = [0x1, 0x2, 0x3]
+DEPLOYER_ADDRESS = 0x41A78E741E5AF2FEC34B695679BC6891742439F7AFB8484ECD7766661AD02BF
+
+
+def _address_ends_with_zero(address: int) -> bool:
+    return address % 16 == 0
+
+
+@pytest.mark.parametrize("deployer_address", [0, DEPLOYER_ADDRESS])
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_compute_addresses(deployer_address, max_workers):
+    salts = list(range(300))
+
+    addresses = compute_addresses(
+        class_hash=CLASS_HASH,
+        constructor_calldata=CONSTRUCTOR_CALLDATA,
+        salts=salts,
+        deployer_address=deployer_address,
+        max_workers=max_workers,
+    )
+
+    assert addresses == [
+        compute_address(
+            class_hash=CLASS_HASH,
+            constructor_calldata=CONSTRUCTOR_CALLDATA,
+            salt=salt,
+            deployer_address=deployer_address,
+        )
+        for salt in salts
+    ]
+
+
+def _expected_salt(start_salt: int = 0) -> int:
+    salt = start_salt
+    while not _address_ends_with_zero(
+        compute_address(
+            class_hash=CLASS_HASH, constructor_calldata=CONSTRUCTOR_CALLDATA, salt=salt
+        )
+    ):
+        salt += 1
+    return salt
+
+
+@pytest.mark.parametrize("start_salt", [0, 10])
+def test_find_salt(start_salt):
+    salt = _expected_salt(start_salt)
+
+    assert find_salt(
+        class_hash=CLASS_HASH,
+        constructor_calldata=CONSTRUCTOR_CALLDATA,
+        predicate=_address_ends_with_zero,
+        start_salt=start_salt,
+        chunk_size=3,
+    ) == (
+        salt,
+        compute_address(
+            class_hash=CLASS_HASH, constructor_calldata=CONSTRUCTOR_CALLDATA, salt=salt
+        ),
+    )
+
+
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_find_salt_in_executor(executor_class):
+    salt = _expected_salt()
+
+    with executor_class(max_workers=2) as executor:
+        result = find_salt(
+            class_hash=CLASS_HASH,
+            constructor_calldata=CONSTRUCTOR_CALLDATA,
+            predicate=_address_ends_with_zero,
+            executor=executor,
+            chunk_size=2,
+        )
+
+    assert result is not None
+    assert result[0] == salt
+
+
+def test_find_salt_max_attempts():
+    salt = _expected_salt()
+
+    assert (
+        find_salt(
+            class_hash=CLASS_HASH,
+            constructor_calldata=CONSTRUCTOR_CALLDATA,
+            predicate=_address_ends_with_zero,
+            max_attempts=salt,
+        )
+        is None
+    )
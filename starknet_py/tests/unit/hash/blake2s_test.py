@@ -3,9 +3,16 @@ The test values are taken from sequencer repository:
 https://github.com/starkware-libs/sequencer/blob/b29c0e8c61f7b2340209e256cf87dfe9f2c811aa/crates/blake2s/tests/blake2s_tests.rs
 """
 
+import random
+
 import pytest
 
-from starknet_py.hash.blake2s import encode_felt252_data_and_calc_blake_hash
+from starknet_py.constants import FIELD_PRIME
+from starknet_py.hash.blake2s import (
+    encode_felt252_data_and_calc_blake_hash,
+    encode_felts_to_bytes,
+    encode_felts_to_u32s,
+)
 
 
 @pytest.mark.parametrize(
@@ -50,3 +57,34 @@ def test_encode_felt252_data_and_calc_blake_hash(input_felts, expected_result):
     assert (
         result == expected_result
     ), f"StarknetPy implementation: {result} != Cairo implementation: {expected_result}"
+
+
+def _encode_felt_to_u32s_reference(felt: int) -> list:
+    felt_as_be_bytes = felt.to_bytes(32, byteorder="big")
+    if felt < 2**63:
+        return [
+            int.from_bytes(felt_as_be_bytes[24:28], byteorder="big"),
+            int.from_bytes(felt_as_be_bytes[28:32], byteorder="big"),
+        ]
+    limbs = [
+        int.from_bytes(felt_as_be_bytes[i : i + 4], byteorder="big")
+        for i in range(0, 32, 4)
+    ]
+    limbs[0] |= 1 << 31
+    return limbs
+
+
+def test_encode_felts_matches_reference():
+    rng = random.Random(0)
+    felts = [0, 1, 2**32, 2**63 - 1, 2**63, FIELD_PRIME - 1] + [
+        rng.getrandbits(bits) % FIELD_PRIME
+        for bits in rng.choices([8, 32, 63, 64, 128, 252], k=1000)
+    ]
+    expected_u32s = [
+        limb for felt in felts for limb in _encode_felt_to_u32s_reference(felt)
+    ]
+
+    assert encode_felts_to_u32s(felts) == expected_u32s
+    assert encode_felts_to_bytes(felts) == b"".join(
+        limb.to_bytes(4, byteorder="little") for limb in expected_u32s
+    )
@@ -1,9 +1,13 @@
 # fmt: off
+import dataclasses
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 import pytest
 from semver import Version
 
 from starknet_py.common import create_casm_class
 from starknet_py.hash.casm_class_hash import (
+    BytecodeSegmentHashCache,
     compute_casm_class_hash,
     get_casm_hash_method_for_starknet_version,
 )
@@ -106,3 +110,61 @@ def test_precompiled_compute_casm_class_hash_with_blake2s(casm_contract_class_so
     casm_class = create_casm_class(casm_contract_class_str)
     casm_class_hash = compute_casm_class_hash(casm_class, hash_method=HashMethod.BLAKE2S)
     assert casm_class_hash == expected_casm_class_hash_blake2s
+
+
+SEGMENTED_CASM_CLASS_SOURCE = "starknet_contract_v2_6.casm"
+SEGMENTED_CASM_CLASS_HASH_BLAKE2S = 0xf8c27dd667e50ba127e5e0e469381606ffece27d8c5148548b6bbc4cacf717
+
+
+def _segmented_casm_class():
+    return create_casm_class(
+        read_contract(SEGMENTED_CASM_CLASS_SOURCE, directory=PRECOMPILED_CONTRACTS_DIR)
+    )
+
+
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_compute_casm_class_hash_with_executor(executor_class):
+    with executor_class(max_workers=2) as executor:
+        casm_class_hash = compute_casm_class_hash(
+            _segmented_casm_class(), hash_method=HashMethod.BLAKE2S, executor=executor
+        )
+
+    assert casm_class_hash == SEGMENTED_CASM_CLASS_HASH_BLAKE2S
+
+
+def test_compute_casm_class_hash_rehashes_only_modified_segments():
+    casm_class = _segmented_casm_class()
+    segments_count = len(casm_class.bytecode_segment_lengths)
+    cache = BytecodeSegmentHashCache()
+
+    casm_class_hash = compute_casm_class_hash(casm_class, segment_hash_cache=cache)
+    assert casm_class_hash == SEGMENTED_CASM_CLASS_HASH_BLAKE2S
+    assert cache.misses == segments_count
+
+    # Modify the last segment
+    modified_bytecode = [*casm_class.bytecode[:-1], casm_class.bytecode[-1] + 1]
+    modified_casm_class = dataclasses.replace(casm_class, bytecode=modified_bytecode)
+    modified_hash = compute_casm_class_hash(modified_casm_class, segment_hash_cache=cache)
+
+    assert modified_hash == compute_casm_class_hash(modified_casm_class)
+    assert modified_hash != casm_class_hash
+    assert cache.misses == segments_count + 1
+    assert cache.hits == segments_count - 1
+
+
+def test_segment_hash_cache_is_separate_per_hash_method():
+    cache = BytecodeSegmentHashCache()
+
+    assert compute_casm_class_hash(
+        _segmented_casm_class(), hash_method=HashMethod.POSEIDON, segment_hash_cache=cache
+    ) == compute_casm_class_hash(_segmented_casm_class(), hash_method=HashMethod.POSEIDON)
+    assert compute_casm_class_hash(
+        _segmented_casm_class(), hash_method=HashMethod.BLAKE2S, segment_hash_cache=cache
+    ) == SEGMENTED_CASM_CLASS_HASH_BLAKE2S
+
+
+def test_segment_hash_cache_eviction():
+    cache = BytecodeSegmentHashCache(max_entries=3)
+    compute_casm_class_hash(_segmented_casm_class(), segment_hash_cache=cache)
+
+    assert len(cache) == 3
@@ -0,0 +1,192 @@
+# pylint: disable=protected-access
+import copy
+import json
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from starknet_py.hash import class_hash as class_hash_module
+from starknet_py.hash.class_hash import _compute_hinted_class_hash, compute_class_hash
+from starknet_py.hash.utils import _starknet_keccak
+from starknet_py.net.client_models import (
+    DeprecatedContractClass,
+    EntryPoint,
+    EntryPointsByType,
+)
+
+
+def _reference_hinted_class_hash(contract_class: DeprecatedContractClass) -> int:
+    # Previous implementation, which serializes a deep copy of the class at once
+    program = copy.deepcopy(contract_class.program)
+    program["debug_info"] = None
+
+    if "attributes" in program:
+        if len(program["attributes"]) == 0:
+            del program["attributes"]
+        else:
+            for attr in program["attributes"]:
+                if len(attr["accessible_scopes"]) == 0:
+                    del attr["accessible_scopes"]
+                if attr["flow_tracking_data"] is None:
+                    del attr["flow_tracking_data"]
+
+    def fix_cairo_types(obj):
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                if key == "cairo_type":
+                    obj[key] = re.sub(r"(?<! ):", " :", value)
+                else:
+                    fix_cairo_types(value)
+        elif isinstance(obj, list):
+            for item in obj:
+                fix_cairo_types(item)
+
+    if "compiler_version" not in program:
+        fix_cairo_types(program["identifiers"])
+
+    dumped = json.dumps({"abi": contract_class.abi, "program": program})
+    return _starknet_keccak(data=dumped.encode())
+
+
+def _create_contract_class(
+    compiler_version: bool = True, attributes: bool = True, data_length: int = 20
+) -> DeprecatedContractClass:
+    program = {
+        "builtins": ["pedersen", "range_check"],
+        "data": [hex(i) for i in range(data_length)],
+        "debug_info": {"instruction_locations": {"0": {"pc": 0}}},
+        "hints": {"0": [{"code": "memory[ap] = 1", "accessible_scopes": []}]},
+        "identifiers": {
+            "__main__.foo": {
+                "type": "function",
+                "pc": 0,
+                "decorators": ["external"],
+            },
+            "__main__.foo.Args": {
+                "members": {
+                    "a": {"cairo_type": "felt", "offset": 0},
+                    "b": {"cairo_type": "(x: felt, y: felt*)", "offset": 1},
+                },
+                "size": 2,
+                "type": "struct",
+            },
+            "__main__.foo.Return": {
+                "cairo_type": "(res: felt)",
+                "type": "type_definition",
+            },
+        },
+        "main_scope": "__main__",
+        "prime": "0x800000000000011000000000000000000000000000000000000000000000001",
+        "reference_manager": {"references": []},
+    }
+    if compiler_version:
+        program["compiler_version"] = "0.11.0"
+    program["attributes"] = (
+        [
+            {
+                "accessible_scopes": [],
+                "end_pc": 10,
+                "flow_tracking_data": None,
+                "name": "error_message",
+                "start_pc": 4,
+                "value": "Error",
+            },
+            {
+                "accessible_scopes": ["__main__"],
+                "end_pc": 12,
+                "flow_tracking_data": {"ap_tracking": {"group": 1, "offset": 0}},
+                "name": "error_message",
+                "start_pc": 11,
+                "value": "Other",
+            },
+        ]
+        if attributes
+        else []
+    )
+
+    return DeprecatedContractClass(
+        program=program,
+        entry_points_by_type=EntryPointsByType(
+            constructor=[],
+            external=[EntryPoint(offset=0, selector=0x1234)],
+            l1_handler=[],
+        ),
+        abi=[
+            {
+                "inputs": [{"name": "a", "type": "felt"}],
+                "name": "foo",
+                "outputs": [],
+                "type": "function",
+            }
+        ],
+    )
+
+
+@pytest.mark.parametrize("compiler_version", [True, False])
+@pytest.mark.parametrize("attributes", [True, False])
+def test_hinted_class_hash_matches_serialization_of_copy(compiler_version, attributes):
+    contract_class = _create_contract_class(compiler_version, attributes)
+
+    hinted_class_hash = _compute_hinted_class_hash(contract_class)
+
+    assert hinted_class_hash == _reference_hinted_class_hash(contract_class)
+
+
+def test_hinted_class_hash_of_large_program(monkeypatch):
+    # Forces serializing the program data in several chunks and flushing the buffer to the hasher
+    monkeypatch.setattr(class_hash_module, "_SERIALIZATION_LIST_CHUNK_SIZE", 7)
+    monkeypatch.setattr(class_hash_module, "_HASHER_BUFFER_SIZE", 64)
+    contract_class = _create_contract_class(data_length=100)
+
+    hinted_class_hash = _compute_hinted_class_hash(contract_class)
+
+    assert hinted_class_hash == _reference_hinted_class_hash(contract_class)
+
+
+def test_compute_class_hash_does_not_modify_class():
+    contract_class = _create_contract_class(compiler_version=False)
+    program = copy.deepcopy(contract_class.program)
+
+    compute_class_hash(contract_class)
+
+    assert contract_class.program == program
+
+
+def test_compute_class_hash_is_cached(monkeypatch):
+    monkeypatch.setattr(
+        class_hash_module,
+        "_class_hash_cache",
+        OrderedDict(),
+    )
+    contract_class = _create_contract_class()
+
+    class_hash = compute_class_hash(contract_class)
+
+    calls = []
+    compute = class_hash_module._compute_class_hash
+    monkeypatch.setattr(
+        class_hash_module,
+        "_compute_class_hash",
+        lambda *args: calls.append(args) or compute(*args),
+    )
+    assert compute_class_hash(contract_class) == class_hash
+    assert not calls
+
+    # Other objects are hashed again, even when they are equal
+    assert compute_class_hash(copy.deepcopy(contract_class)) == class_hash
+    assert len(calls) == 1
+
+
+def test_compute_class_hash_from_threads(monkeypatch):
+    monkeypatch.setattr(class_hash_module, "_CLASS_HASH_CACHE_SIZE", 2)
+    monkeypatch.setattr(class_hash_module, "_class_hash_cache", OrderedDict())
+    contract_classes = [_create_contract_class(data_length=10) for _ in range(8)]
+    expected = compute_class_hash(copy.deepcopy(contract_classes[0]))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        class_hashes = list(executor.map(compute_class_hash, contract_classes * 4))
+
+    assert class_hashes == [expected] * 32
+    assert len(class_hash_module._class_hash_cache) == 2
@@ -1,13 +1,22 @@
 # pylint: disable=line-too-long
 # fmt: off
+import functools
+
 import pytest
 
+from starknet_py.constants import EC_ORDER, FIELD_PRIME
 from starknet_py.hash.utils import (
     compute_hash_on_elements,
     encode_uint,
     encode_uint_list,
     keccak256,
+    message_signature,
     pedersen_hash,
+    pedersen_hash_chain,
+    pedersen_hash_many,
+    private_to_stark_key,
+    verify_message_signature,
+    verify_signatures_batch,
 )
 
 
@@ -41,6 +50,74 @@ def test_pedersen_hash(first, second, hash_):
     assert pedersen_hash(first, second) == hash_
 
 
+@pytest.mark.parametrize("initial", [0, 1, FIELD_PRIME - 1])
+@pytest.mark.parametrize("data", [[], [1], [28, 15, 39, 74], list(range(100))])
+def test_pedersen_hash_chain(data, initial):
+    expected = functools.reduce(pedersen_hash, data, initial)
+    assert pedersen_hash_chain(encode_uint_list(data), initial=initial) == expected
+
+
+def test_pedersen_hash_chain_invalid_packed_data():
+    with pytest.raises(ValueError, match="must be a multiple of 32"):
+        pedersen_hash_chain(b"\x01" * 33)
+
+    with pytest.raises(ValueError, match="smaller then the modulus"):
+        pedersen_hash_chain(encode_uint(FIELD_PRIME))
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+@pytest.mark.parametrize("pairs_count", [0, 5, 300])
+def test_pedersen_hash_many(pairs_count, max_workers):
+    pairs = [(i, 2 * i + 1) for i in range(pairs_count)]
+
+    assert pedersen_hash_many(pairs, max_workers=max_workers) == [
+        pedersen_hash(left, right) for left, right in pairs
+    ]
+
+
+def test_pedersen_hash_many_invalid_pair():
+    with pytest.raises(ValueError, match="smaller then the modulus"):
+        pedersen_hash_many([(0, 0), (FIELD_PRIME, 0)])
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_verify_signatures_batch(max_workers):
+    private_keys = [0x1234 + i for i in range(4)]
+    public_keys = [private_to_stark_key(key) for key in private_keys] * 6
+    hashes = list(range(1, len(public_keys) + 1))
+    signatures = [
+        list(message_signature(msg_hash, private_keys[i % len(private_keys)]))
+        for i, msg_hash in enumerate(hashes)
+    ]
+    # Invalid signatures: wrong key, wrong hash and zero s component
+    public_keys[1] = public_keys[2]
+    hashes[3] += 1
+    signatures[5][1] = 0
+    # The s component is reduced modulo the curve order, as in verify_message_signature
+    signatures[7][1] += EC_ORDER
+
+    expected = [
+        verify_message_signature(msg_hash, signature, public_key)
+        if signature[1] != 0
+        else False
+        for msg_hash, signature, public_key in zip(hashes, signatures, public_keys)
+    ]
+
+    results = verify_signatures_batch(hashes, signatures, public_keys, max_workers=max_workers)
+
+    assert results == expected
+    assert results.count(False) == 3
+
+
+def test_verify_signatures_batch_empty():
+    assert verify_signatures_batch([], [], []) == []
+
+
+def test_verify_signatures_batch_different_lengths():
+    with pytest.raises(ValueError, match="must have the same length"):
+        verify_signatures_batch([1], [[1, 2]], [])
+
+
 @pytest.mark.parametrize(
     "value, expected_encoded",
     [
@@ -0,0 +1,176 @@
+# pylint: disable=protected-access
+import asyncio
+from typing import List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from starknet_py.constants import RPC_PAGE_SIZE_TOO_BIG_ERROR
+from starknet_py.net.full_node_client import FullNodeClient
+
+EVENTS_PER_BLOCK = 3
+LATEST_BLOCK = 49
+
+
+def _event(block_number: int, event_index: int) -> dict:
+    return {
+        "from_address": "0x1",
+        "keys": [hex(block_number)],
+        "data": [],
+        "transaction_hash": hex(block_number + 1),
+        "transaction_index": 0,
+        "event_index": event_index,
+        "block_hash": hex(block_number + 1),
+        "block_number": block_number,
+    }
+
+
+class _FakeNode:
+    def __init__(self, max_chunk_size: int = 1000):
+        self.max_chunk_size = max_chunk_size
+        self.chunk_sizes: List[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def request(
+        self, address, http_method, params=None, payload=None, timeout=None
+    ):
+        # pylint: disable=unused-argument
+        if payload["method"] == "starknet_blockNumber":
+            return {"jsonrpc": "2.0", "id": payload["id"], "result": LATEST_BLOCK}
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+
+        events_filter = payload["params"]["filter"]
+        chunk_size = events_filter["chunk_size"]
+        self.chunk_sizes.append(chunk_size)
+        if chunk_size > self.max_chunk_size:
+            return {
+                "jsonrpc": "2.0",
+                "id": payload["id"],
+                "error": {"code": RPC_PAGE_SIZE_TOO_BIG_ERROR, "message": "Too big"},
+            }
+
+        events = [
+            _event(block_number, event_index)
+            for block_number in range(
+                events_filter["from_block"]["block_number"],
+                events_filter["to_block"]["block_number"] + 1,
+            )
+            for event_index in range(EVENTS_PER_BLOCK)
+        ]
+        offset = int(events_filter.get("continuation_token", "0"))
+        result = {"events": events[offset : offset + chunk_size]}
+        if offset + chunk_size < len(events):
+            result["continuation_token"] = str(offset + chunk_size)
+        return {"jsonrpc": "2.0", "id": payload["id"], "result": result}
+
+
+def _create_client() -> FullNodeClient:
+    client = FullNodeClient(node_url="http://127.0.0.1:5050/rpc")
+    client._client._is_spec_version_verified = True
+    return client
+
+
+@pytest.mark.asyncio
+async def test_get_events_in_parallel():
+    client = _create_client()
+    node = _FakeNode()
+
+    with patch.object(client._client, "request", AsyncMock(side_effect=node.request)):
+        chunk = await client.get_events_in_parallel(
+            address=0x1, blocks_per_shard=5, max_concurrency=4, chunk_size=2
+        )
+
+    assert chunk.continuation_token is None
+    assert [(event.block_number, event.event_index) for event in chunk.events] == [
+        (block_number, event_index)
+        for block_number in range(LATEST_BLOCK + 1)
+        for event_index in range(EVENTS_PER_BLOCK)
+    ]
+    assert node.max_in_flight == 4
+    # Page size grows within shards with more events
+    assert max(node.chunk_sizes) == 16
+
+
+@pytest.mark.asyncio
+async def test_get_events_in_parallel_reduces_too_big_pages():
+    client = _create_client()
+    node = _FakeNode(max_chunk_size=4)
+
+    with patch.object(client._client, "request", AsyncMock(side_effect=node.request)):
+        chunk = await client.get_events_in_parallel(
+            from_block_number=10, to_block_number=19, chunk_size=16, max_chunk_size=32
+        )
+
+    assert len(chunk.events) == 10 * EVENTS_PER_BLOCK
+    assert chunk.events[0].block_number == 10
+    assert all(chunk_size <= 16 for chunk_size in node.chunk_sizes)
+
+
+@pytest.mark.asyncio
+async def test_iter_events():
+    client = _create_client()
+    node = _FakeNode()
+
+    with patch.object(client._client, "request", AsyncMock(side_effect=node.request)):
+        pages = [
+            page
+            async for page in client.iter_events(
+                from_block_number=0, to_block_number=9, chunk_size=4
+            )
+        ]
+
+    assert [len(page.events) for page in pages] == [4] * 7 + [2]
+    assert [page.continuation_token for page in pages] == [
+        str(offset) for offset in range(4, 30, 4)
+    ] + [None]
+    assert pages[-1].events[-1].block_number == 9
+
+
+@pytest.mark.asyncio
+async def test_iter_events_is_lazy_and_resumable():
+    client = _create_client()
+    node = _FakeNode()
+    request_mock = AsyncMock(side_effect=node.request)
+
+    with patch.object(client._client, "request", request_mock):
+        pages = client.iter_events(from_block_number=0, to_block_number=9, chunk_size=4)
+        first_page = await pages.__anext__()
+        await pages.aclose()
+        assert request_mock.call_count == 1
+
+        resumed = [
+            page
+            async for page in client.iter_events(
+                from_block_number=0,
+                to_block_number=9,
+                chunk_size=4,
+                continuation_token=first_page.continuation_token,
+            )
+        ]
+
+    events = first_page.events + [event for page in resumed for event in page.events]
+    assert [(event.block_number, event.event_index) for event in events] == [
+        (block_number, event_index)
+        for block_number in range(10)
+        for event_index in range(EVENTS_PER_BLOCK)
+    ]
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"blocks_per_shard": 0}, "blocks_per_shard must be greater than 0"),
+        ({"max_concurrency": 0}, "max_concurrency must be greater than 0"),
+        ({"chunk_size": 0}, "chunk_size must be greater than 0"),
+        ({"chunk_size": 10, "max_chunk_size": 5}, "not greater than max_chunk_size"),
+    ],
+)
+@pytest.mark.asyncio
+async def test_get_events_in_parallel_invalid_arguments(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        await _create_client().get_events_in_parallel(to_block_number=10, **kwargs)
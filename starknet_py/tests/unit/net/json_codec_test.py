@@ -0,0 +1,89 @@
+# pylint: disable=protected-access
+import gzip
+import json
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.json_codec import (
+    JsonCodec,
+    MsgspecCodec,
+    StdlibJsonCodec,
+    get_default_json_codec,
+)
+
+
+def _get_codecs():
+    codecs = [StdlibJsonCodec()]
+    try:
+        codecs.append(MsgspecCodec())
+    except ImportError:
+        pass
+    return codecs
+
+
+@pytest.mark.parametrize("codec", _get_codecs())
+def test_codec(codec: JsonCodec):
+    document = {"result": [2**300, -(2**70), "0x1", None, True], "id": 1}
+
+    assert codec.loads(codec.dumps(document)) == document
+    assert codec.loads(json.dumps(document)) == document
+
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b'{"result": ')
+
+
+def test_default_codec():
+    try:
+        MsgspecCodec()
+    except ImportError:
+        assert isinstance(get_default_json_codec(), StdlibJsonCodec)
+    else:
+        assert isinstance(get_default_json_codec(), MsgspecCodec)
+
+
+@pytest_asyncio.fixture(name="node_url")
+async def fixture_node_url():
+    # Node responding with the gzip compressed body when the client accepts it
+    async def handle(request: web.Request) -> web.Response:
+        payload = await request.json()
+        body = json.dumps(
+            {"jsonrpc": "2.0", "id": payload["id"], "result": 2**70}
+        ).encode()
+        if "gzip" not in request.headers.get("Accept-Encoding", ""):
+            return web.Response(body=body, content_type="application/json")
+        return web.Response(
+            body=gzip.compress(body),
+            content_type="application/json",
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    app = web.Application()
+    app.router.add_post("/rpc", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    yield f"http://127.0.0.1:{port}/rpc"
+
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("codec", _get_codecs())
+async def test_compressed_responses_are_decoded_with_codec(node_url, codec):
+    async with FullNodeClient(node_url=node_url, json_codec=codec) as client:
+        client._client._is_spec_version_verified = True
+
+        assert await client.get_block_number() == 2**70
+
+        raw_response = await client.get_raw_response("blockNumber")
+        assert json.loads(raw_response) == {
+            "jsonrpc": "2.0",
+            "id": 0,
+            "result": 2**70,
+        }
@@ -0,0 +1,195 @@
+# pylint: disable=protected-access
+import json
+from contextlib import aclosing
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.client_models import StorageDiffItem, StorageEntry
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.json_stream import IncrementalJsonParser
+from starknet_py.net.rate_limiter import RateLimiter
+
+STORAGE_DIFFS = [
+    {
+        "address": hex(address),
+        "storage_entries": [{"key": "0x1", "value": hex(2**250 + address)}],
+    }
+    for address in range(1, 6)
+]
+
+STATE_UPDATE_RESPONSE = {
+    "jsonrpc": "2.0",
+    "id": 0,
+    "result": {
+        "block_hash": "0x1",
+        "old_root": "0x2",
+        "new_root": "0x3",
+        "state_diff": {
+            "nonces": [{"contract_address": "0x1", "nonce": "0x2"}],
+            "storage_diffs": STORAGE_DIFFS,
+            "declared_classes": [],
+            "deprecated_declared_classes": [],
+            "deployed_contracts": [],
+            "replaced_classes": [],
+        },
+    },
+}
+
+
+def _parse(document: bytes, path, chunk_size: int):
+    parser = IncrementalJsonParser(path=path)
+    items = []
+    for start in range(0, len(document), chunk_size):
+        items.extend(parser.feed(document[start : start + chunk_size]))
+    parser.close()
+    return items, parser
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 16, 10**6])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_parse_nested_array(chunk_size, indent):
+    document = json.dumps(STATE_UPDATE_RESPONSE, indent=indent).encode()
+
+    items, parser = _parse(
+        document, ["result", "state_diff", "storage_diffs"], chunk_size
+    )
+
+    assert items == STORAGE_DIFFS
+    assert parser.members == {"jsonrpc": "2.0", "id": 0}
+    assert parser.is_array_found
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 10**6])
+def test_parse_array(chunk_size):
+    array = [2**300, -1.5e3, '[{\\"ą\\"}]', True, None, [], {"a": [1, {}]}, 12345]
+
+    items, _ = _parse(json.dumps(array, ensure_ascii=False).encode(), [], chunk_size)
+
+    assert items == array
+
+
+@pytest.mark.parametrize("split", range(1, len(b"[-1.5e+3, 2]")))
+def test_parse_number_split_between_chunks(split):
+    document = b"[-1.5e+3, 2]"
+    parser = IncrementalJsonParser(path=[])
+
+    items = parser.feed(document[:split]) + parser.feed(document[split:])
+    parser.close()
+
+    assert items == [-1.5e3, 2]
+
+
+def test_parse_without_array():
+    error = {"code": 24, "message": "Block not found"}
+
+    items, parser = _parse(
+        json.dumps({"jsonrpc": "2.0", "id": 0, "error": error}).encode(),
+        ["result"],
+        8,
+    )
+
+    assert not items
+    assert parser.members["error"] == error
+    assert not parser.is_array_found
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        b'{"result": [1,]}',
+        b'{"result": [1',
+        b'{"result": {}}',
+        b'{"result": [] } {}',
+        b'{"result": [1 2]}',
+        b'{"result" []}',
+        b"[]",
+    ],
+)
+def test_invalid_document(document):
+    with pytest.raises(json.JSONDecodeError):
+        _parse(document, ["result"], 4)
+
+
+@pytest_asyncio.fixture(name="node_url")
+async def fixture_node_url():
+    # Node sending the response in small parts
+    async def handle(request: web.Request) -> web.StreamResponse:
+        payload = await request.json()
+        if payload["method"] == "starknet_getStateUpdate":
+            response = STATE_UPDATE_RESPONSE
+        else:
+            response = {
+                "jsonrpc": "2.0",
+                "id": 0,
+                "error": {"code": 24, "message": "Block not found"},
+            }
+
+        stream = web.StreamResponse(headers={"Content-Type": "application/json"})
+        await stream.prepare(request)
+        body = json.dumps(response).encode()
+        for start in range(0, len(body), 64):
+            await stream.write(body[start : start + 64])
+        await stream.write_eof()
+        return stream
+
+    app = web.Application()
+    app.router.add_post("/rpc", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    yield f"http://127.0.0.1:{port}/rpc"
+
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_iter_storage_diffs(node_url):
+    async with FullNodeClient(node_url=node_url) as client:
+        client._client._is_spec_version_verified = True
+
+        storage_diffs = [
+            storage_diff
+            async for storage_diff in client.iter_storage_diffs(block_number=1)
+        ]
+        nonces = [
+            nonce
+            async for nonce in client.iter_response_items(
+                "getStateUpdate", {"block_id": "latest"}, path=["state_diff", "nonces"]
+            )
+        ]
+
+    assert storage_diffs[0] == StorageDiffItem(
+        address=0x1, storage_entries=[StorageEntry(key=0x1, value=2**250 + 1)]
+    )
+    assert len(storage_diffs) == len(STORAGE_DIFFS)
+    assert nonces == [{"contract_address": "0x1", "nonce": "0x2"}]
+
+
+@pytest.mark.asyncio
+async def test_iter_block_transaction_traces_raises_node_errors(node_url):
+    async with FullNodeClient(node_url=node_url) as client:
+        client._client._is_spec_version_verified = True
+
+        with pytest.raises(ClientError, match="Block not found"):
+            async for _ in client.iter_block_transaction_traces(block_number=1):
+                pass
+
+
+@pytest.mark.asyncio
+async def test_stopping_iteration_early_releases_request(node_url):
+    rate_limiter = RateLimiter(max_in_flight=1)
+    async with FullNodeClient(node_url=node_url, rate_limiter=rate_limiter) as client:
+        client._client._is_spec_version_verified = True
+
+        async with aclosing(client.iter_storage_diffs(block_number=1)) as storage_diffs:
+            async for _ in storage_diffs:
+                assert rate_limiter.stats.in_flight == 1
+                break
+
+        assert rate_limiter.stats.in_flight == 0
@@ -0,0 +1,88 @@
+# pylint: disable=protected-access
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from marshmallow import ValidationError
+
+from starknet_py.net.client_models import TransactionWithReceipt
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.lazy_sequence import LazySequence
+from starknet_py.net.schemas.rpc.block import StarknetBlockWithReceiptsSchema
+from starknet_py.tests.e2e.fixtures.constants import MOCK_DIR
+
+NODE_URL = "http://127.0.0.1:5050/rpc"
+
+
+@pytest.fixture(name="block_with_receipts")
+def fixture_block_with_receipts() -> dict:
+    return json.loads(
+        (MOCK_DIR / "rpc" / "block_with_receipts.json").read_text("utf-8")
+    )
+
+
+def test_items_are_decoded_once_on_access():
+    decode = Mock(side_effect=lambda item: item * 2)
+    sequence = LazySequence([1, 2, 3, 4], decode)
+
+    assert len(sequence) == 4
+    assert decode.call_count == 0
+
+    assert sequence[1] == 4
+    assert sequence[-1] == 8
+    assert sequence[1] == 4
+    assert decode.call_count == 2
+    assert sequence.decoded_count == 2
+
+    assert sequence[1:3] == [4, 6]
+    assert list(sequence) == [2, 4, 6, 8]
+    assert decode.call_count == 4
+    assert sequence == [2, 4, 6, 8]
+    assert sequence.raw_items == [1, 2, 3, 4]
+
+    with pytest.raises(IndexError):
+        _ = sequence[4]
+
+
+@pytest.mark.asyncio
+async def test_get_block_with_receipts_lazily(block_with_receipts):
+    client = FullNodeClient(node_url=NODE_URL)
+
+    with patch.object(
+        client._client, "call", AsyncMock(return_value=block_with_receipts)
+    ):
+        block = await client.get_block_with_receipts(block_number=1, lazy=True)
+
+    assert isinstance(block.transactions, LazySequence)
+    assert block.transactions.decoded_count == 0
+    assert block.block_number == block_with_receipts["block_number"]
+
+    transaction = block.transactions[2]
+    assert isinstance(transaction, TransactionWithReceipt)
+    assert block.transactions.decoded_count == 1
+
+    assert block == StarknetBlockWithReceiptsSchema().load(block_with_receipts)
+
+
+@pytest.mark.asyncio
+async def test_trace_block_transactions_lazily():
+    client = FullNodeClient(node_url=NODE_URL)
+    traces = [
+        {
+            "transaction_hash": "0x1",
+            "trace_root": {
+                "type": "DECLARE",
+                "execution_resources": {"l1_gas": 1, "l1_data_gas": 2, "l2_gas": 3},
+            },
+        },
+        {"transaction_hash": "0x2", "trace_root": "invalid"},
+    ]
+
+    with patch.object(client._client, "call", AsyncMock(return_value=traces)):
+        result = await client.trace_block_transactions(block_number=1, lazy=True)
+
+    assert len(result) == 2
+    assert result[0].transaction_hash == 0x1
+    # Invalid traces raise errors only when they are accessed
+    with pytest.raises(ValidationError):
+        _ = result[1]
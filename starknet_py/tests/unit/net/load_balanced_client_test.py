@@ -0,0 +1,249 @@
+# pylint: disable=protected-access
+import asyncio
+from contextlib import ExitStack
+from typing import Dict, List, Optional
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from starknet_py.net.client_errors import ClientError, HttpStatusError
+from starknet_py.net.load_balanced_client import (
+    LoadBalancedClient,
+    LoadBalancingStrategy,
+)
+from starknet_py.net.request_coalescer import CoalescingConfig
+
+NODE_URLS = [
+    "http://node-a:5050/rpc",
+    "http://node-b:5050/rpc",
+    "http://node-c:5050/rpc",
+]
+
+
+def _create_client(**kwargs) -> LoadBalancedClient:
+    client = LoadBalancedClient(
+        node_urls=NODE_URLS, health_check_interval=None, **kwargs
+    )
+    for backend in client.backends:
+        backend.http_client._is_spec_version_verified = True
+    return client
+
+
+def _node(block_number: int = 100, error: Optional[Exception] = None):
+    async def request(address, http_method, params=None, payload=None, timeout=None):
+        # pylint: disable=unused-argument
+        if error is not None:
+            raise error
+        if payload["method"] == "starknet_blockNumber":
+            result = block_number
+        elif payload["method"] == "starknet_addInvokeTransaction":
+            result = {"transaction_hash": "0x1"}
+        else:
+            result = "0x5"
+        return {"jsonrpc": "2.0", "id": payload["id"], "result": result}
+
+    return AsyncMock(side_effect=request)
+
+
+def _patch_nodes(client: LoadBalancedClient, nodes: List[AsyncMock]) -> ExitStack:
+    stack = ExitStack()
+    for backend, node in zip(client.backends, nodes):
+        stack.enter_context(patch.object(backend.http_client, "request", node))
+    return stack
+
+
+def _call_counts(nodes: List[AsyncMock]) -> List[int]:
+    return [node.call_count for node in nodes]
+
+
+@pytest.mark.asyncio
+async def test_round_robin():
+    client = _create_client(strategy=LoadBalancingStrategy.ROUND_ROBIN)
+    nodes = [_node(), _node(), _node()]
+
+    with _patch_nodes(client, nodes):
+        for _ in range(6):
+            assert await client.get_contract_nonce(0x1) == 0x5
+
+    assert _call_counts(nodes) == [2, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_least_outstanding_requests():
+    client = _create_client(strategy=LoadBalancingStrategy.LEAST_OUTSTANDING)
+    nodes = [_node(), _node(), _node()]
+
+    with _patch_nodes(client, nodes):
+        await asyncio.gather(*(client.get_contract_nonce(0x1) for _ in range(3)))
+
+    assert _call_counts(nodes) == [1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_latency_weighted_prefers_fast_nodes():
+    client = _create_client(strategy=LoadBalancingStrategy.LATENCY_WEIGHTED)
+    latencies = [0.001, 10.0, 10.0]
+    for backend, latency in zip(client.backends, latencies):
+        backend.latency = latency
+    nodes = [_node(), _node(), _node()]
+
+    with _patch_nodes(client, nodes):
+        for _ in range(50):
+            await client.get_contract_nonce(0x1)
+
+    assert nodes[0].call_count > 40
+
+
+@pytest.mark.asyncio
+async def test_failover_to_another_node():
+    client = _create_client(strategy=LoadBalancingStrategy.ROUND_ROBIN)
+    nodes = [
+        _node(error=HttpStatusError(status=503, message="")),
+        _node(error=HttpStatusError(status=503, message="")),
+        _node(),
+    ]
+
+    with _patch_nodes(client, nodes):
+        assert await client.get_contract_nonce(0x1) == 0x5
+        assert await client.get_contract_nonce(0x1) == 0x5
+
+    # Failed nodes are excluded for the failure cooldown
+    assert _call_counts(nodes) == [1, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_all_nodes_failing():
+    client = _create_client()
+    nodes = [_node(error=HttpStatusError(status=503, message="")) for _ in NODE_URLS]
+
+    with _patch_nodes(client, nodes):
+        with pytest.raises(HttpStatusError):
+            await client.get_contract_nonce(0x1)
+
+    assert _call_counts(nodes) == [1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_rpc_errors_are_not_failed_over():
+    client = _create_client()
+
+    async def request(address, http_method, params=None, payload=None, timeout=None):
+        # pylint: disable=unused-argument
+        return {
+            "jsonrpc": "2.0",
+            "id": payload["id"],
+            "error": {"code": 20, "message": "Contract not found"},
+        }
+
+    nodes = [AsyncMock(side_effect=request) for _ in NODE_URLS]
+    with _patch_nodes(client, nodes):
+        with pytest.raises(ClientError, match="Contract not found"):
+            await client.get_contract_nonce(0x1)
+
+    assert sum(_call_counts(nodes)) == 1
+
+
+@pytest.mark.asyncio
+async def test_transactions_are_not_failed_over_blindly():
+    client = _create_client(strategy=LoadBalancingStrategy.ROUND_ROBIN)
+    nodes = [_node(error=HttpStatusError(status=503, message="")) for _ in NODE_URLS]
+
+    with _patch_nodes(client, nodes):
+        with pytest.raises(HttpStatusError):
+            await client._client.call(method_name="addInvokeTransaction", params={})
+
+    assert sum(_call_counts(nodes)) == 1
+
+
+@pytest.mark.asyncio
+async def test_health_check_ejects_lagging_nodes():
+    client = _create_client(strategy=LoadBalancingStrategy.ROUND_ROBIN, max_block_lag=5)
+    nodes = [
+        _node(block_number=100),
+        _node(block_number=90),
+        _node(error=HttpStatusError(status=502, message="")),
+    ]
+
+    with _patch_nodes(client, nodes):
+        await client.check_health()
+        for _ in range(4):
+            await client.get_contract_nonce(0x1)
+
+    block_numbers: Dict[str, Optional[int]] = {
+        backend.url: backend.block_number for backend in client.backends
+    }
+    assert block_numbers == {NODE_URLS[0]: 100, NODE_URLS[1]: 90, NODE_URLS[2]: None}
+    assert [backend.is_lagging for backend in client.backends] == [False, True, False]
+    # 1 health check and 4 calls for the only available node
+    assert _call_counts(nodes) == [5, 1, 1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("coalescing", [None, CoalescingConfig()])
+async def test_read_your_writes_stickiness(coalescing):
+    client = _create_client(
+        strategy=LoadBalancingStrategy.ROUND_ROBIN, coalescing=coalescing
+    )
+    nodes = [_node(), _node(), _node()]
+
+    with _patch_nodes(client, nodes):
+        await client._client.call(method_name="addInvokeTransaction", params={})
+        sent_to = _call_counts(nodes).index(1)
+
+        for _ in range(3):
+            await client.get_contract_nonce(0x1)
+
+    assert _call_counts(nodes)[sent_to] == 4
+
+
+@pytest.mark.asyncio
+async def test_stream_is_sticky():
+    client = _create_client(strategy=LoadBalancingStrategy.ROUND_ROBIN)
+    nodes = [_node(), _node(), _node()]
+    streamed_from = []
+
+    def stream(url):
+        async def items(method_name, params=None, path=()):
+            # pylint: disable=unused-argument
+            streamed_from.append(url)
+            yield 0x5
+
+        return items
+
+    with _patch_nodes(client, nodes), ExitStack() as stack:
+        for backend in client.backends:
+            stack.enter_context(
+                patch.object(backend.http_client, "stream", stream(backend.url))
+            )
+        await client._client.call(method_name="addInvokeTransaction", params={})
+        sent_to = NODE_URLS[_call_counts(nodes).index(1)]
+
+        for _ in range(3):
+            async for _ in client._client.stream(method_name="getStateUpdate"):
+                pass
+
+    assert streamed_from == [sent_to] * 3
+
+
+@pytest.mark.asyncio
+async def test_batch_is_routed_to_single_node():
+    client = _create_client(strategy=LoadBalancingStrategy.ROUND_ROBIN)
+
+    async def request(address, http_method, params=None, payload=None, timeout=None):
+        # pylint: disable=unused-argument
+        return [
+            {"jsonrpc": "2.0", "id": entry["id"], "result": "0x5"} for entry in payload
+        ]
+
+    nodes = [AsyncMock(side_effect=request) for _ in NODE_URLS]
+    with _patch_nodes(client, nodes):
+        async with client.batch() as batch:
+            nonces = [batch.add(client.get_contract_nonce(i)) for i in range(3)]
+
+    assert [nonce.result() for nonce in nonces] == [0x5] * 3
+    assert sum(_call_counts(nodes)) == 1
+
+
+def test_no_node_urls():
+    with pytest.raises(ValueError, match="At least one node url"):
+        LoadBalancedClient(node_urls=[])
@@ -0,0 +1,133 @@
+# pylint: disable=protected-access, no-member
+import asyncio
+import gc
+import threading
+import warnings
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.managed_session import ConnectionPoolConfig, ManagedSession
+
+
+@pytest.fixture(name="node_url")
+def fixture_node_url():
+    # Node running in its own thread, as synchronous methods cannot be called from a running event loop
+    async def handle(request: web.Request) -> web.Response:
+        payload = await request.json()
+        return web.json_response({"jsonrpc": "2.0", "id": payload["id"], "result": 1})
+
+    loop = asyncio.new_event_loop()
+    runner = web.AppRunner(web.Application())
+    runner.app.router.add_post("/rpc", handle)
+    loop.run_until_complete(runner.setup())
+    loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", 0).start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{runner.addresses[0][1]}/rpc"
+
+    asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+@pytest.mark.asyncio
+async def test_session_is_reused():
+    managed_session = ManagedSession()
+
+    session = await managed_session.get()
+    assert session is not None
+    assert await managed_session.get() is session
+
+    await managed_session.close()
+    assert session.closed
+    assert await managed_session.get() is not session
+
+    await managed_session.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_config_is_applied():
+    managed_session = ManagedSession(
+        ConnectionPoolConfig(limit=10, limit_per_host=5, ttl_dns_cache=60)
+    )
+
+    session = await managed_session.get()
+    assert session is not None
+    connector = session.connector
+    assert isinstance(connector, aiohttp.TCPConnector)
+    assert connector.limit == 10
+    assert connector.limit_per_host == 5
+
+    await managed_session.close()
+
+
+def test_session_is_recreated_for_new_event_loop():
+    managed_session = ManagedSession()
+
+    first = asyncio.run(managed_session.get())
+    second = asyncio.run(managed_session.get())
+
+    assert first is not None and first.closed
+    assert second is not None and second is not first
+
+    asyncio.run(managed_session.close())
+    assert second.closed
+
+
+@pytest.mark.filterwarnings("error::ResourceWarning")
+def test_sync_calls_close_their_sessions(node_url):
+    client = FullNodeClient(node_url=node_url)
+    client._client._is_spec_version_verified = True
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        assert client.get_block_number_sync() == 1
+        assert client.get_block_number_sync() == 1
+        gc.collect()
+
+    assert client._managed_session is not None
+    assert client._managed_session._session is None
+    assert not [
+        warning for warning in caught if issubclass(warning.category, ResourceWarning)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_client_closes_owned_session():
+    async with FullNodeClient(node_url="http://127.0.0.1:5050/rpc") as client:
+        assert client._managed_session is not None
+        session = await client._managed_session.get()
+
+    assert session is not None and session.closed
+
+
+@pytest.mark.asyncio
+async def test_client_does_not_close_custom_session():
+    async with aiohttp.ClientSession() as session:
+        async with FullNodeClient(
+            node_url="http://127.0.0.1:5050/rpc", session=session
+        ) as client:
+            assert client._managed_session is None
+
+        assert not session.closed
+
+
+@pytest.mark.asyncio
+async def test_session_and_connection_pool_are_mutually_exclusive():
+    async with aiohttp.ClientSession() as session:
+        with pytest.raises(ValueError, match="mutually exclusive"):
+            FullNodeClient(
+                node_url="http://127.0.0.1:5050/rpc",
+                session=session,
+                connection_pool=ConnectionPoolConfig(),
+            )
+
+
+def test_invalid_connection_pool_config():
+    with pytest.raises(ValueError, match="limit_per_host must be greater"):
+        ConnectionPoolConfig(limit_per_host=-1)
@@ -0,0 +1,125 @@
+# pylint: disable=protected-access
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.rate_limiter import RateLimiter
+
+
+@pytest.mark.asyncio
+async def test_max_in_flight():
+    limiter = RateLimiter(max_in_flight=2)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def send():
+        nonlocal in_flight, max_in_flight
+        async with limiter.acquire(["getNonce"]):
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*(send() for _ in range(6)))
+
+    assert max_in_flight == 2
+    stats = limiter.stats
+    assert stats.in_flight == 0
+    assert stats.queued == 0
+    # The first 2 requests are admitted right away
+    assert stats.max_queued == 4
+    assert stats.admitted == 6
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_rate():
+    limiter = RateLimiter(requests_per_second=50, burst=2)
+
+    start = time.monotonic()
+    for _ in range(5):
+        async with limiter.acquire(["getNonce"]):
+            pass
+    elapsed = time.monotonic() - start
+
+    # 2 requests are admitted from the burst, the remaining 3 wait 0.02s each
+    assert elapsed >= 0.05
+    assert limiter.stats.total_wait_time >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_method_weights():
+    limiter = RateLimiter(
+        requests_per_second=100,
+        burst=10,
+        method_weights={"traceBlockTransactions": 10},
+    )
+
+    assert limiter.get_weight(["getNonce", "traceBlockTransactions"]) == 11
+
+    async with limiter.acquire(["traceBlockTransactions"]):
+        pass
+    start = time.monotonic()
+    async with limiter.acquire(["getNonce"]):
+        pass
+
+    # The bucket was emptied by the heavy call
+    assert time.monotonic() - start >= 0.009
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_releases_slot():
+    limiter = RateLimiter(max_in_flight=1)
+
+    async def hold():
+        async with limiter.acquire(["getNonce"]):
+            await asyncio.sleep(10)
+
+    task = asyncio.ensure_future(hold())
+    await asyncio.sleep(0)
+    assert limiter.stats.in_flight == 1
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    async with limiter.acquire(["getNonce"]):
+        assert limiter.stats.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_client_requests_are_limited():
+    limiter = RateLimiter(max_in_flight=1)
+    client = FullNodeClient(node_url="http://127.0.0.1:5050/rpc", rate_limiter=limiter)
+    client._client._is_spec_version_verified = True
+    in_flight = []
+
+    async def request(address, http_method, params=None, payload=None, timeout=None):
+        # pylint: disable=unused-argument
+        in_flight.append(limiter.stats.in_flight)
+        await asyncio.sleep(0.001)
+        return {"jsonrpc": "2.0", "id": payload["id"], "result": "0x5"}
+
+    with patch.object(client._client, "request", AsyncMock(side_effect=request)):
+        results = await asyncio.gather(
+            *(client.get_contract_nonce(address) for address in range(4))
+        )
+
+    assert results == [0x5] * 4
+    assert in_flight == [1] * 4
+    assert limiter.stats.admitted == 4
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"max_in_flight": 0}, "max_in_flight must be greater than 0"),
+        ({"requests_per_second": -1}, "requests_per_second must be greater than 0"),
+        ({"burst": 0}, "burst must be greater than 0"),
+    ],
+)
+def test_invalid_rate_limiter_arguments(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        RateLimiter(**kwargs)
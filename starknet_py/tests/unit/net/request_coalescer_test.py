@@ -0,0 +1,122 @@
+# pylint: disable=protected-access
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.request_coalescer import CoalescingConfig
+
+
+def _respond(payload):
+    if payload["method"] == "starknet_getNonce":
+        return {"jsonrpc": "2.0", "id": payload["id"], "result": "0x5"}
+    return {
+        "jsonrpc": "2.0",
+        "id": payload["id"],
+        "error": {"code": 20, "message": "Contract not found"},
+    }
+
+
+async def _fake_request(address, http_method, params=None, payload=None, timeout=None):
+    # pylint: disable=unused-argument
+    if isinstance(payload, list):
+        return [_respond(entry) for entry in payload]
+    return _respond(payload)
+
+
+def _create_client(config: CoalescingConfig) -> FullNodeClient:
+    client = FullNodeClient(node_url="http://127.0.0.1:5050/rpc", coalescing=config)
+    client._client._is_spec_version_verified = True
+    return client
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_coalesced():
+    client = _create_client(CoalescingConfig(window=0.01))
+
+    with patch.object(
+        client._client, "request", AsyncMock(side_effect=_fake_request)
+    ) as request_mock:
+        results = await asyncio.gather(
+            *(client.get_contract_nonce(address) for address in range(10))
+        )
+
+    assert results == [0x5] * 10
+    request_mock.assert_called_once()
+    assert len(request_mock.call_args.kwargs["payload"]) == 10
+
+
+@pytest.mark.asyncio
+async def test_identical_calls_are_deduplicated():
+    client = _create_client(CoalescingConfig(window=0.01))
+
+    with patch.object(
+        client._client, "request", AsyncMock(side_effect=_fake_request)
+    ) as request_mock:
+        results = await asyncio.gather(
+            *(client.get_contract_nonce(0x1) for _ in range(5))
+        )
+
+    assert results == [0x5] * 5
+    request_mock.assert_called_once()
+    # A single distinct call is sent without the batch wrapping
+    assert isinstance(request_mock.call_args.kwargs["payload"], dict)
+
+
+@pytest.mark.asyncio
+async def test_deduplication_disabled():
+    client = _create_client(CoalescingConfig(window=0.01, deduplicate=False))
+
+    with patch.object(
+        client._client, "request", AsyncMock(side_effect=_fake_request)
+    ) as request_mock:
+        await asyncio.gather(*(client.get_contract_nonce(0x1) for _ in range(5)))
+
+    assert len(request_mock.call_args.kwargs["payload"]) == 5
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_flushes_immediately():
+    client = _create_client(CoalescingConfig(window=10, max_batch_size=4))
+
+    with patch.object(
+        client._client, "request", AsyncMock(side_effect=_fake_request)
+    ) as request_mock:
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(client.get_contract_nonce(address) for address in range(8))
+            ),
+            timeout=1,
+        )
+
+    assert results == [0x5] * 8
+    assert request_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesced_errors_are_raised_per_call():
+    client = _create_client(CoalescingConfig(window=0.01))
+
+    with patch.object(client._client, "request", AsyncMock(side_effect=_fake_request)):
+        nonce, block_number = await asyncio.gather(
+            client.get_contract_nonce(0x1),
+            client.get_block_number(),
+            return_exceptions=True,
+        )
+
+    assert nonce == 0x5
+    assert isinstance(block_number, ClientError)
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"window": -1}, "window must be greater than or equal to 0"),
+        ({"max_batch_size": 0}, "max_batch_size must be greater than 0"),
+    ],
+)
+def test_invalid_coalescing_config(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        CoalescingConfig(**kwargs)
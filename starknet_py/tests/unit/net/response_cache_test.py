@@ -0,0 +1,144 @@
+# pylint: disable=protected-access
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.response_cache import ResponseCache, is_cacheable
+
+NODE_URL = "http://127.0.0.1:5050/rpc"
+
+
+async def _fake_request(address, http_method, params=None, payload=None, timeout=None):
+    # pylint: disable=unused-argument
+    if payload["method"] == "starknet_getTransactionReceipt":
+        result = {"finality_status": payload["params"]["transaction_hash"]}
+    else:
+        result = "0x5"
+    return {"jsonrpc": "2.0", "id": payload["id"], "result": result}
+
+
+def _create_client(cache: ResponseCache) -> FullNodeClient:
+    client = FullNodeClient(node_url=NODE_URL, response_cache=cache)
+    client._client._is_spec_version_verified = True
+    return client
+
+
+@pytest.mark.parametrize(
+    "method_name, params, result, expected",
+    [
+        ("getNonce", {"block_id": {"block_number": 1}}, "0x1", True),
+        ("getNonce", {"block_id": {"block_hash": "0x1"}}, "0x1", True),
+        ("getNonce", {"block_id": "latest"}, "0x1", False),
+        ("getNonce", {"block_id": "pre_confirmed"}, "0x1", False),
+        ("getCompiledCasm", {"class_hash": "0x1"}, {}, True),
+        ("chainId", {}, "0x1", True),
+        ("blockNumber", {}, 1, False),
+        ("getTransactionStatus", {"transaction_hash": "0x1"}, {}, False),
+        ("getTransactionReceipt", {}, {"finality_status": "ACCEPTED_ON_L1"}, True),
+        ("getTransactionReceipt", {}, {"finality_status": "ACCEPTED_ON_L2"}, False),
+    ],
+)
+def test_is_cacheable(method_name, params, result, expected):
+    assert is_cacheable(method_name, params, result) is expected
+
+
+@pytest.mark.asyncio
+async def test_immutable_results_are_cached():
+    client = _create_client(ResponseCache())
+
+    with patch.object(
+        client._client, "request", AsyncMock(side_effect=_fake_request)
+    ) as request_mock:
+        for _ in range(3):
+            assert await client.get_contract_nonce(0x1, block_number=10) == 0x5
+        await client.get_contract_nonce(0x1, block_number="latest")
+        await client.get_contract_nonce(0x1, block_number="latest")
+        await client.get_contract_nonce(0x2, block_number=10)
+
+    # 1 cached call, 2 calls for latest block and 1 for another contract
+    assert request_mock.call_count == 4
+    assert client._client.response_cache.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_receipts_are_cached_once_accepted_on_l1():
+    client = _create_client(ResponseCache())
+
+    with patch.object(
+        client._client, "request", AsyncMock(side_effect=_fake_request)
+    ) as request_mock:
+        for tx_hash in ["ACCEPTED_ON_L2", "ACCEPTED_ON_L2", "ACCEPTED_ON_L1"] * 2:
+            await client._client.call(
+                method_name="getTransactionReceipt",
+                params={"transaction_hash": tx_hash},
+            )
+
+    assert request_mock.call_count == 5
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_size=20)
+    cache.put("a", "x" * 6)
+    cache.put("b", "y" * 6)
+    # Refresh "a", so "b" is the least recently used entry
+    assert cache.get("a") == "x" * 6
+    cache.put("c", "z" * 6)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "x" * 6
+    assert cache.get("c") == "z" * 6
+    assert len(cache) == 2
+    assert cache.size == 16
+
+
+def test_entries_larger_than_max_size_are_not_kept_in_memory():
+    cache = ResponseCache(max_size=4)
+    cache.put("a", "too large")
+
+    assert cache.get("a") is None
+    assert cache.size == 0
+
+
+def test_persistence(tmp_path):
+    path = tmp_path / "responses.sqlite"
+    cache = ResponseCache(path=path)
+    cache.put("a", {"abi": [1, 2, 3]})
+    cache.close()
+
+    cache = ResponseCache(path=path)
+    assert cache.get("a") == {"abi": [1, 2, 3]}
+
+    cache.clear()
+    assert cache.get("a") is None
+    cache.close()
+
+
+def test_cached_results_are_copies():
+    cache = ResponseCache()
+    cache.put("a", {"abi": []})
+    cache.get("a")["abi"].append(1)
+
+    assert cache.get("a") == {"abi": []}
+
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError, match="max_size must be greater than 0"):
+        ResponseCache(max_size=0)
+
+
+def test_persistent_cache_in_sync_methods(tmp_path):
+    # Synchronous methods run in worker threads, other than the one which created the cache
+    caches = [ResponseCache(path=tmp_path / "cache.db") for _ in range(2)]
+    request_mock = AsyncMock(side_effect=_fake_request)
+
+    for cache in caches:
+        client = _create_client(cache)
+        with patch.object(client._client, "request", request_mock):
+            for _ in range(3):
+                assert client.get_chain_id_sync() == "0x5"  # pylint: disable=no-member
+        cache.close()
+
+    # The result persisted by the first cache is read by the second one
+    assert request_mock.call_count == 1
+    assert caches[1].hits == 3
@@ -0,0 +1,186 @@
+# pylint: disable=protected-access
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from starknet_py.net.client_errors import HttpStatusError
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.http_client import _parse_retry_after
+from starknet_py.net.retry_policy import RetryPolicy
+
+NO_DELAY_POLICY = RetryPolicy(max_retries=3, backoff_base=0, jitter=False)
+
+
+def _create_client(retry_policy: RetryPolicy) -> FullNodeClient:
+    client = FullNodeClient(
+        node_url="http://127.0.0.1:5050/rpc", retry_policy=retry_policy
+    )
+    client._client._is_spec_version_verified = True
+    return client
+
+
+def _failing_then_succeeding(*errors):
+    side_effect = [*errors, {"jsonrpc": "2.0", "id": 0, "result": 10}]
+    return AsyncMock(side_effect=side_effect)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [
+        HttpStatusError(status=503, message="Service Unavailable"),
+        HttpStatusError(status=429, message="Too Many Requests"),
+        aiohttp.ServerDisconnectedError(),
+        asyncio.TimeoutError(),
+    ],
+)
+async def test_transient_errors_are_retried(error):
+    client = _create_client(NO_DELAY_POLICY)
+
+    with patch.object(
+        client._client, "request", _failing_then_succeeding(error, error)
+    ) as request_mock:
+        assert await client.get_block_number() == 10
+
+    assert request_mock.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_retries_are_limited():
+    client = _create_client(NO_DELAY_POLICY)
+    error = HttpStatusError(status=502, message="Bad Gateway")
+
+    with patch.object(
+        client._client, "request", AsyncMock(side_effect=error)
+    ) as request_mock:
+        with pytest.raises(HttpStatusError):
+            await client.get_block_number()
+
+    assert request_mock.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_non_transient_errors_are_not_retried():
+    client = _create_client(NO_DELAY_POLICY)
+    error = HttpStatusError(status=400, message="Bad Request")
+
+    with patch.object(
+        client._client, "request", AsyncMock(side_effect=error)
+    ) as request_mock:
+        with pytest.raises(HttpStatusError):
+            await client.get_block_number()
+
+    request_mock.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_adding_transactions_is_not_retried_blindly():
+    client = _create_client(NO_DELAY_POLICY)
+
+    with patch.object(
+        client._client,
+        "request",
+        _failing_then_succeeding(HttpStatusError(status=503, message="")),
+    ) as request_mock:
+        with pytest.raises(HttpStatusError):
+            await client._client.call(method_name="addInvokeTransaction", params={})
+    request_mock.assert_called_once()
+
+    with patch.object(
+        client._client,
+        "request",
+        _failing_then_succeeding(HttpStatusError(status=429, message="")),
+    ) as request_mock:
+        await client._client.call(method_name="addInvokeTransaction", params={})
+    assert request_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_method_overrides_and_timeout():
+    policy = RetryPolicy(
+        max_retries=0,
+        timeout=1,
+        method_overrides={
+            "blockNumber": RetryPolicy(max_retries=1, backoff_base=0, timeout=5)
+        },
+    )
+    client = _create_client(policy)
+
+    with patch.object(
+        client._client,
+        "request",
+        _failing_then_succeeding(HttpStatusError(status=503, message="")),
+    ) as request_mock:
+        assert await client.get_block_number() == 10
+
+    assert request_mock.call_count == 2
+    assert request_mock.call_args.kwargs["timeout"] == 5
+
+
+def test_backoff_delay():
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=3, jitter=False)
+
+    assert [policy.get_delay(attempt) for attempt in range(4)] == [0.5, 1, 2, 3]
+    assert 0 <= RetryPolicy(backoff_base=1).get_delay(2) <= 4
+
+    retry_after = HttpStatusError(status=429, message="", retry_after=10)
+    assert policy.get_delay(0, retry_after) == 10
+    assert (
+        RetryPolicy(jitter=False, max_retry_after=2).get_delay(
+            0, HttpStatusError(status=429, message="", retry_after=86400)
+        )
+        == 2
+    )
+    assert (
+        RetryPolicy(
+            backoff_base=0.5, jitter=False, respect_retry_after=False
+        ).get_delay(0, retry_after)
+        == 0.5
+    )
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(None, None), ("7", 7.0), ("-3", 0.0), ("invalid", None)],
+)
+def test_parse_retry_after(value, expected):
+    assert _parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+@pytest_asyncio.fixture(name="slow_node_url")
+async def fixture_slow_node_url():
+    async def handle(_: web.Request) -> web.Response:
+        await asyncio.sleep(1)
+        return web.json_response({"jsonrpc": "2.0", "id": 0, "result": 10})
+
+    app = web.Application()
+    app.router.add_post("/rpc", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    yield f"http://127.0.0.1:{port}/rpc"
+
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_session_timeout_applies_without_policy(slow_node_url):
+    async with aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=0.1)
+    ) as session:
+        client = FullNodeClient(node_url=slow_node_url, session=session)
+        client._client._is_spec_version_verified = True
+
+        with pytest.raises(asyncio.TimeoutError):
+            await client.get_block_number()
@@ -0,0 +1,144 @@
+# pylint: disable=protected-access
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.http_client import ServerError
+
+NODE_RESULTS = {
+    "starknet_getNonce": "0x5",
+    "starknet_getClassHashAt": "0x1234",
+    "starknet_getStorageAt": "0x2a",
+}
+
+
+def _respond(payload):
+    if payload["method"] not in NODE_RESULTS:
+        return {
+            "jsonrpc": "2.0",
+            "id": payload["id"],
+            "error": {"code": 20, "message": "Contract not found"},
+        }
+    return {
+        "jsonrpc": "2.0",
+        "id": payload["id"],
+        "result": NODE_RESULTS[payload["method"]],
+    }
+
+
+async def _fake_request(address, http_method, params=None, payload=None, timeout=None):
+    # pylint: disable=unused-argument
+    if isinstance(payload, list):
+        # Nodes are free to respond to batch entries in any order
+        return [_respond(entry) for entry in reversed(payload)]
+    return _respond(payload)
+
+
+@pytest.fixture(name="batch_client")
+def create_batch_client() -> FullNodeClient:
+    client = FullNodeClient(node_url="http://127.0.0.1:5050/rpc")
+    client._client._is_spec_version_verified = True
+    return client
+
+
+@pytest.mark.asyncio
+async def test_batch_sends_single_request(batch_client):
+    with patch.object(
+        batch_client._client, "request", AsyncMock(side_effect=_fake_request)
+    ) as request_mock:
+        async with batch_client.batch() as batch:
+            nonce = batch.add(batch_client.get_contract_nonce(0x1))
+            class_hash = batch.add(batch_client.get_class_hash_at(0x1))
+            storage = batch.add(
+                batch_client.get_storage_at(0x1, key=0x2, block_number=10)
+            )
+
+    assert nonce.result() == 0x5
+    assert class_hash.result() == 0x1234
+    assert storage.result() == 0x2A
+
+    request_mock.assert_called_once()
+    payload = request_mock.call_args.kwargs["payload"]
+    assert [entry["method"] for entry in payload] == [
+        "starknet_getNonce",
+        "starknet_getClassHashAt",
+        "starknet_getStorageAt",
+    ]
+    assert len({entry["id"] for entry in payload}) == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_per_entry_errors(batch_client):
+    with patch.object(
+        batch_client._client, "request", AsyncMock(side_effect=_fake_request)
+    ):
+        async with batch_client.batch() as batch:
+            nonce = batch.add(batch_client.get_contract_nonce(0x1))
+            block_number = batch.add(batch_client.get_block_number())
+
+    assert nonce.result() == 0x5
+    with pytest.raises(ClientError, match="Contract not found"):
+        block_number.result()
+
+
+@pytest.mark.asyncio
+async def test_batch_max_batch_size(batch_client):
+    with patch.object(
+        batch_client._client, "request", AsyncMock(side_effect=_fake_request)
+    ) as request_mock:
+        async with batch_client.batch(max_batch_size=2) as batch:
+            nonces = [batch.add(batch_client.get_contract_nonce(i)) for i in range(5)]
+
+    assert [nonce.result() for nonce in nonces] == [0x5] * 5
+    assert request_mock.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_missing_response_entry(batch_client):
+    async def _drop_responses(
+        address, http_method, params=None, payload=None, timeout=None
+    ):
+        # pylint: disable=unused-argument
+        return [_respond(payload[0])]
+
+    with patch.object(
+        batch_client._client, "request", AsyncMock(side_effect=_drop_responses)
+    ):
+        async with batch_client.batch() as batch:
+            first = batch.add(batch_client.get_contract_nonce(0x1))
+            second = batch.add(batch_client.get_contract_nonce(0x2))
+
+    assert first.result() == 0x5
+    with pytest.raises(ServerError):
+        second.result()
+
+
+@pytest.mark.asyncio
+async def test_calls_outside_of_batch_are_not_queued(batch_client):
+    with patch.object(
+        batch_client._client, "request", AsyncMock(side_effect=_fake_request)
+    ) as request_mock:
+        async with batch_client.batch() as batch:
+            nonce = batch.add(batch_client.get_contract_nonce(0x1))
+            assert await batch_client.get_class_hash_at(0x1) == 0x1234
+
+    assert nonce.result() == 0x5
+    assert request_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_cannot_add_after_execution(batch_client):
+    batch = batch_client.batch()
+    await batch.execute()
+
+    coro = batch_client.get_block_number()
+    with pytest.raises(ValueError, match="already been executed"):
+        batch.add(coro)
+    coro.close()
+
+
+def test_batch_invalid_max_batch_size(batch_client):
+    with pytest.raises(ValueError, match="max_batch_size must be greater than 0"):
+        batch_client.batch(max_batch_size=0)
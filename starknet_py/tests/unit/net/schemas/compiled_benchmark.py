@@ -0,0 +1,59 @@
+"""
+Benchmark of loading the block fixture with compiled schemas and with marshmallow.
+
+Run with ``poe benchmark_compiled``. It is not a part of the test suite, as timings depend on the machine.
+"""
+
+import json
+import timeit
+
+from starknet_py.net.schemas.compiled import load_compiled
+from starknet_py.net.schemas.rpc.block import (
+    StarknetBlockSchema,
+    StarknetBlockWithReceiptsSchema,
+)
+from starknet_py.tests.e2e.fixtures.constants import MOCK_DIR
+
+NUMBER = 20
+REPEAT = 5
+
+
+def _benchmark(schema_class, data: dict):
+    schema = schema_class()
+    # Schema is compiled on first use, which is not measured
+    load_compiled(schema_class, data)
+
+    compiled_time = min(
+        timeit.repeat(
+            lambda: load_compiled(schema_class, data), number=NUMBER, repeat=REPEAT
+        )
+    )
+    schema_time = min(
+        timeit.repeat(lambda: schema.load(data), number=NUMBER, repeat=REPEAT)
+    )
+    print(
+        f"{schema_class.__name__}: "
+        f"compiled {compiled_time / NUMBER * 1000:.2f}ms, "
+        f"marshmallow {schema_time / NUMBER * 1000:.2f}ms, "
+        f"speedup {schema_time / compiled_time:.1f}x"
+    )
+
+
+def main():
+    block_with_receipts = json.loads(
+        (MOCK_DIR / "rpc" / "block_with_receipts.json").read_text("utf-8")
+    )
+    block = {
+        **block_with_receipts,
+        "transactions": [
+            transaction["transaction"]
+            for transaction in block_with_receipts["transactions"]
+        ],
+    }
+
+    _benchmark(StarknetBlockWithReceiptsSchema, block_with_receipts)
+    _benchmark(StarknetBlockSchema, block)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# pylint: disable=protected-access
+import copy
+import json
+import pickle
+
+import pytest
+from marshmallow import ValidationError
+
+from starknet_py.net.client_models import (
+    StarknetBlock,
+    StarknetBlockWithReceipts,
+    TransactionType,
+)
+from starknet_py.net.schemas.compiled import _get_compiled_schema, load_compiled
+from starknet_py.net.schemas.rpc.block import (
+    StarknetBlockSchema,
+    StarknetBlockWithReceiptsSchema,
+    StarknetBlockWithTxHashesSchema,
+)
+from starknet_py.net.schemas.rpc.general import EstimatedFeeSchema
+from starknet_py.net.schemas.rpc.trace_api import SimulatedTransactionSchema
+from starknet_py.net.schemas.rpc.transactions import TypesOfTransactionsSchema
+from starknet_py.tests.e2e.fixtures.constants import MOCK_DIR
+
+
+@pytest.fixture(name="block_with_receipts")
+def fixture_block_with_receipts() -> dict:
+    return json.loads(
+        (MOCK_DIR / "rpc" / "block_with_receipts.json").read_text("utf-8")
+    )
+
+
+@pytest.fixture(name="block")
+def fixture_block(block_with_receipts) -> dict:
+    return {
+        **block_with_receipts,
+        "transactions": [
+            transaction["transaction"]
+            for transaction in block_with_receipts["transactions"]
+        ],
+    }
+
+
+def _invocation(calls: list) -> dict:
+    return {
+        "contract_address": "0x1",
+        "entry_point_selector": "0x2",
+        "calldata": ["0x3"],
+        "caller_address": "0x0",
+        "class_hash": "0x4",
+        "entry_point_type": "EXTERNAL",
+        "call_type": "CALL",
+        "result": [],
+        "calls": calls,
+        "events": [{"order": 0, "keys": ["0x5"], "data": []}],
+        "messages": [],
+        "execution_resources": {"l1_gas": 1, "l2_gas": 2},
+        "is_reverted": False,
+    }
+
+
+SIMULATED_TRANSACTION = {
+    "transaction_trace": {
+        "type": "INVOKE",
+        "execute_invocation": _invocation([_invocation([]), _invocation([])]),
+        "validate_invocation": _invocation([]),
+        "execution_resources": {"l1_gas": 1, "l1_data_gas": 2, "l2_gas": 3},
+    },
+    "fee_estimation": {
+        "l1_gas_consumed": "0x1",
+        "l1_gas_price": "0x2",
+        "l2_gas_consumed": "0x3",
+        "l2_gas_price": "0x4",
+        "l1_data_gas_consumed": "0x5",
+        "l1_data_gas_price": "0x6",
+        "overall_fee": "0x7",
+        "unit": "FRI",
+    },
+}
+
+
+def _assert_loaded_without_fallback(schema_class, data):
+    schema, loader = _get_compiled_schema(schema_class)
+    assert loader(copy.deepcopy(data), None) == schema.load(data)
+
+
+def test_load_block_with_receipts(block_with_receipts):
+    original = copy.deepcopy(block_with_receipts)
+
+    block = load_compiled(StarknetBlockWithReceiptsSchema, block_with_receipts)
+
+    assert isinstance(block, StarknetBlockWithReceipts)
+    assert block == StarknetBlockWithReceiptsSchema().load(original)
+    assert block.transactions[4].receipt.type == TransactionType.L1_HANDLER
+    assert block_with_receipts == original
+    _assert_loaded_without_fallback(StarknetBlockWithReceiptsSchema, original)
+
+
+def test_load_block(block):
+    loaded = load_compiled(StarknetBlockSchema, block)
+
+    assert isinstance(loaded, StarknetBlock)
+    assert loaded == StarknetBlockSchema().load(block)
+    _assert_loaded_without_fallback(StarknetBlockSchema, block)
+
+
+def test_load_block_with_tx_hashes(block):
+    block_with_tx_hashes = {
+        **block,
+        "transactions": [tx["transaction_hash"] for tx in block["transactions"]],
+    }
+
+    assert load_compiled(
+        StarknetBlockWithTxHashesSchema, block_with_tx_hashes
+    ) == StarknetBlockWithTxHashesSchema().load(block_with_tx_hashes)
+    _assert_loaded_without_fallback(
+        StarknetBlockWithTxHashesSchema, block_with_tx_hashes
+    )
+
+
+def test_load_many():
+    fee_estimations = [SIMULATED_TRANSACTION["fee_estimation"]] * 3
+
+    assert load_compiled(
+        EstimatedFeeSchema, fee_estimations, many=True
+    ) == EstimatedFeeSchema().load(fee_estimations, many=True)
+
+
+def test_load_recursive_schema():
+    assert load_compiled(
+        SimulatedTransactionSchema, SIMULATED_TRANSACTION
+    ) == SimulatedTransactionSchema().load(SIMULATED_TRANSACTION)
+    _assert_loaded_without_fallback(SimulatedTransactionSchema, SIMULATED_TRANSACTION)
+
+
+@pytest.mark.parametrize(
+    "update",
+    [
+        {"transaction_hash": "0x01"},
+        {"transaction_hash": "0x1g"},
+        {"nonce": 2**300},
+        {"calldata": ["0x1", None]},
+        {"signature": "0x1"},
+        {"unknown_field": "0x1"},
+        {"version": "0x5"},
+        {"nonce_data_availability_mode": "L3"},
+    ],
+)
+def test_invalid_data_raises_errors_of_marshmallow(block, update):
+    transaction = {**block["transactions"][0], **update}
+
+    with pytest.raises(ValidationError) as expected:
+        TypesOfTransactionsSchema().load(transaction)
+    with pytest.raises(ValidationError) as error:
+        load_compiled(TypesOfTransactionsSchema, transaction)
+
+    assert error.value.messages == expected.value.messages
+
+
+def test_missing_required_field_raises_errors_of_marshmallow(block_with_receipts):
+    del block_with_receipts["transactions"][1]["receipt"]["execution_resources"]
+
+    with pytest.raises(ValidationError) as expected:
+        StarknetBlockWithReceiptsSchema().load(block_with_receipts)
+    with pytest.raises(ValidationError) as error:
+        load_compiled(StarknetBlockWithReceiptsSchema, block_with_receipts)
+
+    assert error.value.messages == expected.value.messages
+
+
+def test_loaded_models_are_slotted(block_with_receipts):
+    block = load_compiled(StarknetBlockWithReceiptsSchema, block_with_receipts)
+    transaction_with_receipt = block.transactions[0]
+    receipt = transaction_with_receipt.receipt
+
+    for model in [
+        transaction_with_receipt,
+        transaction_with_receipt.transaction,
+        transaction_with_receipt.transaction.resource_bounds.l1_gas,
+        receipt,
+        receipt.actual_fee,
+        receipt.execution_resources,
+        receipt.events[0],
+    ]:
+        assert not hasattr(model, "__dict__")
+    assert pickle.loads(pickle.dumps(block)) == block
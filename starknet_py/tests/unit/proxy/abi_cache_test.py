@@ -0,0 +1,144 @@
+import json
+from typing import Dict
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from starknet_py.contract import Contract
+from starknet_py.net.client import Client
+from starknet_py.net.client_errors import ClientError, ContractNotFoundError
+from starknet_py.net.client_models import SierraContractClass, SierraEntryPointsByType
+from starknet_py.proxy.abi_cache import AbiCache
+from starknet_py.proxy.proxy_check import ProxyCheck
+
+ABI = [
+    {
+        "type": "function",
+        "name": "get_balance",
+        "inputs": [],
+        "outputs": [],
+        "state_mutability": "view",
+    }
+]
+
+
+def _sierra_class(abi) -> SierraContractClass:
+    return SierraContractClass(
+        contract_class_version="0.1.0",
+        sierra_program=[],
+        entry_points_by_type=SierraEntryPointsByType(
+            constructor=[], external=[], l1_handler=[]
+        ),
+        abi=json.dumps(abi),
+    )
+
+
+def _client(class_hashes: Dict[int, int]) -> MagicMock:
+    async def get_class_hash_at(contract_address, **kwargs):
+        # pylint: disable=unused-argument
+        if contract_address not in class_hashes:
+            raise ClientError(code=20, message="Contract not found")
+        return class_hashes[contract_address]
+
+    client = MagicMock(spec=Client)
+    client.get_class_hash_at = AsyncMock(side_effect=get_class_hash_at)
+    client.get_class_by_hash = AsyncMock(return_value=_sierra_class(ABI))
+    return client
+
+
+class _ImplementationHashProxyCheck(ProxyCheck):
+    def __init__(self, implementation: int):
+        self.implementation = implementation
+        self.calls = 0
+
+    async def implementation_address(self, address, client):
+        return None
+
+    async def implementation_hash(self, address, client):
+        self.calls += 1
+        return self.implementation
+
+
+@pytest.mark.asyncio
+async def test_warm_cache_needs_single_call(tmp_path):
+    client = _client({0x1: 0xC1})
+
+    contract = await Contract.from_address(
+        0x1, provider=client, abi_cache=AbiCache(tmp_path)
+    )
+    assert contract.data.abi == ABI
+    assert client.get_class_by_hash.call_count == 1
+
+    # New cache instance simulates a restart of the application
+    contract = await Contract.from_address(
+        0x1, provider=client, abi_cache=AbiCache(tmp_path)
+    )
+    assert contract.data.abi == ABI
+    assert contract.data.cairo_version == 1
+    assert client.get_class_by_hash.call_count == 1
+    assert client.get_class_hash_at.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_abis_are_shared_by_class_hash():
+    client = _client({0x1: 0xC1, 0x2: 0xC1})
+    cache = AbiCache()
+
+    await Contract.from_address(0x1, provider=client, abi_cache=cache)
+    await Contract.from_address(0x2, provider=client, abi_cache=cache)
+
+    client.get_class_by_hash.assert_called_once_with(class_hash=0xC1)
+
+
+@pytest.mark.asyncio
+async def test_proxy_implementation_class_is_cached(tmp_path):
+    client = _client({0x1: 0xFF})
+    proxy_check = _ImplementationHashProxyCheck(implementation=0xC1)
+    proxy_config = {"proxy_checks": [proxy_check]}
+
+    for _ in range(2):
+        contract = await Contract.from_address(
+            0x1,
+            provider=client,
+            proxy_config=proxy_config,  # pyright: ignore
+            abi_cache=AbiCache(tmp_path),
+        )
+        assert contract.data.abi == ABI
+
+    assert proxy_check.calls == 2
+    client.get_class_by_hash.assert_called_once_with(class_hash=0xC1)
+
+
+@pytest.mark.asyncio
+async def test_proxy_upgrade_is_detected():
+    # Upgrade changes only the storage of the proxy, its class hash stays the same
+    client = _client({0x1: 0xFF})
+    proxy_check = _ImplementationHashProxyCheck(implementation=0xC1)
+    proxy_config = {"proxy_checks": [proxy_check]}
+    cache = AbiCache()
+
+    await Contract.from_address(
+        0x1,
+        provider=client,
+        proxy_config=proxy_config,  # pyright: ignore
+        abi_cache=cache,
+    )
+    proxy_check.implementation = 0xC2
+    await Contract.from_address(
+        0x1,
+        provider=client,
+        proxy_config=proxy_config,  # pyright: ignore
+        abi_cache=cache,
+    )
+
+    assert [call.kwargs for call in client.get_class_by_hash.call_args_list] == [
+        {"class_hash": 0xC1},
+        {"class_hash": 0xC2},
+    ]
+    assert cache.get(0xC2) == (ABI, 1)
+
+
+@pytest.mark.asyncio
+async def test_contract_not_found():
+    with pytest.raises(ContractNotFoundError):
+        await Contract.from_address(0x1, provider=_client({}), abi_cache=AbiCache())
@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from unittest.mock import MagicMock, Mock
 
 import pytest
@@ -6,6 +7,27 @@ from starknet_py.net.models import StarknetChainId
 from starknet_py.net.models.transaction import DeclareV3, DeployAccountV3, InvokeV3
 from starknet_py.net.signer.key_pair import KeyPair
 from starknet_py.net.signer.stark_curve_signer import StarkCurveSigner
+from starknet_py.tests.e2e.fixtures.constants import MAX_RESOURCE_BOUNDS
+
+
+def _create_signer() -> StarkCurveSigner:
+    return StarkCurveSigner(
+        account_address=0x1,
+        key_pair=KeyPair.from_private_key(0x1),
+        chain_id=StarknetChainId.MAINNET,
+    )
+
+
+def _create_invoke(nonce: int) -> InvokeV3:
+    return InvokeV3(
+        version=3,
+        signature=[],
+        nonce=nonce,
+        resource_bounds=MAX_RESOURCE_BOUNDS,
+        calldata=[1, 0x123, 0x456, 0],
+        sender_address=0x1,
+        tip=0,
+    )
 
 
 @pytest.mark.parametrize(
@@ -31,6 +53,53 @@ def test_sign_transaction(transaction):
     assert all(i != 0 for i in signature)
 
 
+def test_sign_transactions():
+    signer = _create_signer()
+    transactions = [
+        Mock(spec=InvokeV3, calculate_hash=MagicMock(return_value=tx_hash))
+        for tx_hash in range(1, 6)
+    ]
+    expected = [signer.sign_transaction(transaction) for transaction in transactions]
+
+    assert signer.sign_transactions(transactions) == expected
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert (
+            signer.sign_transactions(transactions, executor=executor, chunk_size=2)
+            == expected
+        )
+
+
+def test_sign_transactions_in_process_pool():
+    signer = _create_signer()
+    transactions = [_create_invoke(nonce) for nonce in range(3)]
+    expected = [signer.sign_transaction(transaction) for transaction in transactions]
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert (
+            signer.sign_transactions(transactions, executor=executor, chunk_size=1)
+            == expected
+        )
+
+
+@pytest.mark.asyncio
+async def test_sign_transactions_async():
+    signer = _create_signer()
+    transactions = [
+        Mock(spec=InvokeV3, calculate_hash=MagicMock(return_value=tx_hash))
+        for tx_hash in range(1, 6)
+    ]
+    expected = [signer.sign_transaction(transaction) for transaction in transactions]
+
+    assert await signer.sign_transactions_async(transactions, chunk_size=2) == expected
+    assert await signer.sign_transactions_async([]) == []
+
+
+def test_sign_transactions_invalid_chunk_size():
+    with ThreadPoolExecutor() as executor:
+        with pytest.raises(ValueError, match="chunk_size must be greater than 0"):
+            _create_signer().sign_transactions([], executor=executor, chunk_size=0)
+
+
 def test_key_pair():
     key_pair = KeyPair(public_key="0x123", private_key="0x456")
 
@@ -138,3 +138,54 @@ def test_build_from_elements(
     assert tree.levels is not None
     assert tree.root_hash == int(expected_root_hash, 16)
     assert len(tree.levels) == expected_levels_count
+
+
+@pytest.mark.parametrize("hash_method", [HashMethod.PEDERSEN, HashMethod.POSEIDON])
+@pytest.mark.parametrize("leaves_count", [1, 2, 5, 8, 13])
+def test_proofs(hash_method: HashMethod, leaves_count: int):
+    leaves = list(range(1, leaves_count + 1))
+    tree = MerkleTree(leaves, hash_method)
+
+    for index, leaf in enumerate(leaves):
+        proof = tree.get_proof(index)
+
+        assert len(proof) == len(tree.levels) - 1
+        assert MerkleTree.verify_proof(tree.root_hash, leaf, proof, hash_method)
+        assert not MerkleTree.verify_proof(
+            tree.root_hash, leaf + 100, proof, hash_method
+        )
+
+
+def test_proof_of_missing_leaf():
+    tree = MerkleTree([1, 2, 3], HashMethod.PEDERSEN)
+
+    with pytest.raises(IndexError, match="Leaf index out of range."):
+        tree.get_proof(3)
+
+
+@pytest.mark.parametrize("hash_method", [HashMethod.PEDERSEN, HashMethod.POSEIDON])
+def test_incremental_updates(hash_method: HashMethod):
+    tree = MerkleTree([1], hash_method)
+
+    for leaf in range(2, 8):
+        tree.append(leaf)
+        expected = MerkleTree(list(range(1, leaf + 1)), hash_method)
+        assert tree.root_hash == expected.root_hash
+        assert tree.levels == expected.levels
+
+    tree.extend([8, 9, 10])
+    tree.update(3, 100)
+    tree.update(-1, 200)
+
+    expected = MerkleTree([1, 2, 3, 100, 5, 6, 7, 8, 9, 200], hash_method)
+    assert tree.root_hash == expected.root_hash
+    assert tree.levels == expected.levels
+
+
+def test_leaves_are_copied():
+    leaves = [1, 2, 3]
+    tree = MerkleTree(leaves, HashMethod.POSEIDON)
+    tree.append(4)
+
+    assert leaves == [1, 2, 3]
+    assert tree.leaves == [1, 2, 3, 4]
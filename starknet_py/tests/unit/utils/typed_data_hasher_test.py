@@ -0,0 +1,119 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from starknet_py.tests.unit.utils.typed_data_test import (
+    CasesRev0,
+    CasesRev1,
+    loaded_typed_data,
+)
+from starknet_py.utils.typed_data import TypedData
+from starknet_py.utils.typed_data_hasher import TypedDataHasher
+
+ACCOUNT_ADDRESS = 0xCD2A3D9F938E13CD947EC05ABC7FE734DF8DD826
+
+
+@pytest.mark.parametrize("example", [*CasesRev0, *CasesRev1])
+def test_message_hash(example):
+    typed_data = loaded_typed_data(example.value)
+    hasher = TypedDataHasher.from_typed_data(typed_data)
+
+    assert hasher.message_hash(
+        typed_data.message, ACCOUNT_ADDRESS
+    ) == typed_data.message_hash(ACCOUNT_ADDRESS)
+
+
+def test_from_dict():
+    typed_data = loaded_typed_data(CasesRev1.TD.value)
+    hasher = TypedDataHasher.from_dict(typed_data.to_dict())
+
+    assert hasher.message_hash(
+        typed_data.message, ACCOUNT_ADDRESS
+    ) == typed_data.message_hash(ACCOUNT_ADDRESS)
+
+
+def _create_messages(typed_data: TypedData, count: int):
+    return [{**typed_data.message, "contents": f"message {i}"} for i in range(count)]
+
+
+def _expected_hashes(typed_data: TypedData, messages, account_addresses):
+    return [
+        TypedData(
+            types=typed_data.types,
+            primary_type=typed_data.primary_type,
+            domain=typed_data.domain,
+            message=message,
+        ).message_hash(account_address)
+        for message, account_address in zip(messages, account_addresses)
+    ]
+
+
+def test_message_hashes():
+    typed_data = loaded_typed_data(CasesRev1.TD.value)
+    hasher = TypedDataHasher.from_typed_data(typed_data)
+    messages = _create_messages(typed_data, 5)
+    account_addresses = [ACCOUNT_ADDRESS + i for i in range(5)]
+    expected = _expected_hashes(typed_data, messages, account_addresses)
+
+    assert hasher.message_hashes(messages, account_addresses) == expected
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert (
+            hasher.message_hashes(
+                messages, account_addresses, executor=executor, chunk_size=2
+            )
+            == expected
+        )
+    assert hasher.message_hashes(messages, ACCOUNT_ADDRESS) == _expected_hashes(
+        typed_data, messages, [ACCOUNT_ADDRESS] * 5
+    )
+
+
+def test_message_hashes_in_process_pool():
+    typed_data = loaded_typed_data(CasesRev1.TD_ENUM.value)
+    hasher = TypedDataHasher.from_typed_data(typed_data)
+    messages = [typed_data.message] * 3
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert (
+            hasher.message_hashes(
+                messages, ACCOUNT_ADDRESS, executor=executor, chunk_size=1
+            )
+            == [typed_data.message_hash(ACCOUNT_ADDRESS)] * 3
+        )
+
+
+def test_pickled_hasher():
+    typed_data = loaded_typed_data(CasesRev0.TD_STRUCT_MERKLE_TREE.value)
+    hasher = pickle.loads(pickle.dumps(TypedDataHasher.from_typed_data(typed_data)))
+
+    assert hasher.message_hash(
+        typed_data.message, ACCOUNT_ADDRESS
+    ) == typed_data.message_hash(ACCOUNT_ADDRESS)
+
+
+def test_message_hashes_invalid_account_addresses():
+    hasher = TypedDataHasher.from_typed_data(loaded_typed_data(CasesRev1.TD.value))
+
+    with pytest.raises(ValueError, match="must contain an address for every message"):
+        hasher.message_hashes([{}, {}], [ACCOUNT_ADDRESS])
+
+
+@pytest.mark.parametrize(
+    "field_name, value, error_message",
+    [
+        ("from", 1, r"Type \[Person\] is not defined in types."),
+        (
+            "contents",
+            ["a"],
+            r"Error occurred while encoding value with type name felt.",
+        ),
+    ],
+)
+def test_invalid_values_raise_errors_of_typed_data(field_name, value, error_message):
+    typed_data = loaded_typed_data(CasesRev1.TD.value)
+    hasher = TypedDataHasher.from_typed_data(typed_data)
+    message = {**typed_data.message, field_name: value}
+
+    with pytest.raises(ValueError, match=error_message):
+        hasher.message_hash(message, ACCOUNT_ADDRESS)
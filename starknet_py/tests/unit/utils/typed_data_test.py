@@ -184,6 +184,27 @@ def test_message_hash(example, account_address, msg_hash):
     assert hex(res) == msg_hash
 
 
+def test_type_encodings_are_shared_between_messages():
+    # pylint: disable=protected-access
+    typed_data = loaded_typed_data(CasesRev1.TD.value)
+    other_typed_data = TypedData(
+        types=typed_data.types,
+        primary_type=typed_data.primary_type,
+        domain=typed_data.domain,
+        message={**typed_data.message, "contents": "Goodbye"},
+    )
+    message_hash = typed_data.message_hash(0x1)
+
+    assert other_typed_data._type_encodings is typed_data._type_encodings
+    assert set(typed_data._type_encodings.type_hashes) == {"StarknetDomain", "Mail", "Person"}
+    assert other_typed_data.message_hash(0x1) != message_hash
+
+    # Types with the same names, but different revision are encoded differently
+    typed_data_rev_0 = loaded_typed_data(CasesRev0.TD.value)
+    assert typed_data_rev_0._type_encodings is not typed_data._type_encodings
+    assert typed_data_rev_0._encode_type("Mail") != typed_data._encode_type("Mail")
+
+
 domain_type_v0 = {
     "StarkNetDomain": [
         StandardParameter(name="name", type="felt"),
@@ -1,45 +1,171 @@
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import List, Sequence
 
 from starknet_py.hash.hash_method import HashMethod
+from starknet_py.hash.utils import FELT_BYTES_LENGTH
 
 
 @dataclass
 class MerkleTree:
     """
     Dataclass representing a MerkleTree object.
+
+    Nodes above the leaves are stored compactly, as 32-byte big-endian words of a bytearray per level.
+    Leaves can be appended or updated, rehashing only the nodes on the affected paths.
     """
 
     leaves: List[int]
     hash_method: HashMethod
     root_hash: int = field(init=False)
-    levels: List[List[int]] = field(init=False)
+    _nodes: List[bytearray] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        self.root_hash, self.levels = self._build()
-
-    def _build(self) -> Tuple[int, List[List[int]]]:
         if not self.leaves:
             raise ValueError("Cannot build Merkle tree from an empty list of leaves.")
 
-        if len(self.leaves) == 1:
-            return self.leaves[0], [self.leaves]
+        self.leaves = list(self.leaves)
+        self._nodes = []
+        self._rehash_from(0)
+
+    @property
+    def levels(self) -> List[List[int]]:
+        """
+        Nodes of the tree, level by level, from the leaves to the root.
+        """
+        return [self.leaves, *(_decode_nodes(level) for level in self._nodes)]
+
+    def append(self, leaf: int):
+        """
+        Append the leaf to the tree.
+
+        :param leaf: Leaf to append.
+        """
+        self.extend([leaf])
 
-        curr_level_nodes = self.leaves[:]
-        levels: List[List[int]] = []
+    def extend(self, leaves: Sequence[int]):
+        """
+        Append the leaves to the tree.
 
-        while len(curr_level_nodes) > 1:
-            if len(curr_level_nodes) != len(self.leaves):
-                levels.append(curr_level_nodes[:])
+        :param leaves: Leaves to append.
+        """
+        if not leaves:
+            return
+        start = len(self.leaves)
+        self.leaves.extend(leaves)
+        self._rehash_from(start)
 
-            new_nodes = []
-            for i in range(0, len(curr_level_nodes), 2):
-                a, b = (
-                    curr_level_nodes[i],
-                    curr_level_nodes[i + 1] if i + 1 < len(curr_level_nodes) else 0,
+    def update(self, index: int, leaf: int):
+        """
+        Replace the leaf at the index.
+
+        :param index: Index of the leaf.
+        :param leaf: New value of the leaf.
+        """
+        self.leaves[index] = leaf
+        index = index % len(self.leaves)
+
+        for depth, level in enumerate(self._nodes):
+            index //= 2
+            node = self.hash_method.hash(
+                *sorted(
+                    [
+                        self._get_node(depth, 2 * index),
+                        self._get_node(depth, 2 * index + 1),
+                    ]
                 )
-                new_nodes.append(self.hash_method.hash(*sorted([a, b])))
+            )
+            level[index * FELT_BYTES_LENGTH : (index + 1) * FELT_BYTES_LENGTH] = (
+                node.to_bytes(FELT_BYTES_LENGTH, "big")
+            )
+        self.root_hash = self._get_root()
+
+    def get_proof(self, index: int) -> List[int]:
+        """
+        Return the proof of inclusion of the leaf at the index: siblings of the nodes on the path to the root.
+        Missing siblings of the last nodes of levels with odd length are represented by ``0``.
+
+        :param index: Index of the leaf.
+        :return: List of sibling nodes, from the leaves to the root.
+        """
+        if not -len(self.leaves) <= index < len(self.leaves):
+            raise IndexError("Leaf index out of range.")
+        index = index % len(self.leaves)
+
+        proof = []
+        for depth in range(len(self._nodes)):
+            proof.append(self._get_node(depth, index ^ 1))
+            index //= 2
+        return proof
+
+    @staticmethod
+    def verify_proof(
+        root_hash: int, leaf: int, proof: Sequence[int], hash_method: HashMethod
+    ) -> bool:
+        """
+        Verify the proof of inclusion of the leaf in the tree with the root hash.
+
+        :param root_hash: Root hash of the tree.
+        :param leaf: Leaf included in the tree.
+        :param proof: Proof returned by :meth:`get_proof`.
+        :param hash_method: Hash method of the tree.
+        :return: ``True`` if the proof is valid.
+        """
+        node = leaf
+        for sibling in proof:
+            node = hash_method.hash(*sorted([node, sibling]))
+        return node == root_hash
+
+    def _rehash_from(self, start: int):
+        """
+        Rehashes the parents of the leaves starting at the index, level by level.
+        """
+        length = len(self.leaves)
+        depth = 0
+        while length > 1:
+            start //= 2
+            children = (
+                self.leaves[2 * start :]
+                if depth == 0
+                else _decode_nodes(self._nodes[depth - 1], 2 * start)
+            )
+            if len(children) % 2 == 1:
+                children.append(0)
+            parents = self.hash_method.hash_pairs(
+                [
+                    (left, right) if left <= right else (right, left)
+                    for left, right in zip(children[::2], children[1::2])
+                ]
+            )
+
+            if depth == len(self._nodes):
+                self._nodes.append(bytearray())
+            self._nodes[depth][start * FELT_BYTES_LENGTH :] = b"".join(
+                parent.to_bytes(FELT_BYTES_LENGTH, "big") for parent in parents
+            )
+
+            length = (length + 1) // 2
+            depth += 1
+
+        self.root_hash = self._get_root()
+
+    def _get_node(self, depth: int, index: int) -> int:
+        """
+        Returns the node at the index of the level or 0 if the index is out of range.
+        """
+        if depth == 0:
+            return self.leaves[index] if index < len(self.leaves) else 0
+        level = self._nodes[depth - 1]
+        start = index * FELT_BYTES_LENGTH
+        return int.from_bytes(level[start : start + FELT_BYTES_LENGTH], "big")
+
+    def _get_root(self) -> int:
+        if not self._nodes:
+            return self.leaves[0]
+        return self._get_node(len(self._nodes), 0)
+
 
-            curr_level_nodes = new_nodes
-        levels = [self.leaves] + levels + [curr_level_nodes]
-        return curr_level_nodes[0], levels
+def _decode_nodes(level: bytearray, start: int = 0) -> List[int]:
+    return [
+        int.from_bytes(level[i : i + FELT_BYTES_LENGTH], "big")
+        for i in range(start * FELT_BYTES_LENGTH, len(level), FELT_BYTES_LENGTH)
+    ]
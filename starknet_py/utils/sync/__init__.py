@@ -2,4 +2,4 @@
 Module that allows adding synchronous versions of classes accessible with Class.sync.
 """
 
-from starknet_py.utils.sync.sync import add_sync_methods
+from starknet_py.utils.sync.sync import add_sync_methods, register_sync_call_cleanup
@@ -1,14 +1,44 @@
 import inspect
+from contextvars import ContextVar
 from functools import wraps
-from typing import TypeVar
+from typing import Awaitable, Callable, List, Optional, TypeVar
 
 from asgiref.sync import async_to_sync
 
 T = TypeVar("T")
 
+# Callbacks run at the end of the synchronous call, while its event loop is still running
+_sync_call_cleanups: ContextVar[Optional[List[Callable[[], Awaitable[None]]]]] = (
+    ContextVar("_sync_call_cleanups", default=None)
+)
+
+
+def register_sync_call_cleanup(cleanup: Callable[[], Awaitable[None]]) -> bool:
+    """
+    Schedule the cleanup to be awaited when the synchronous method being executed returns,
+    before its event loop is closed.
+
+    :return: ``True`` if called from a synchronous method, ``False`` otherwise.
+    """
+    cleanups = _sync_call_cleanups.get()
+    if cleanups is None:
+        return False
+    cleanups.append(cleanup)
+    return True
+
 
 def make_sync(fn):
-    sync_fun = async_to_sync(fn)
+    async def run(*args, **kwargs):
+        cleanups: List[Callable[[], Awaitable[None]]] = []
+        token = _sync_call_cleanups.set(cleanups)
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            _sync_call_cleanups.reset(token)
+            for cleanup in reversed(cleanups):
+                await cleanup()
+
+    sync_fun = async_to_sync(run)
 
     @wraps(fn)
     def impl(*args, **kwargs):
@@ -31,6 +61,10 @@ def add_sync_methods(original_class: T) -> T:
         if sync_name in properties:
             continue
 
+        # Special methods, e.g. async context manager protocol, have no synchronous counterpart
+        if name.startswith("__"):
+            continue
+
         # Make all callables synchronous
         if inspect.iscoroutinefunction(value):
             setattr(original_class, sync_name, make_sync(value))
@@ -1,8 +1,9 @@
 import re
 from abc import ABC
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Union, cast
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union, cast
 
 from marshmallow import Schema, fields, post_load
 
@@ -111,6 +112,47 @@ class PresetType(Enum):
     NFT_ID = "NftId"
 
 
+@dataclass
+class _TypeEncodings:
+    """
+    Types of the TypedData schema with their encodings and hashes computed so far.
+    Shared by TypedData objects with the same types and revision.
+    """
+
+    all_types: Dict[str, List[Parameter]]
+    basic_type_names: FrozenSet[str]
+    encoded_types: Dict[str, str] = field(default_factory=dict)
+    type_hashes: Dict[str, int] = field(default_factory=dict)
+
+
+_TYPE_ENCODINGS_CACHE_SIZE = 128
+
+_type_encodings_cache: OrderedDict[Tuple, _TypeEncodings] = OrderedDict()
+
+
+def _get_type_encodings(
+    types: Dict[str, List[Parameter]], revision: Revision
+) -> _TypeEncodings:
+    key = (
+        revision,
+        tuple((type_name, tuple(params)) for type_name, params in types.items()),
+    )
+
+    type_encodings = _type_encodings_cache.get(key)
+    if type_encodings is None:
+        type_encodings = _TypeEncodings(
+            all_types={**_get_preset_types(revision), **types},
+            basic_type_names=frozenset(_get_basic_type_names(revision)),
+        )
+        _type_encodings_cache[key] = type_encodings
+        if len(_type_encodings_cache) > _TYPE_ENCODINGS_CACHE_SIZE:
+            _type_encodings_cache.popitem(last=False)
+    else:
+        _type_encodings_cache.move_to_end(key)
+
+    return type_encodings
+
+
 @dataclass(frozen=True)
 class TypedData:
     """
@@ -121,17 +163,20 @@ class TypedData:
     primary_type: str
     domain: Domain
     message: dict
+    _type_encodings: _TypeEncodings = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         self._verify_types()
+        # Encodings and hashes of types are reused by all messages with the same types
+        object.__setattr__(
+            self,
+            "_type_encodings",
+            _get_type_encodings(self.types, self.domain.resolved_revision),
+        )
 
     @property
-    def _all_types(self):
-        preset_types = _get_preset_types(self.domain.resolved_revision)
-        return {
-            **preset_types,
-            **self.types,
-        }
+    def _all_types(self) -> Dict[str, List[Parameter]]:
+        return self._type_encodings.all_types
 
     @property
     def _hash_method(self) -> HashMethod:
@@ -223,7 +268,7 @@ class TypedData:
             hashes = [self._encode_value(type_name, val) for val in value]
             return self._hash_method.hash_many(hashes)
 
-        if type_name not in _get_basic_type_names(self.domain.resolved_revision):
+        if type_name not in self._type_encodings.basic_type_names:
             raise ValueError(f"Type [{type_name}] is not defined in types.")
 
         basic_type = BasicType(type_name)
@@ -335,10 +380,11 @@ class TypedData:
 
     def _get_dependencies(self, type_name: str) -> List[str]:
         dependencies = [type_name]
-        to_visit = [type_name]
+        visited = {type_name}
+        to_visit = deque([type_name])
 
         while to_visit:
-            current_type = to_visit.pop(0)
+            current_type = to_visit.popleft()
             params = self._all_types.get(current_type, [])
 
             for param in params:
@@ -355,14 +401,21 @@ class TypedData:
                 for extracted_type in extracted_types:
                     if (
                         extracted_type in self._all_types
-                        and extracted_type not in dependencies
+                        and extracted_type not in visited
                     ):
+                        visited.add(extracted_type)
                         dependencies.append(extracted_type)
                         to_visit.append(extracted_type)
 
-        return list(dependencies)
+        return dependencies
 
     def _encode_type(self, type_name: str) -> str:
+        encoded_types = self._type_encodings.encoded_types
+        if type_name not in encoded_types:
+            encoded_types[type_name] = self._compute_encoded_type(type_name)
+        return encoded_types[type_name]
+
+    def _compute_encoded_type(self, type_name: str) -> str:
         primary, *dependencies = self._get_dependencies(type_name)
         types = [primary, *sorted(dependencies)]
 
@@ -405,7 +458,12 @@ class TypedData:
         :param type_name: Name of the type.
         :return: Hash of the type name.
         """
-        return get_selector_from_name(self._encode_type(type_name))
+        type_hashes = self._type_encodings.type_hashes
+        if type_name not in type_hashes:
+            type_hashes[type_name] = get_selector_from_name(
+                self._encode_type(type_name)
+            )
+        return type_hashes[type_name]
 
     def struct_hash(self, type_name: str, data: dict) -> int:
         """
@@ -0,0 +1,310 @@
+from concurrent.futures import Executor
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
+
+from starknet_py.cairo.felt import encode_shortstring
+from starknet_py.net.models.typed_data import Revision
+from starknet_py.utils.merkle_tree import MerkleTree
+from starknet_py.utils.typed_data import (
+    BasicType,
+    Domain,
+    Parameter,
+    TypeContext,
+    TypedData,
+    TypedDataSchema,
+    _extract_enum_types,
+    encode_bool,
+    encode_i128,
+    encode_u128,
+    is_pointer,
+    parse_felt,
+    prepare_selector,
+    strip_pointer,
+)
+
+# TypedDataHasher compiles the encoding implemented by TypedData, so it uses its internals
+# pylint: disable=protected-access
+
+Encoder = Callable[[Any], int]
+
+DEFAULT_HASHING_CHUNK_SIZE = 256
+
+_FELT_TYPES_V1 = (
+    BasicType.FELT,
+    BasicType.SHORT_STRING,
+    BasicType.CONTRACT_ADDRESS,
+    BasicType.CLASS_HASH,
+)
+
+
+class TypedDataHasher:
+    """
+    Hasher of messages sharing the types, the primary type and the domain of the typed data.
+
+    The schema is validated once and compiled into encoders of the fields of every struct,
+    with the type hashes and the hash of the domain computed upfront. Hashing a message then
+    only encodes its values, without creating a :class:`~starknet_py.utils.typed_data.TypedData` object.
+    Hashes are the same as :meth:`~starknet_py.utils.typed_data.TypedData.message_hash` of the typed data
+    with the message.
+    """
+
+    def __init__(
+        self,
+        types: Dict[str, List[Parameter]],
+        primary_type: str,
+        domain: Domain,
+    ):
+        """
+        :param types: Types of the typed data.
+        :param primary_type: Name of the type of the messages.
+        :param domain: Domain of the typed data.
+        """
+        self._typed_data = TypedData(
+            types=types, primary_type=primary_type, domain=domain, message={}
+        )
+        self._hash_many = self._typed_data._hash_method.hash_many
+        self._struct_encoders: Dict[str, Encoder] = {}
+
+        domain_hash = self._typed_data.struct_hash(
+            domain.separator_name, domain.to_dict()
+        )
+        self._message_prefix = [encode_shortstring("StarkNet Message"), domain_hash]
+        self._encode_message = self._get_struct_encoder(primary_type)
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "TypedDataHasher":
+        """
+        Create TypedDataHasher from the typed data dictionary. The message is ignored, if present.
+
+        :param data: Dictionary with ``types``, ``primaryType`` and ``domain`` of the typed data.
+        :return: TypedDataHasher instance.
+        """
+        typed_data = cast(TypedData, TypedDataSchema().load({**data, "message": {}}))
+        return TypedDataHasher.from_typed_data(typed_data)
+
+    @staticmethod
+    def from_typed_data(typed_data: TypedData) -> "TypedDataHasher":
+        """
+        Create TypedDataHasher from the typed data. The message is ignored.
+
+        :param typed_data: TypedData instance.
+        :return: TypedDataHasher instance.
+        """
+        return TypedDataHasher(
+            types=typed_data.types,
+            primary_type=typed_data.primary_type,
+            domain=typed_data.domain,
+        )
+
+    def __getstate__(self):
+        # Compiled encoders are closures, so they are compiled again after unpickling
+        return {
+            "types": self._typed_data.types,
+            "primary_type": self._typed_data.primary_type,
+            "domain": self._typed_data.domain,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)  # pylint: disable=unnecessary-dunder-call
+
+    def message_hash(self, message: dict, account_address: int) -> int:
+        """
+        Calculate the hash of the message.
+
+        :param message: Message of the primary type.
+        :param account_address: Address of an account.
+        :return: Hash of the message.
+        """
+        return self._hash_many(
+            [*self._message_prefix, account_address, self._encode_message(message)]
+        )
+
+    def message_hashes(
+        self,
+        messages: Sequence[dict],
+        account_address: Union[int, Sequence[int]],
+        executor: Optional[Executor] = None,
+        chunk_size: int = DEFAULT_HASHING_CHUNK_SIZE,
+    ) -> List[int]:
+        """
+        Calculate hashes of multiple messages.
+
+        When ``executor`` is provided, chunks of messages are hashed concurrently by its workers.
+        Use :class:`~concurrent.futures.ProcessPoolExecutor` to scale hashing with the number of cores.
+
+        :param messages: Messages of the primary type.
+        :param account_address: Address of an account or a sequence of addresses, one for every message.
+        :param executor: Executor hashing chunks of messages. If not provided, messages are hashed
+            in the calling thread.
+        :param chunk_size: Number of messages hashed by a single task of the executor.
+        :return: Hashes of the messages, in the same order.
+        """
+        account_addresses = (
+            [account_address] * len(messages)
+            if isinstance(account_address, int)
+            else list(account_address)
+        )
+        if len(account_addresses) != len(messages):
+            raise ValueError(
+                "Argument account_address must contain an address for every message."
+            )
+
+        if executor is None:
+            return _hash_messages(self, messages, account_addresses)
+
+        if chunk_size <= 0:
+            raise ValueError("Argument chunk_size must be greater than 0.")
+        starts = range(0, len(messages), chunk_size)
+        results = executor.map(
+            _hash_messages,
+            repeat(self),
+            [messages[start : start + chunk_size] for start in starts],
+            [account_addresses[start : start + chunk_size] for start in starts],
+        )
+        return [message_hash for result in results for message_hash in result]
+
+    def _get_struct_encoder(self, type_name: str) -> Encoder:
+        if type_name not in self._struct_encoders:
+            # Registered before compiling the fields, so recursive types refer to the same encoder
+            fields: List[Tuple[str, Encoder]] = []
+            type_hash = self._typed_data.type_hash(type_name)
+            hash_many = self._hash_many
+
+            def encode_struct(data: dict) -> int:
+                return hash_many(
+                    [type_hash, *(encode(data[name]) for name, encode in fields)]
+                )
+
+            self._struct_encoders[type_name] = encode_struct
+            fields.extend(
+                (
+                    param.name,
+                    self._compile_encoder(
+                        param.type, TypeContext(parent=type_name, key=param.name)
+                    ),
+                )
+                for param in self._typed_data._all_types[type_name]
+            )
+
+        return self._struct_encoders[type_name]
+
+    # pylint: disable=too-many-return-statements, too-many-branches
+    def _compile_encoder(
+        self, type_name: str, context: Optional[TypeContext] = None
+    ) -> Encoder:
+        """
+        Returns the encoder of values of the type. Values of unexpected types are passed to the generic
+        encoding of TypedData, which raises the same errors as when hashing the message with TypedData.
+        """
+        typed_data = self._typed_data
+
+        def fallback(value: Any) -> int:
+            return typed_data._encode_value(type_name, value, context)
+
+        if type_name in typed_data._all_types:
+            return _with_fallback(dict, self._get_struct_encoder(type_name), fallback)
+
+        if is_pointer(type_name):
+            encode_element = self._compile_encoder(strip_pointer(type_name))
+            hash_many = self._hash_many
+            return _with_fallback(
+                list,
+                lambda value: hash_many([encode_element(item) for item in value]),
+                fallback,
+            )
+
+        if type_name not in typed_data._type_encodings.basic_type_names:
+            return fallback
+
+        basic_type = BasicType(type_name)
+        revision = typed_data.domain.resolved_revision
+        if revision == Revision.V0 and basic_type in (BasicType.FELT, BasicType.STRING):
+            return _with_fallback((int, str), parse_felt, fallback)
+
+        if revision == Revision.V1:
+            if basic_type in _FELT_TYPES_V1:
+                return _with_fallback((int, str), parse_felt, fallback)
+            if basic_type in (BasicType.U128, BasicType.TIMESTAMP):
+                return _with_fallback((int, str), encode_u128, fallback)
+            if basic_type == BasicType.I128:
+                return _with_fallback((int, str), encode_i128, fallback)
+            if basic_type == BasicType.STRING:
+                return _with_fallback(str, typed_data._encode_long_string, fallback)
+            if basic_type == BasicType.ENUM and context is not None:
+                return _with_fallback(
+                    dict, self._compile_enum_encoder(context), fallback
+                )
+
+        if basic_type == BasicType.BOOL:
+            return _with_fallback((bool, str, int), encode_bool, fallback)
+
+        if basic_type == BasicType.SELECTOR:
+            return _with_fallback(str, prepare_selector, fallback)
+
+        if basic_type == BasicType.MERKLE_TREE and context is not None:
+            encode_leaf = self._compile_encoder(
+                typed_data._get_merkle_tree_leaves_type(context)
+            )
+            hash_method = typed_data._hash_method
+            return _with_fallback(
+                list,
+                lambda value: MerkleTree(
+                    [encode_leaf(leaf) for leaf in value], hash_method
+                ).root_hash,
+                fallback,
+            )
+
+        return fallback
+
+    def _compile_enum_encoder(self, context: TypeContext) -> Encoder:
+        typed_data = self._typed_data
+        variants: Dict[str, Tuple[int, List[Encoder]]] = {}
+        for index, variant in enumerate(typed_data._get_enum_variants(context)):
+            # The first definition of a variant is used, as in TypedData
+            if variant.name not in variants:
+                variants[variant.name] = (
+                    index,
+                    [
+                        self._compile_encoder(subtype)
+                        for subtype in _extract_enum_types(variant.type)
+                    ],
+                )
+        hash_many = self._hash_many
+
+        def encode_enum(value: dict) -> int:
+            if len(value) != 1 or next(iter(value)) not in variants:
+                return typed_data._encode_enum(value, context)
+
+            variant_name, variant_data = next(iter(value.items()))
+            index, encoders = variants[variant_name]
+            return hash_many(
+                [
+                    index,
+                    *(encode(variant_data[i]) for i, encode in enumerate(encoders)),
+                ]
+            )
+
+        return encode_enum
+
+
+def _with_fallback(
+    value_types: Union[type, Tuple[type, ...]],
+    encode: Encoder,
+    fallback: Encoder,
+) -> Encoder:
+    def encode_value(value: Any) -> int:
+        if isinstance(value, value_types):
+            return encode(value)
+        return fallback(value)
+
+    return encode_value
+
+
+def _hash_messages(
+    hasher: TypedDataHasher, messages: Sequence[dict], account_addresses: List[int]
+) -> List[int]:
+    # Defined on the module level, so it can be sent to workers of a process pool
+    return [
+        hasher.message_hash(message, account_address)
+        for message, account_address in zip(messages, account_addresses)
+    ]